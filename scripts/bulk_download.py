@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import logging
+import pathlib
+from typing import Any
+
+from logging_config import setup_logging
+
+from yafin import AsyncClient
+from yafin.bulk import BULK_ENDPOINTS, BulkDownloader, create_units
+
+logger = logging.getLogger(__name__)
+
+
+def parse_params(raw_params: list[str]) -> dict[str, Any]:
+    """Parse key=value pairs into kwargs, numbers are converted to int."""
+    params: dict[str, Any] = {}
+
+    for raw_param in raw_params:
+        key, _, value = raw_param.partition('=')
+        params[key] = int(value) if value.isdigit() else value
+
+    return params
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Resumable bulk download of Yahoo Finance data.'
+    )
+    parser.add_argument(
+        'tickers',
+        help='Comma-separated tickers or path to a file with one ticker per line.',
+    )
+    parser.add_argument('--endpoint', choices=sorted(BULK_ENDPOINTS), required=True)
+    parser.add_argument(
+        '--param',
+        action='append',
+        default=[],
+        help='Endpoint keyword argument as key=value, e.g.: interval=1d.',
+    )
+    parser.add_argument('--output-dir', default='bulk_output')
+    parser.add_argument('--checkpoint', default=None)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--progress-every', type=int, default=100)
+    return parser.parse_args()
+
+
+def read_tickers(tickers: str) -> list[str]:
+    """Read tickers from the file or comma-separated string."""
+    path = pathlib.Path(tickers)
+
+    if path.is_file():
+        return [t.strip() for t in path.read_text().splitlines() if t.strip()]
+
+    return [t.strip() for t in tickers.split(',') if t.strip()]
+
+
+async def main() -> None:  # noqa: D103
+    setup_logging()
+    args = parse_args()
+
+    units = create_units(
+        read_tickers(args.tickers), args.endpoint, parse_params(args.param)
+    )
+
+    async with AsyncClient() as client:
+        downloader = BulkDownloader(
+            client,
+            output_dir=args.output_dir,
+            checkpoint_path=args.checkpoint,
+            concurrency=args.concurrency,
+            progress_every=args.progress_every,
+        )
+        progress = await downloader.run(units)
+
+    if progress.failed:
+        logger.warning(
+            f'{progress.failed} units failed, rerun the same command to retry them.'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+import argparse
+import json
+import pathlib
+import sys
+from typing import Any
+
+# metric name: whether higher value is better
+METRICS = {
+    'requests_per_s': True,
+    'p50_ms': False,
+    'p95_ms': False,
+    'p99_ms': False,
+    'cpu_per_request_ms': False,
+    'peak_memory_kib': False,
+    'ns_per_op': False,
+    'peak_bytes_per_op': False,
+}
+
+
+def load_results(path: str) -> dict[str, dict[str, Any]]:
+    """Load benchmark results stored by tests/performance suite."""
+    return json.loads(pathlib.Path(path).read_text())['results']
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Print relative change of each metric and return list of regressions."""
+    regressions = []
+
+    for name in sorted(baseline.keys() & current.keys()):
+        print(name)
+
+        for metric, higher_is_better in METRICS.items():
+            if metric not in baseline[name] or metric not in current[name]:
+                continue
+
+            old, new = baseline[name][metric], current[name][metric]
+            change = (new - old) / old if old else 0.0
+            regressed = -change > threshold if higher_is_better else change > threshold
+            flag = ' REGRESSION' if regressed else ''
+            print(f'  {metric:<20} {old:>12.3f} -> {new:>12.3f} ({change:+.1%}){flag}')
+
+            if regressed:
+                regressions.append(f'{name}.{metric}')
+
+    return regressions
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(
+        description='Compare two benchmark result files, e.g. from two commits.'
+    )
+    parser.add_argument('baseline', help='Baseline results JSON.')
+    parser.add_argument('current', help='Current results JSON.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Relative change considered as regression, default 0.1 (10%%).',
+    )
+    args = parser.parse_args()
+
+    regressions = compare(
+        load_results(args.baseline), load_results(args.current), args.threshold
+    )
+
+    if regressions:
+        print(f'{len(regressions)} regression(s): {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
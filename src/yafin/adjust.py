@@ -0,0 +1,179 @@
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .utils import error, process_chart_to_arrays
+
+logger = logging.getLogger(__name__)
+
+ADJUSTMENT_METHODS = {'back', 'forward'}
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+
+def _reverse_cumprod(factors: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Cumulative product of factors of all events strictly after each bar.
+
+    Args:
+        factors: per bar event factor, event on bar i applies to bars before i.
+
+    Returns: array, where i-th item is product of factors[i + 1:].
+    """
+    cumulative = np.ones_like(factors)
+
+    if len(factors) > 1:
+        cumulative[:-1] = np.cumprod(factors[:0:-1])[::-1]
+
+    return cumulative
+
+
+def get_split_factors(
+    splits: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Get cumulative back-adjustment split factors for prices.
+
+    Args:
+        splits: split ratio aligned onto bars, 0 where no split.
+
+    Returns: factor to multiply prices with, volume is divided by it.
+    """
+    factors = np.ones_like(splits, dtype=np.float64)
+    has_split = splits > 0
+    factors[has_split] = 1.0 / splits[has_split]
+    return _reverse_cumprod(factors)
+
+
+def get_dividend_factors(
+    dividends: npt.NDArray[np.float64], close: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Get cumulative back-adjustment dividend factors for prices.
+
+    Dividend on ex-date bar i adjusts all previous bars by 1 - dividend / close[i-1],
+    the same way Yahoo computes adjclose. Missing close (NaN) before the ex-date is
+    replaced by the last valid close, dividend without any previous close is
+    skipped with a warning.
+
+    Args:
+        dividends: dividend amount aligned onto bars, 0 where no dividend.
+        close: close prices.
+
+    Returns: factor to multiply prices with.
+    """
+    factors = np.ones_like(dividends, dtype=np.float64)
+
+    # index of the last valid close before each bar, -1 if none
+    last_valid = np.where(np.isfinite(close) & (close > 0), np.arange(len(close)), -1)
+    prev_index = np.full(len(close), -1)
+    prev_index[1:] = np.maximum.accumulate(last_valid)[:-1]
+
+    has_dividend = dividends > 0
+    valid = has_dividend & (prev_index >= 0)
+
+    if np.any(has_dividend & ~valid):
+        logger.warning(
+            f'Skipping {np.sum(has_dividend & ~valid)} dividend(s) without previous '
+            'valid close.'
+        )
+
+    factors[valid] = 1.0 - dividends[valid] / close[prev_index[valid]]
+    return _reverse_cumprod(factors)
+
+
+def adjust_arrays(
+    arrays: dict[str, npt.NDArray[Any]],
+    method: str = 'back',
+    adjust_splits: bool = False,
+    adjust_dividends: bool = True,
+) -> dict[str, npt.NDArray[Any]]:
+    """Adjust OHLC prices and volume for splits and dividends.
+
+    Yahoo chart quote prices and volume are already split adjusted, so splits are
+    not adjusted by default. Use adjust_splits=True only for raw (unadjusted)
+    data, otherwise the split is applied twice.
+
+    Args:
+        arrays: chart columns, e.g. output of utils.process_chart_to_arrays.
+        method:
+            back - latest bar is unchanged and history is adjusted,
+            forward - first bar is unchanged and later bars are adjusted.
+        adjust_splits: whether to adjust for splits, only for unadjusted data.
+        adjust_dividends: whether to adjust for dividends.
+
+    Returns: copy of the arrays with adjusted open, high, low, close and volume.
+    """
+    if method not in ADJUSTMENT_METHODS:
+        error(
+            msg=f'Invalid {method=}. Valid values: {ADJUSTMENT_METHODS}',
+            err_cls=ValueError,
+        )
+
+    n = len(arrays['timestamp'])
+    close = arrays['close'].astype(np.float64, copy=False)
+    split_factors = get_split_factors(arrays['splits']) if adjust_splits else np.ones(n)
+    price_factors = split_factors * (
+        get_dividend_factors(arrays['dividends'], close)
+        if adjust_dividends
+        else np.ones(n)
+    )
+
+    if method == 'forward' and n:
+        price_factors = price_factors / price_factors[0]
+        split_factors = split_factors / split_factors[0]
+
+    prices = np.vstack([arrays[c] for c in PRICE_COLUMNS]).astype(np.float64)
+    prices *= price_factors
+
+    adjusted = dict(arrays)
+    adjusted.update(zip(PRICE_COLUMNS, prices))
+    adjusted['volume'] = arrays['volume'] / split_factors
+    return adjusted
+
+
+def adjust_chart(
+    chart: dict[str, Any],
+    method: str = 'back',
+    adjust_splits: bool = False,
+    adjust_dividends: bool = True,
+) -> dict[str, npt.NDArray[Any]]:
+    """Process chart result into numpy columns with adjusted OHLCV.
+
+    Args:
+        chart: chart result, e.g.: AsyncSymbol.get_chart().
+        method: back or forward adjustment.
+        adjust_splits: whether to adjust for splits, False for Yahoo chart data,
+            which is already split adjusted.
+        adjust_dividends: whether to adjust for dividends.
+
+    Returns: dict of numpy arrays with adjusted open, high, low, close and volume.
+    """
+    return adjust_arrays(
+        process_chart_to_arrays(chart), method, adjust_splits, adjust_dividends
+    )
+
+
+def adjust_charts(
+    charts: Iterable[dict[str, Any]],
+    method: str = 'back',
+    adjust_splits: bool = False,
+    adjust_dividends: bool = True,
+) -> dict[str, dict[str, npt.NDArray[Any]]]:
+    """Adjust multiple chart results at once.
+
+    Args:
+        charts: chart results.
+        method: back or forward adjustment.
+        adjust_splits: whether to adjust for splits, False for Yahoo chart data,
+            which is already split adjusted.
+        adjust_dividends: whether to adjust for dividends.
+
+    Returns: adjusted numpy columns for each chart, keyed by the chart symbol.
+    """
+    return {
+        chart['meta']['symbol']: adjust_chart(
+            chart, method, adjust_splits, adjust_dividends
+        )
+        for chart in charts
+    }
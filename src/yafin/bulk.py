@@ -0,0 +1,295 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from time import perf_counter
+from typing import Any
+
+from .client import AsyncClient
+from .utils import error
+
+logger = logging.getLogger(__name__)
+
+BULK_ENDPOINTS = {
+    'get_chart',
+    'get_timeseries',
+    'get_quote_summary',
+    'get_options',
+    'get_recommendations',
+    'get_insights',
+}
+
+DONE = 'done'
+FAILED = 'failed'
+
+
+@dataclass(frozen=True)
+class BulkUnit:
+    """Single unit of work of the bulk download - one request for one ticker."""
+
+    ticker: str
+    endpoint: str
+    params: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def create(
+        cls, ticker: str, endpoint: str, params: dict[str, Any] | None = None
+    ) -> 'BulkUnit':
+        """Create unit with params sorted by name.
+
+        Args:
+            ticker: Ticker symbol.
+            endpoint: AsyncClient method name, e.g.: get_chart.
+            params: Keyword arguments for the AsyncClient method (without ticker).
+
+        Returns: Bulk unit.
+        """
+        if endpoint not in BULK_ENDPOINTS:
+            error(
+                msg=f'Invalid {endpoint=}. Valid values: {BULK_ENDPOINTS}',
+                err_cls=ValueError,
+            )
+
+        return cls(ticker, endpoint, tuple(sorted((params or {}).items())))
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the unit used in the checkpoint file."""
+        params = '&'.join(f'{k}={v}' for k, v in self.params)
+        return f'{self.endpoint}|{self.ticker}|{params}'
+
+    @property
+    def file_name(self) -> str:
+        """Output file name, unique per unit."""
+        digest = hashlib.sha1(self.key.encode()).hexdigest()[:12]
+        return f'{self.ticker}_{digest}.json'
+
+
+@dataclass
+class BulkProgress:
+    """Progress of the bulk download with throughput and ETA."""
+
+    total: int
+    skipped: int = 0
+    done: int = 0
+    failed: int = 0
+    started: float = field(default_factory=perf_counter)
+
+    @property
+    def finished(self) -> int:
+        """Number of units processed in this run."""
+        return self.done + self.failed
+
+    @property
+    def remaining(self) -> int:
+        """Number of units still to be processed in this run."""
+        return self.total - self.skipped - self.finished
+
+    @property
+    def elapsed(self) -> float:
+        """Elapsed seconds since the start of the run."""
+        return perf_counter() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Processed units per second."""
+        elapsed = self.elapsed
+        return self.finished / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated seconds until the run is finished, None if unknown."""
+        throughput = self.throughput
+        return self.remaining / throughput if throughput > 0 else None
+
+    def __str__(self) -> str:
+        """Human readable progress for logging."""
+        eta = timedelta(seconds=round(self.eta)) if self.eta is not None else '?'
+        return (
+            f'{self.skipped + self.finished}/{self.total} units '
+            f'(done={self.done}, failed={self.failed}, skipped={self.skipped}), '
+            f'{self.throughput:.2f} units/s, eta={eta}'
+        )
+
+
+class Checkpoint(object):
+    """Append-only checkpoint file tracking status of the bulk units.
+
+    Each line is a JSON object with unit key and its status. The last record of
+    the unit wins, so failed units can be retried and marked done later.
+    Marking is thread safe, so it can be run off the event loop.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = pathlib.Path(path)
+        self._statuses: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+
+        with self.path.open() as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # last line may be truncated, if the process was killed
+                    logger.warning(f'Skipping corrupted checkpoint line {line!r}.')
+                    continue
+
+                self._statuses[record['key']] = record['status']
+
+    def is_done(self, unit: BulkUnit) -> bool:
+        """Whether the unit was already downloaded successfully."""
+        return self._statuses.get(unit.key) == DONE
+
+    @property
+    def failed(self) -> set[str]:
+        """Keys of the units, which failed in their last attempt."""
+        return {k for k, v in self._statuses.items() if v == FAILED}
+
+    def mark(self, unit: BulkUnit, status: str, err: str | None = None) -> None:
+        """Append status of the unit to the checkpoint file.
+
+        Args:
+            unit: Bulk unit.
+            status: done or failed.
+            err: Error message for failed units.
+        """
+        record = {'key': unit.key, 'status': status}
+
+        if err:
+            record['error'] = err
+
+        with self._lock:
+            self._statuses[unit.key] = status
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            with self.path.open('a') as f:
+                f.write(json.dumps(record) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class BulkDownloader(object):
+    """Resumable bulk downloader, writing each unit into its own JSON file.
+
+    Output is stored as output_dir/endpoint/ticker_hash.json and every processed
+    unit is recorded in the checkpoint, so rerun skips units already done.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        output_dir: str | os.PathLike[str],
+        checkpoint_path: str | os.PathLike[str] | None = None,
+        concurrency: int = 8,
+        on_progress: Callable[[BulkProgress], None] | None = None,
+        progress_every: int = 100,
+    ) -> None:
+        if concurrency < 1:
+            error(msg=f'Invalid {concurrency=}. Must be >= 1.', err_cls=ValueError)
+
+        if progress_every < 1:
+            error(msg=f'Invalid {progress_every=}. Must be >= 1.', err_cls=ValueError)
+
+        self.client = client
+        self.output_dir = pathlib.Path(output_dir)
+        self.checkpoint = Checkpoint(
+            checkpoint_path or self.output_dir.joinpath('checkpoint.jsonl')
+        )
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.progress_every = progress_every
+
+    def get_output_path(self, unit: BulkUnit) -> pathlib.Path:
+        """Get path of the output file for the unit."""
+        return self.output_dir.joinpath(unit.endpoint).joinpath(unit.file_name)
+
+    def _write_output(self, unit: BulkUnit, data: dict[str, Any]) -> None:
+        path = self.get_output_path(unit)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write to temp file and rename, so half written outputs never exist
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(path)
+
+    async def _process_unit(self, unit: BulkUnit, progress: BulkProgress) -> None:
+        method = getattr(self.client, unit.endpoint)
+
+        # file writes and fsync run in threads, not to block in-flight requests
+        try:
+            data = await method(unit.ticker, **dict(unit.params))
+            await asyncio.to_thread(self._write_output, unit, data)
+
+        except Exception as e:
+            logger.warning(f'Unit {unit.key} failed: {e!r}')
+            await asyncio.to_thread(self.checkpoint.mark, unit, FAILED, repr(e))
+            progress.failed += 1
+
+        else:
+            await asyncio.to_thread(self.checkpoint.mark, unit, DONE)
+            progress.done += 1
+
+        if progress.finished % self.progress_every == 0 or not progress.remaining:
+            self._report(progress)
+
+    def _report(self, progress: BulkProgress) -> None:
+        logger.info(f'Bulk download progress: {progress}')
+
+        if self.on_progress:
+            self.on_progress(progress)
+
+    async def run(self, units: Iterable[BulkUnit]) -> BulkProgress:
+        """Download all units, which are not yet done according to checkpoint.
+
+        Args:
+            units: Bulk units to download.
+
+        Returns: Final progress of the run.
+        """
+        units = list(dict.fromkeys(units))  # deduplicate, keep order
+        pending = [u for u in units if not self.checkpoint.is_done(u)]
+        progress = BulkProgress(total=len(units), skipped=len(units) - len(pending))
+        logger.info(
+            f'Bulk download started with {len(pending)} pending units, '
+            f'{progress.skipped} already done.'
+        )
+
+        queue: asyncio.Queue[BulkUnit] = asyncio.Queue()
+
+        for unit in pending:
+            queue.put_nowait(unit)
+
+        async def worker() -> None:
+            while not queue.empty():
+                unit = queue.get_nowait()
+                await self._process_unit(unit, progress)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+        logger.info(f'Bulk download finished: {progress}')
+        return progress
+
+
+def create_units(
+    tickers: Iterable[str], endpoint: str, params: dict[str, Any] | None = None
+) -> list[BulkUnit]:
+    """Create bulk units for the same endpoint and params for all the tickers.
+
+    Args:
+        tickers: Ticker symbols.
+        endpoint: AsyncClient method name, e.g.: get_chart.
+        params: Keyword arguments for the AsyncClient method (without ticker).
+
+    Returns: List of bulk units.
+    """
+    return [BulkUnit.create(ticker, endpoint, params) for ticker in tickers]
@@ -1,19 +1,70 @@
+import asyncio
+import codecs
 import logging
-from datetime import datetime
+import warnings
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Iterator
+from contextlib import aclosing, contextmanager
+from datetime import datetime, timedelta
+from time import perf_counter
 from types import TracebackType
 from typing import Any, Type
 
 from curl_cffi.requests import AsyncSession, Response
 from curl_cffi.requests.exceptions import HTTPError
 
-from .const import ALL_MODULES, ALL_TYPES, EVENTS, INTERVALS, RANGES
-from .utils import encode_url, error, log_args
+from .const import INTERVALS, RANGES
+from .credentials import CredentialStore
+from .exceptions import TickerNotFoundError
+from .jsonstream import JsonItemsParser
+from .live import QuotePoller, QuoteSubscription
+from .metrics import MetricsCollector, get_endpoint
+from .negative_cache import NegativeCache
+from .profiler import RequestProfiler
+from .tracing import set_attributes, start_span, traced
+from .transport import ConnectionStats, CurlCffiTransport, PoolConfig, Transport
+from .utils import (
+    canonicalize_params,
+    encode_url,
+    error,
+    get_request_key,
+    log_args,
+)
+from .validation import validate_events, validate_modules, validate_types
 
 logger = logging.getLogger(__name__)
 
+# json paths of the streamed items: item type
+OPTIONS_STREAM_PATHS = {
+    f'optionChain.result.item.options.item.{typ}.item': typ for typ in ('calls', 'puts')
+}
+INSIGHTS_STREAM_PATHS = {
+    f'finance.result.{section}.item': section
+    for section in ('reports', 'sigDevs', 'secReports', 'events')
+}
+
 
 class AsyncClient(object):
-    """Client for Yahoo Finance API."""
+    """Client for Yahoo Finance API.
+
+    Args:
+        base_url: Override of the Yahoo Finance API url, e.g. local fake server.
+        session: Shared curl_cffi session, not closed by the client.
+        transport: Http engine, e.g. HttpxTransport or RecordingTransport,
+            not closed by the client. Default is CurlCffiTransport.
+        pool: Connection pool settings (pool size, per host limit, HTTP/2
+            multiplexing, keep-alive) of the default transport or the session.
+        coalesce: Whether concurrent identical requests share one http request.
+        credential_store: Store of the cookies and crumb reused across process
+            restarts, refreshed on HTTP 401. Requires transport with get_cookies
+            and set_cookies methods, e.g. CurlCffiTransport.
+        metrics: Collector of per endpoint request counts, status codes, timings,
+            response sizes, decode times and retries.
+        profiler: Record of the slowest and largest requests, e.g. for finding
+            pathological tickers without debug logging.
+        negative_cache: Cache of tickers not found (HTTP 404) per endpoint, their
+            requests are skipped within its ttl. Not found tickers raise
+            TickerNotFoundError with or without the cache.
+    """
 
     _BASE_URL = r'https://query2.finance.yahoo.com'
     _DEFAULT_PARAMS = {
@@ -23,33 +74,160 @@ class AsyncClient(object):
         'corsDomain': 'finance.yahoo.com',
     }
 
-    def __init__(self) -> None:
-        self._open_session: AsyncSession[Any] | None = None
+    def __init__(
+        self,
+        base_url: str | None = None,
+        session: AsyncSession[Any] | None = None,
+        transport: Transport | None = None,
+        pool: PoolConfig | None = None,
+        coalesce: bool = True,
+        credential_store: CredentialStore | None = None,
+        metrics: MetricsCollector | None = None,
+        profiler: RequestProfiler | None = None,
+        negative_cache: NegativeCache | None = None,
+    ) -> None:
+        if session is not None and transport is not None:
+            error(
+                msg='Only one of session and transport can be provided.',
+                err_cls=ValueError,
+            )
+
+        if pool is not None and transport is not None:
+            error(
+                msg='Pool settings cannot be applied to the provided transport.',
+                err_cls=ValueError,
+            )
+
+        if session is not None and not isinstance(session, AsyncSession):
+            warnings.warn(
+                'Passing transport (e.g. ReplayTransport) as session is deprecated, '
+                'use transport argument.',
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            transport, session = session, None
+
+        if session is not None:
+            transport = CurlCffiTransport(session, pool=pool)
+
+        self._pool = pool
+        self._open_transport = transport
+        self._owns_transport = transport is None
         self._used_crumb: str | None = None
+        self._coalesce = coalesce
+        self._in_flight: dict[str, asyncio.Task[Response]] = {}
+        self.coalesced_requests = 0
+        self._credential_store = credential_store
+        self.metrics = metrics
+        self.profiler = profiler
+        self.negative_cache = negative_cache
+        self._quote_poller: QuotePoller | None = None
+
+        if base_url:
+            self._BASE_URL = base_url.rstrip('/')
+
+    @property
+    def transport(self) -> Transport:
+        """Transport attribute for http requests."""
+        return self._get_transport()
+
+    @property
+    def session(self) -> Any:
+        """Deprecated, use transport. Session of the transport, else the transport."""
+        warnings.warn(
+            'AsyncClient.session is deprecated, use AsyncClient.transport.',
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        transport = self._get_transport()
+        return getattr(transport, 'session', transport)
+
+    def _get_transport(self) -> Transport:
+        """Create default transport if not exists."""
+        if self._open_transport is None:
+            self._open_transport = CurlCffiTransport(pool=self._pool)
+
+        return self._open_transport
 
     @property
-    def session(self) -> AsyncSession[Any]:
-        """Session attribute for http requests."""
-        return self._get_session()
+    def connection_stats(self) -> ConnectionStats | None:
+        """Connection reuse statistics, None if not tracked by the transport."""
+        return getattr(self._open_transport, 'stats', None)
 
-    def _get_session(self) -> AsyncSession[Any]:
-        """Create session if not exists."""
-        if self._open_session is None:
-            self._open_session = AsyncSession(impersonate='chrome')
+    async def start(self, warm_connections: int = 1, fetch_crumb: bool = True) -> None:
+        """Warm up the client before the first request.
 
-        return self._open_session
+        Fetches the crumb (with the cookie) and opens pooled connections
+        concurrently, so the first requests do not pay DNS, TLS handshake and
+        crumb round trip. Connections are opened only by transports with warm_up
+        method, e.g. CurlCffiTransport.
+
+        Args:
+            warm_connections: number of connections open after the start, incl.
+                the one used for fetching crumb.
+            fetch_crumb: whether to fetch the crumb.
+        """
+        if warm_connections < 0:
+            error(
+                msg=f'Invalid {warm_connections=}. Expected non-negative number.',
+                err_cls=ValueError,
+            )
+
+        transport = self._get_transport()
+        warm_up = getattr(transport, 'warm_up', None)
+        coros = []
+
+        if fetch_crumb:
+            coros.append(self._get_crumb())
+            warm_connections -= 1
+
+        # crumb is fetched only once, other connections are opened by cheap
+        # requests to the base url, getcrumb is the most throttled endpoint
+        if warm_up and warm_connections > 0:
+            coros.append(warm_up(f'{self._BASE_URL}/', warm_connections))
+
+        await asyncio.gather(*coros)
+        logger.debug(f'Client started, connection stats: {self.connection_stats}.')
+
+    @property
+    def quote_poller(self) -> QuotePoller:
+        """Polling loop of live quotes shared by all subscriptions."""
+        if self._quote_poller is None:
+            self._quote_poller = QuotePoller(self)
+
+        return self._quote_poller
+
+    def subscribe_quotes(
+        self, tickers: str, queue_size: int = 100
+    ) -> QuoteSubscription:
+        """Subscribe to live quotes polled by the shared quote_poller.
+
+        Yields changed fields of the quotes, whole quote first. Polling cadence
+        adapts to marketState of the symbols, see QuotePoller.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            queue_size: Max number of undelivered updates, oldest are dropped.
+
+        Returns: subscription, async iterator of QuoteUpdate.
+        """
+        return self.quote_poller.subscribe(tickers, queue_size)
 
     async def close(self) -> None:
-        """Close the session if open and reset crumb."""
-        if self._open_session:
-            await self._open_session.close()
-            self._open_session = None
+        """Stop quote polling, close the transport if owned and reset crumb."""
+        if self._quote_poller:
+            await self._quote_poller.close()
+            self._quote_poller = None
+
+        if self._open_transport and self._owns_transport:
+            await self._open_transport.close()
+            self._open_transport = None
 
         self._used_crumb = None
 
     async def __aenter__(self) -> 'AsyncClient':
-        """When entering context manager, create the session."""
-        self._get_session()
+        """When entering context manager, create the transport."""
+        self._get_transport()
         return self
 
     async def __aexit__(
@@ -58,18 +236,107 @@ class AsyncClient(object):
         exc_val: BaseException | None = None,
         exc_tb: TracebackType | None = None,
     ) -> None:
-        """When closing context manager, close the session."""
+        """When closing context manager, close the transport."""
         await self.close()
 
     @log_args
     async def _get_async_request(
         self, url: str, params: dict[str, Any] | None = None
+    ) -> Response:
+        """Send request, concurrent identical requests share one http request.
+
+        Params are canonicalized, so the same logical request has the same url.
+        Callers get the same response, each decoding its own copy of the json.
+        """
+        params = canonicalize_params(params) if params is not None else None
+
+        # attributes are computed only when tracing, off the default hot path
+        with start_span(
+            'AsyncClient._get_async_request',
+            lambda: {'endpoint': get_endpoint(url), 'url': encode_url(url, params)},
+        ) as span:
+            if self._coalesce:
+                response = await self._get_coalesced_request(url, params, span)
+            else:
+                response = await self._send_request(url, params)
+
+            if span is not None:
+                set_attributes(
+                    span,
+                    status_code=response.status_code,
+                    payload_size=len(response.content),
+                )
+
+        return response
+
+    async def _get_ticker_request(
+        self, ticker: str, url: str, params: dict[str, Any] | None = None
+    ) -> Response:
+        """Send request for the ticker, raising TickerNotFoundError on HTTP 404."""
+        with self._check_not_found(ticker, url):
+            return await self._get_async_request(url, params)
+
+    @contextmanager
+    def _check_not_found(self, ticker: str, url: str) -> Iterator[None]:
+        """Skip tickers in the negative cache, remember tickers not found."""
+        endpoint = get_endpoint(url)
+        cache = self.negative_cache
+
+        if cache is not None and cache.should_skip(endpoint, ticker):
+            logger.debug(f'Skipping not found ticker {ticker} ({endpoint}).')
+            raise TickerNotFoundError(ticker, endpoint, cached=True)
+
+        try:
+            yield
+
+        except HTTPError as e:
+            if getattr(e.response, 'status_code', None) != 404:
+                raise e
+
+            if cache is not None:
+                cache.add(endpoint, ticker)
+
+            raise TickerNotFoundError(ticker, endpoint, response=e.response) from e
+
+    async def _get_coalesced_request(
+        self, url: str, params: dict[str, Any] | None, span: Any
+    ) -> Response:
+        key = get_request_key(url, params)
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(url, params))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._remove_in_flight(key, t))
+
+        else:
+            self.coalesced_requests += 1
+            set_attributes(span, coalesced=True)
+            logger.debug(f'Coalesced with in-flight {encode_url(url, params)}')
+
+        # shield, so cancelling one caller does not cancel the others
+        return await asyncio.shield(task)
+
+    def _remove_in_flight(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    async def _send_request(
+        self, url: str, params: dict[str, Any] | None = None
     ) -> Response:
         logger.debug(encode_url(url, params))
 
         try:
-            response = await self.session.get(url, params=params)
-            response.raise_for_status()
+            response = await self._observed_get(url, params)
+
+            if response.status_code == 401 and self._refresh_credentials(params):
+                if self.metrics:
+                    self.metrics.on_retry(url)
+
+                params = (params or {}) | {'crumb': await self._get_crumb()}
+                response = await self._observed_get(url, params)
+
+            response.raise_for_status()  # type: ignore[no-untyped-call]
 
         except HTTPError as e:
             logger.error(f'HTTP error: {e}')
@@ -77,17 +344,178 @@ class AsyncClient(object):
 
         return response
 
+    async def _observed_get(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> Response:
+        """Send request with the transport, reporting it to metrics and profiler."""
+        if self.metrics is None and self.profiler is None:
+            return await self.transport.get(url, params=params)
+
+        try:
+            response = await self.transport.get(url, params=params)
+
+        except Exception as e:
+            if self.metrics:
+                self.metrics.on_error(url, e)
+
+            raise e
+
+        if self.metrics:
+            self.metrics.on_response(url, response)
+
+        if self.profiler:
+            self.profiler.on_response(url, params, response)
+
+        return response
+
+    def _decode_json(self, response: Response) -> dict[str, Any]:
+        """Decode json of the response, reporting decode time."""
+        if self.metrics is None and self.profiler is None:
+            return response.json()  # type: ignore[no-untyped-call]
+
+        start = perf_counter()
+        result = response.json()  # type: ignore[no-untyped-call]
+        seconds = perf_counter() - start
+
+        if self.metrics:
+            self.metrics.on_decode(response.url, seconds)
+
+        if self.profiler:
+            self.profiler.on_decode(response, seconds)
+
+        return result
+
+    async def _iter_json_items(
+        self, url: str, params: dict[str, Any], paths: Iterable[str]
+    ) -> AsyncGenerator[tuple[str, Any], None]:
+        """Send request, yield values at the paths of the json as the body arrives.
+
+        Transports without stream method, e.g. ReplayTransport, fall back to the
+        buffered request. Streamed requests are not coalesced, nor reported to
+        metrics and profiler.
+        """
+        parser = JsonItemsParser(paths)
+        stream = getattr(self.transport, 'stream', None)
+
+        if stream is None:
+            response = await self._get_async_request(url, params)
+
+            for item in parser.feed(response.text, final=True):
+                yield item
+
+            return
+
+        params = canonicalize_params(params)
+        logger.debug(f'Streaming {encode_url(url, params)}')
+
+        for retry in (True, False):
+            async with stream(url, params) as response:
+                if response.status_code == 401 and retry:
+                    if self._refresh_credentials(params):
+                        params = params | {'crumb': await self._get_crumb()}
+                        continue
+
+                try:
+                    response.raise_for_status()
+
+                except HTTPError as e:
+                    logger.error(f'HTTP error: {e}')
+                    raise e
+
+                decoder = codecs.getincrementaldecoder('utf-8')()
+
+                async for chunk in response.aiter_content():
+                    for item in parser.feed(decoder.decode(chunk)):
+                        yield item
+
+                for item in parser.feed(decoder.decode(b'', final=True), final=True):
+                    yield item
+
+            return
+
+    def _get_credentials_storage(self) -> tuple[CredentialStore, Any] | None:
+        """Credential store and transport with cookie access, None if not used."""
+        transport = self.transport
+
+        if self._credential_store is None or not (
+            hasattr(transport, 'get_cookies') and hasattr(transport, 'set_cookies')
+        ):
+            return None
+
+        return self._credential_store, transport
+
+    def _refresh_credentials(self, params: dict[str, Any] | None) -> bool:
+        """Drop stored credentials rejected with HTTP 401.
+
+        Returns: whether the request should be retried with a fresh crumb.
+        """
+        storage = self._get_credentials_storage()
+
+        if storage is None or not params or 'crumb' not in params:
+            return False
+
+        # concurrent requests rejected with the same crumb refresh it only once
+        if self._used_crumb == params['crumb']:
+            logger.info('Stored credentials rejected, fetching new cookie and crumb.')
+            store, transport = storage
+            store.clear(self._BASE_URL)
+            transport.set_cookies([])
+            self._used_crumb = None
+
+        return True
+
+    @traced
     async def _get_crumb(self) -> str | None:
         logger.debug('Fetching crumb...')
 
-        if not self._used_crumb:
-            url = f'{self._BASE_URL}/v1/test/getcrumb'
-            response = await self._get_async_request(url=url)
-            self._used_crumb = response.text
+        if self._used_crumb:
+            return self._used_crumb
+
+        storage = self._get_credentials_storage()
+        credentials = storage[0].load(self._BASE_URL) if storage else None
+
+        if storage and credentials:
+            logger.debug('Using stored cookie and crumb.')
+            storage[1].set_cookies(credentials.cookies)
+            self._used_crumb = credentials.crumb
+            return self._used_crumb
+
+        url = f'{self._BASE_URL}/v1/test/getcrumb'
+        response = await self._get_async_request(url=url)
+        self._used_crumb = response.text
+
+        if storage:
+            store, transport = storage
+            store.save(self._BASE_URL, self._used_crumb, transport.get_cookies())
 
         return self._used_crumb
 
+    def request_key(self, method_name: str, *args: Any, **kwargs: Any) -> str:
+        """Get stable cache key of the endpoint request without sending it.
+
+        Key is built from the canonical url and params of the request (crumb
+        excluded), same as the key of request coalescing.
+
+        Args:
+            method_name: Endpoint method, e.g. get_chart or stream_options.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns: stable cache key, e.g. for response cache.
+        """
+        build = getattr(self, f'_build_{method_name}', None)
+
+        if build is None:
+            error(
+                msg=f'Invalid {method_name=}. Expected endpoint method name.',
+                err_cls=ValueError,
+            )
+
+        url, params = build(*args, **kwargs)
+        return get_request_key(url, params)
+
     @log_args
+    @traced
     async def get_chart(
         self,
         ticker: str,
@@ -109,6 +537,17 @@ class AsyncClient(object):
             f'Getting finance/chart for ticker {ticker}, {period_range=}, {interval=}, {events=}.'  # noqa E501
         )
 
+        url, params = self._build_get_chart(ticker, period_range, interval, events)
+        response = await self._get_ticker_request(ticker, url, params)
+        return self._decode_json(response)
+
+    def _build_get_chart(
+        self,
+        ticker: str,
+        period_range: str,
+        interval: str,
+        events: str | None = 'div,split',
+    ) -> tuple[str, dict[str, Any]]:
         if period_range not in RANGES:
             error(
                 msg=f'Invalid {period_range=}. Valid values: {RANGES}',
@@ -121,28 +560,18 @@ class AsyncClient(object):
                 err_cls=ValueError,
             )
 
-        if events:
-            parsed_events = {e.strip() for e in events.split(',')}
-
-            if not parsed_events <= EVENTS:
-                error(
-                    msg=(
-                        f'Invalid events={parsed_events - EVENTS}. '
-                        f'Valid values: {EVENTS}'
-                    ),
-                    err_cls=ValueError,
-                )
+        parsed_events = validate_events(events)
 
         url = f'{self._BASE_URL}/v8/finance/chart/{ticker}'
         params = self._DEFAULT_PARAMS | {'range': period_range, 'interval': interval}
 
         if parsed_events:
-            params['events'] = ','.join(parsed_events)
+            params['events'] = parsed_events
 
-        response = await self._get_async_request(url, params)
-        return response.json()
+        return url, params
 
     @log_args
+    @traced
     async def get_quote(self, tickers: str) -> dict[str, Any]:
         """Get quote for the ticker(s).
 
@@ -153,15 +582,17 @@ class AsyncClient(object):
         """
         logger.debug(f'Getting finance/quote for ticker {tickers}.')
 
-        url = f'{self._BASE_URL}/v7/finance/quote'
-        params = self._DEFAULT_PARAMS | {
-            'symbols': tickers,
-            'crumb': await self._get_crumb(),
-        }
+        url, params = self._build_get_quote(tickers)
+        params['crumb'] = await self._get_crumb()
         response = await self._get_async_request(url, params)
-        return response.json()
+        return self._decode_json(response)
+
+    def _build_get_quote(self, tickers: str) -> tuple[str, dict[str, Any]]:
+        url = f'{self._BASE_URL}/v7/finance/quote'
+        return url, self._DEFAULT_PARAMS | {'symbols': tickers}
 
     @log_args
+    @traced
     async def get_quote_summary(self, ticker: str, modules: str) -> dict[str, Any]:
         """Get quote summary for the ticker.
 
@@ -173,26 +604,19 @@ class AsyncClient(object):
         """
         logger.debug(f'Getting finance/quoteSummary for ticker {ticker}.')
 
-        parsed_modules = {m.strip() for m in modules.split(',')}
-
-        if not parsed_modules <= ALL_MODULES:
-            error(
-                msg=(
-                    f'Invalid modules={parsed_modules - ALL_MODULES}. '
-                    f'Valid values: {ALL_MODULES}'
-                ),
-                err_cls=ValueError,
-            )
+        url, params = self._build_get_quote_summary(ticker, modules)
+        params['crumb'] = await self._get_crumb()
+        response = await self._get_ticker_request(ticker, url, params)
+        return self._decode_json(response)
 
+    def _build_get_quote_summary(
+        self, ticker: str, modules: str
+    ) -> tuple[str, dict[str, Any]]:
         url = f'{self._BASE_URL}/v10/finance/quoteSummary/{ticker}'
-        params = self._DEFAULT_PARAMS | {
-            'modules': ','.join(parsed_modules),
-            'crumb': await self._get_crumb(),
-        }
-        response = await self._get_async_request(url, params)
-        return response.json()
+        return url, self._DEFAULT_PARAMS | {'modules': validate_modules(modules)}
 
     @log_args
+    @traced
     async def get_timeseries(
         self,
         ticker: str,
@@ -206,7 +630,7 @@ class AsyncClient(object):
             ticker: Ticker symbol.
             types: Timeseries types (incl. frequency) to include.
             period1: Start timestamp (optional).
-            period2: End timestamp (optional).
+            period2: End timestamp (optional), default is the end of today.
 
         Returns: Timeseries data as a dictionary.
         """
@@ -214,34 +638,37 @@ class AsyncClient(object):
             f'Getting finance/timeseries for ticker {ticker}, {types=}, {period1=}, {period2=}.'  # noqa E501
         )
 
-        parsed_types = {t.strip() for t in types.split(',')}
+        url, params = self._build_get_timeseries(ticker, types, period1, period2)
+        response = await self._get_ticker_request(ticker, url, params)
+        return self._decode_json(response)
 
-        if not parsed_types <= ALL_TYPES:
-            error(
-                msg=(
-                    f'Invalid types={parsed_types - ALL_TYPES}. '
-                    f'Valid values: {ALL_TYPES}'
-                ),
-                err_cls=ValueError,
-            )
+    def _build_get_timeseries(
+        self,
+        ticker: str,
+        types: str,
+        period1: int | float | None = None,
+        period2: int | float | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        parsed_types = validate_types(types)
 
         if not period1:
             period1 = datetime(2020, 1, 1).timestamp()
 
         if not period2:
-            period2 = datetime.now().timestamp()
+            # end of today, so the default url and request key change once a day
+            tomorrow = datetime.now().date() + timedelta(days=1)
+            period2 = datetime.combine(tomorrow, datetime.min.time()).timestamp()
 
         url = f'{self._BASE_URL}/ws/fundamentals-timeseries/v1/finance/timeseries/{ticker}'  # noqa E501
         params = self._DEFAULT_PARAMS | {
-            'type': ','.join(parsed_types),
+            'type': parsed_types,
             'period1': int(period1),
             'period2': int(period2),
         }
-
-        response = await self._get_async_request(url, params)
-        return response.json()
+        return url, params
 
     @log_args
+    @traced
     async def get_options(self, ticker: str) -> dict[str, Any]:
         """Get options for the ticker.
 
@@ -252,12 +679,47 @@ class AsyncClient(object):
         """
         logger.debug(f'Getting finance/options for ticker {ticker}.')
 
+        url, params = self._build_get_options(ticker)
+        params['crumb'] = await self._get_crumb()
+        response = await self._get_ticker_request(ticker, url, params)
+        return self._decode_json(response)
+
+    def _build_get_options(self, ticker: str) -> tuple[str, dict[str, Any]]:
         url = f'{self._BASE_URL}/v7/finance/options/{ticker}'
-        params = self._DEFAULT_PARAMS | {'crumb': await self._get_crumb()}
-        response = await self._get_async_request(url, params)
-        return response.json()
+        return url, dict(self._DEFAULT_PARAMS)
 
     @log_args
+    @traced
+    async def stream_options(self, ticker: str) -> AsyncIterator[tuple[str, Any]]:
+        """Stream option contracts of the ticker as the response arrives.
+
+        Contracts are parsed incrementally, so the first ones are available before
+        the whole chain is received and the chain is never held in memory.
+
+        Args:
+            ticker: Ticker symbol.
+
+        Yields: (option type, contract), option type is calls or puts.
+
+        Response is closed when the generator is exhausted or closed, wrap it in
+        contextlib.aclosing to close it when breaking out of the loop early.
+        """
+        logger.debug(f'Streaming finance/options for ticker {ticker}.')
+
+        url, params = self._build_stream_options(ticker)
+        params['crumb'] = await self._get_crumb()
+
+        with self._check_not_found(ticker, url):
+            async with aclosing(
+                self._iter_json_items(url, params, OPTIONS_STREAM_PATHS)
+            ) as items:
+                async for path, contract in items:
+                    yield OPTIONS_STREAM_PATHS[path], contract
+
+    _build_stream_options = _build_get_options
+
+    @log_args
+    @traced
     async def get_search(self, tickers: str) -> dict[str, Any]:
         """Get search results for the ticker.
 
@@ -268,12 +730,16 @@ class AsyncClient(object):
         """
         logger.debug(f'Getting finance/search for ticker {tickers}.')
 
-        url = f'{self._BASE_URL}/v1/finance/search'
-        params = self._DEFAULT_PARAMS | {'q': tickers}
+        url, params = self._build_get_search(tickers)
         response = await self._get_async_request(url, params)
-        return response.json()
+        return self._decode_json(response)
+
+    def _build_get_search(self, tickers: str) -> tuple[str, dict[str, Any]]:
+        url = f'{self._BASE_URL}/v1/finance/search'
+        return url, self._DEFAULT_PARAMS | {'q': tickers}
 
     @log_args
+    @traced
     async def get_recommendations(self, ticker: str) -> dict[str, Any]:
         """Get analyst recommendations for the ticker.
 
@@ -284,12 +750,16 @@ class AsyncClient(object):
         """
         logger.debug(f'Getting finance/recommendations for ticker {ticker}.')
 
+        url, params = self._build_get_recommendations(ticker)
+        response = await self._get_ticker_request(ticker, url, params)
+        return self._decode_json(response)
+
+    def _build_get_recommendations(self, ticker: str) -> tuple[str, dict[str, Any]]:
         url = f'{self._BASE_URL}/v6/finance/recommendationsbysymbol/{ticker}'
-        params = self._DEFAULT_PARAMS
-        response = await self._get_async_request(url, params)
-        return response.json()
+        return url, dict(self._DEFAULT_PARAMS)
 
     @log_args
+    @traced
     async def get_insights(self, ticker: str) -> dict[str, Any]:
         """Get insights for the ticker.
 
@@ -300,12 +770,43 @@ class AsyncClient(object):
         """
         logger.debug(f'Getting finance/insights for ticker {ticker}.')
 
+        url, params = self._build_get_insights(ticker)
+        response = await self._get_ticker_request(ticker, url, params)
+        return self._decode_json(response)
+
+    def _build_get_insights(self, ticker: str) -> tuple[str, dict[str, Any]]:
         url = f'{self._BASE_URL}/ws/insights/v2/finance/insights'
-        params = self._DEFAULT_PARAMS | {'symbol': ticker}
-        response = await self._get_async_request(url, params)
-        return response.json()
+        return url, self._DEFAULT_PARAMS | {'symbol': ticker}
+
+    @log_args
+    @traced
+    async def stream_insights(self, ticker: str) -> AsyncIterator[tuple[str, Any]]:
+        """Stream insights of the ticker as the response arrives.
+
+        Args:
+            ticker: Ticker symbol.
+
+        Yields: (section, item), section is reports, sigDevs, secReports or
+            events.
+
+        Response is closed when the generator is exhausted or closed, wrap it in
+        contextlib.aclosing to close it when breaking out of the loop early.
+        """
+        logger.debug(f'Streaming finance/insights for ticker {ticker}.')
+
+        url, params = self._build_stream_insights(ticker)
+
+        with self._check_not_found(ticker, url):
+            async with aclosing(
+                self._iter_json_items(url, params, INSIGHTS_STREAM_PATHS)
+            ) as items:
+                async for path, item in items:
+                    yield INSIGHTS_STREAM_PATHS[path], item
+
+    _build_stream_insights = _build_get_insights
 
     @log_args
+    @traced
     async def get_market_summaries(self) -> dict[str, Any]:
         """Get market summaries.
 
@@ -313,12 +814,16 @@ class AsyncClient(object):
         """
         logger.debug('Getting finance/quote/marketSummary.')
 
-        url = f'{self._BASE_URL}/v6/finance/quote/marketSummary'
-        params = self._DEFAULT_PARAMS
+        url, params = self._build_get_market_summaries()
         response = await self._get_async_request(url, params)
-        return response.json()
+        return self._decode_json(response)
+
+    def _build_get_market_summaries(self) -> tuple[str, dict[str, Any]]:
+        url = f'{self._BASE_URL}/v6/finance/quote/marketSummary'
+        return url, dict(self._DEFAULT_PARAMS)
 
     @log_args
+    @traced
     async def get_trending(self) -> dict[str, Any]:
         """Get trending tickers.
 
@@ -326,12 +831,16 @@ class AsyncClient(object):
         """
         logger.debug('Getting finance/trending.')
 
-        url = f'{self._BASE_URL}/v1/finance/trending/US'
-        params = self._DEFAULT_PARAMS
+        url, params = self._build_get_trending()
         response = await self._get_async_request(url, params)
-        return response.json()
+        return self._decode_json(response)
+
+    def _build_get_trending(self) -> tuple[str, dict[str, Any]]:
+        url = f'{self._BASE_URL}/v1/finance/trending/US'
+        return url, dict(self._DEFAULT_PARAMS)
 
     @log_args
+    @traced
     async def get_currencies(self) -> dict[str, Any]:
         """Get currency exchange rates.
 
@@ -339,7 +848,10 @@ class AsyncClient(object):
         """
         logger.debug('Getting finance/currencies.')
 
-        url = f'{self._BASE_URL}/v1/finance/currencies'
-        params = self._DEFAULT_PARAMS
+        url, params = self._build_get_currencies()
         response = await self._get_async_request(url, params)
-        return response.json()
+        return self._decode_json(response)
+
+    def _build_get_currencies(self) -> tuple[str, dict[str, Any]]:
+        url = f'{self._BASE_URL}/v1/finance/currencies'
+        return url, dict(self._DEFAULT_PARAMS)
@@ -61,7 +61,7 @@ ALL_MODULES = {
     # 'fundPerformance'
 }
 
-ALL_MODULES_CSV = ','.join(ALL_MODULES)
+ALL_MODULES_CSV = ','.join(sorted(ALL_MODULES))
 
 FREQUENCIES = {'annual', 'quarterly', 'trailing'}
 
@@ -461,3 +461,10 @@ _ALL_CASH_FLOW_TYPES = {
 ALL_TYPES = (
     _ALL_INCOME_STATEMENT_TYPES | _ALL_BALANCE_SHEET_TYPES | _ALL_CASH_FLOW_TYPES
 )
+
+# comma-separated types enriched with frequency, trailing balance sheet not allowed
+TYPES_WITH_FREQUENCY = {
+    (freq, typ): ','.join(f'{freq}{t}' for t in types)
+    for freq, (typ, types) in product(FREQUENCIES, TYPES.items())
+    if not (typ == 'balance_sheet' and freq == 'trailing')
+}
@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import pathlib
+from dataclasses import asdict, dataclass, field
+from time import time
+from typing import Any
+
+from .utils import error
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600
+
+
+@dataclass
+class Credentials:
+    """Session cookies with the matching crumb.
+
+    Attributes:
+        crumb: crumb issued for the cookies.
+        cookies: cookies as dicts with name, value, domain, path, secure and
+            expires keys.
+        expires: unix timestamp, after which the credentials are not used.
+    """
+
+    crumb: str
+    cookies: list[dict[str, Any]] = field(default_factory=list)
+    expires: float = 0.0
+
+    @property
+    def expired(self) -> bool:
+        """Whether the credentials expired."""
+        return self.expires <= time()
+
+
+class CredentialStore(object):
+    """JSON file storing credentials per base url across process restarts.
+
+    File is replaced atomically and readable by the owner only. Expiry is the
+    earliest of ttl and the expiry of the stored cookies.
+
+    Args:
+        path: file path, e.g. ~/.cache/yafin/credentials.json.
+        ttl: max seconds the credentials are reused.
+    """
+
+    def __init__(self, path: str | pathlib.Path, ttl: float = DEFAULT_TTL) -> None:
+        if ttl <= 0:
+            error(msg=f'Invalid {ttl=}. Expected positive number.', err_cls=ValueError)
+
+        self.path = pathlib.Path(path).expanduser()
+        self.ttl = ttl
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text())
+
+        except FileNotFoundError:
+            return {}
+
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable credential store {self.path}: {e!r}')
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, data: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+
+        os.replace(tmp_path, self.path)
+
+    def load(self, key: str) -> Credentials | None:
+        """Load credentials.
+
+        Args:
+            key: credentials key, e.g. base url.
+
+        Returns: stored credentials, None if missing or expired.
+        """
+        item = self._read().get(key)
+
+        if not item:
+            return None
+
+        try:
+            credentials = Credentials(**item)
+
+        except TypeError:
+            logger.warning(f'Ignoring invalid credentials for {key}.')
+            return None
+
+        if credentials.expired:
+            logger.debug(f'Stored credentials for {key} expired.')
+            return None
+
+        return credentials
+
+    def save(self, key: str, crumb: str, cookies: list[dict[str, Any]]) -> Credentials:
+        """Save credentials.
+
+        Args:
+            key: credentials key, e.g. base url.
+            crumb: crumb issued for the cookies.
+            cookies: session cookies.
+
+        Returns: stored credentials.
+        """
+        expires = min(
+            [time() + self.ttl] + [c['expires'] for c in cookies if c.get('expires')]
+        )
+        credentials = Credentials(crumb=crumb, cookies=cookies, expires=expires)
+        data = self._read()
+        data[key] = asdict(credentials)
+        self._write(data)
+        return credentials
+
+    def clear(self, key: str) -> None:
+        """Remove credentials.
+
+        Args:
+            key: credentials key, e.g. base url.
+        """
+        data = self._read()
+
+        if data.pop(key, None) is not None:
+            self._write(data)
@@ -1,4 +1,43 @@
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import HTTPError
+
+
 class TrailingBalanceSheetError(Exception):
     """Exception for using trailing frequency for balance sheet types."""
 
     pass
+
+
+class ReplayMissError(Exception):
+    """Exception for replayed request without recorded response."""
+
+    pass
+
+
+class TickerNotFoundError(HTTPError):
+    """Exception for ticker not found (HTTP 404), e.g. invalid or delisted.
+
+    Subclass of curl_cffi HTTPError, so handling of HTTP errors still applies.
+
+    Args:
+        ticker: Ticker symbol.
+        endpoint: Endpoint name, e.g. chart.
+        cached: Whether the request was skipped, because of the negative cache.
+        response: Response with HTTP 404, None if skipped.
+    """
+
+    def __init__(
+        self,
+        ticker: str,
+        endpoint: str,
+        cached: bool = False,
+        response: Response | None = None,
+    ) -> None:
+        skipped = ' (skipped, cached)' if cached else ''
+        super().__init__(
+            f'Ticker {ticker} not found by {endpoint} endpoint{skipped}.',
+            response=response,
+        )
+        self.ticker = ticker
+        self.endpoint = endpoint
+        self.cached = cached
@@ -0,0 +1,226 @@
+import logging
+import os
+import uuid
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+logger = logging.getLogger(__name__)
+
+CHART_SCHEMA = pa.schema(
+    [
+        ('ticker', pa.string()),
+        ('interval', pa.string()),
+        ('date', pa.string()),
+        ('month', pa.string()),
+        ('timestamp', pa.timestamp('s', tz='UTC')),
+        ('open', pa.float64()),
+        ('high', pa.float64()),
+        ('low', pa.float64()),
+        ('close', pa.float64()),
+        ('volume', pa.int64()),
+        ('adjclose', pa.float64()),
+        ('dividends', pa.float64()),
+        ('splits', pa.float64()),
+    ]
+)
+
+TIMESERIES_SCHEMA = pa.schema(
+    [
+        ('ticker', pa.string()),
+        ('type', pa.string()),
+        ('period_type', pa.string()),
+        ('as_of_date', pa.date32()),
+        ('currency', pa.string()),
+        ('value', pa.float64()),
+    ]
+)
+
+# by month, daily partitions of long charts exceed pyarrow max_partitions
+CHART_PARTITIONING = ['ticker', 'interval', 'month']
+TIMESERIES_PARTITIONING = ['ticker', 'period_type']
+
+DEFAULT_MAX_PARTITIONS = 1024
+
+
+def _get_event_column(
+    timestamps: pa.Array, events: dict[str, Any] | None, key: str
+) -> pa.Array:
+    """Align event values onto timestamps, bars without event have 0.
+
+    Args:
+        timestamps: int64 array of chart timestamps.
+        events: dividends or splits from the chart events.
+        key: name of the value in the event, or 'splits' for split ratio.
+
+    Returns: float64 array of event values aligned onto the timestamps.
+    """
+    if not events:
+        return pa.nulls(len(timestamps), pa.float64()).fill_null(0.0)
+
+    values = list(events.values())
+    dates = pa.array([e['date'] for e in values], pa.int64())
+
+    if key == 'splits':
+        amounts = pc.divide(
+            pa.array([e['numerator'] for e in values], pa.float64()),
+            pa.array([e['denominator'] for e in values], pa.float64()),
+        )
+    else:
+        amounts = pa.array([e[key] for e in values], pa.float64())
+
+    indices = pc.index_in(timestamps, value_set=dates)
+    return pc.take(amounts, indices).fill_null(0.0)
+
+
+def chart_to_record_batch(chart: dict[str, Any]) -> pa.RecordBatch:
+    """Convert result of the chart response json into arrow record batch.
+
+    Args:
+        chart: chart result, e.g.: AsyncSymbol.get_chart() or
+            AsyncClient.get_chart()['chart']['result'][0].
+
+    Returns: Record batch with CHART_SCHEMA, one row per bar.
+    """
+    meta = chart['meta']
+    timestamps = pa.array(chart.get('timestamp', []), pa.int64())
+    n = len(timestamps)
+    quote = chart['indicators']['quote'][0] if n else {}
+    adjclose = chart['indicators'].get('adjclose')
+    events = chart.get('events', {})
+    datetimes = timestamps.cast(pa.timestamp('s', tz='UTC'))
+    # date and month of the bar in the exchange timezone, not UTC
+    local_datetimes = datetimes.cast(
+        pa.timestamp('s', tz=meta.get('exchangeTimezoneName') or 'UTC')
+    )
+
+    columns = [
+        pa.repeat(meta['symbol'], n),
+        pa.repeat(meta['dataGranularity'], n),
+        pc.strftime(local_datetimes, format='%Y-%m-%d'),
+        pc.strftime(local_datetimes, format='%Y-%m'),
+        datetimes,
+        pa.array(quote.get('open', []), pa.float64()),
+        pa.array(quote.get('high', []), pa.float64()),
+        pa.array(quote.get('low', []), pa.float64()),
+        pa.array(quote.get('close', []), pa.float64()),
+        pa.array(quote.get('volume', []), pa.int64()),
+        (
+            pa.array(adjclose[0]['adjclose'], pa.float64())
+            if adjclose
+            else pa.nulls(n, pa.float64())
+        ),
+        _get_event_column(timestamps, events.get('dividends'), 'amount'),
+        _get_event_column(timestamps, events.get('splits'), 'splits'),
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=CHART_SCHEMA)
+
+
+def timeseries_to_record_batch(timeseries: list[dict[str, Any]]) -> pa.RecordBatch:
+    """Convert result of the timeseries response json into arrow record batch.
+
+    Args:
+        timeseries: timeseries result, e.g.: AsyncSymbol.get_income_statement() or
+            AsyncClient.get_timeseries()['timeseries']['result'].
+
+    Returns: Record batch with TIMESERIES_SCHEMA, one row per type and date.
+    """
+    columns: dict[str, list[Any]] = {name: [] for name in TIMESERIES_SCHEMA.names}
+
+    for result in timeseries:
+        typ = result['meta']['type'][0]
+        ticker = result['meta']['symbol'][0]
+
+        for item in result.get(typ) or []:
+            if item is None:
+                continue
+
+            columns['ticker'].append(ticker)
+            columns['type'].append(typ)
+            columns['period_type'].append(item['periodType'])
+            columns['as_of_date'].append(item['asOfDate'])
+            columns['currency'].append(item.get('currencyCode'))
+            columns['value'].append(item['reportedValue']['raw'])
+
+    arrays = [
+        pa.array(columns[field.name], pa.string()).cast(field.type)
+        if field.type == pa.date32()
+        else pa.array(columns[field.name], field.type)
+        for field in TIMESERIES_SCHEMA
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=TIMESERIES_SCHEMA)
+
+
+def write_dataset(
+    batches: pa.RecordBatch | list[pa.RecordBatch],
+    base_dir: str | os.PathLike[str],
+    partitioning: list[str],
+) -> None:
+    """Append record batches into hive partitioned parquet dataset.
+
+    Every call writes new files with unique names, so existing data is never
+    overwritten. Max number of partitions is sized to the data.
+
+    Args:
+        batches: record batch or list of record batches with the same schema.
+        base_dir: root directory of the dataset.
+        partitioning: names of the partitioning columns.
+    """
+    if isinstance(batches, pa.RecordBatch):
+        batches = [batches]
+
+    batches = [b for b in batches if b.num_rows]
+
+    if not batches:
+        logger.debug(f'Nothing to write into {base_dir}.')
+        return
+
+    table = pa.Table.from_batches(batches)
+    partitions = table.group_by(partitioning).aggregate([]).num_rows
+    ds.write_dataset(
+        table,
+        base_dir,
+        format='parquet',
+        partitioning=partitioning,
+        partitioning_flavor='hive',
+        basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+        existing_data_behavior='overwrite_or_ignore',
+        max_partitions=max(partitions, DEFAULT_MAX_PARTITIONS),
+    )
+    logger.debug(f'{table.num_rows} rows written into {base_dir}.')
+
+
+def write_chart_dataset(
+    charts: dict[str, Any] | list[dict[str, Any]],
+    base_dir: str | os.PathLike[str],
+) -> None:
+    """Append chart results into parquet dataset partitioned by ticker/interval/month.
+
+    Date and month of the bars are in the exchange timezone of the chart.
+
+    Args:
+        charts: chart result or list of chart results.
+        base_dir: root directory of the dataset.
+    """
+    if isinstance(charts, dict):
+        charts = [charts]
+
+    batches = [chart_to_record_batch(chart) for chart in charts]
+    write_dataset(batches, base_dir, CHART_PARTITIONING)
+
+
+def write_timeseries_dataset(
+    timeseries: list[dict[str, Any]],
+    base_dir: str | os.PathLike[str],
+) -> None:
+    """Append timeseries result into parquet dataset partitioned by ticker/period_type.
+
+    Args:
+        timeseries: timeseries result.
+        base_dir: root directory of the dataset.
+    """
+    write_dataset(
+        timeseries_to_record_batch(timeseries), base_dir, TIMESERIES_PARTITIONING
+    )
@@ -0,0 +1,63 @@
+import logging
+from time import perf_counter
+from typing import Any
+
+import httpx
+from curl_cffi.requests import Response
+
+from .transport import make_response
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36'
+)
+
+
+class HttpxTransport(object):
+    """Transport using httpx AsyncClient, optionally with HTTP/2.
+
+    Requires httpx, install with httpx extra. Yahoo Finance may reject clients
+    without browser TLS fingerprint, meant for benchmarking and local servers.
+
+    Args:
+        client: Shared httpx client, not closed by the transport.
+        http2: Whether to negotiate HTTP/2, used if client is not provided.
+        client_kwargs: httpx.AsyncClient arguments, used if client is not provided.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        **client_kwargs: Any,
+    ) -> None:
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            **({'http2': http2, 'headers': {'User-Agent': USER_AGENT}} | client_kwargs)
+        )
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> Response:
+        """Send GET request with the httpx client.
+
+        Args:
+            url: request url.
+            params: request query params.
+
+        Returns: httpx response converted into curl_cffi response.
+        """
+        start = perf_counter()
+        response = await self.client.get(url, params=params)
+        return make_response(
+            url=str(response.url),
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response.content,
+            elapsed=perf_counter() - start,
+        )
+
+    async def close(self) -> None:
+        """Close the httpx client if owned by the transport."""
+        if self._owns_client:
+            await self.client.aclose()
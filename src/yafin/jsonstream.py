@@ -0,0 +1,208 @@
+import json
+import logging
+import re
+from collections.abc import Iterable
+from typing import Any, NoReturn
+
+from .utils import error
+
+logger = logging.getLogger(__name__)
+
+ITEM = 'item'
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+\-]*')
+
+
+def _join_path(path: str, key: str) -> str:
+    return f'{path}.{key}' if path else key
+
+
+class JsonItemsParser(object):
+    """Incremental json parser yielding the values at the requested paths.
+
+    Paths are dot separated keys with 'item' for array elements (as in ijson),
+    e.g. 'optionChain.result.item.options.item.calls.item' for the call
+    contracts. Containers on the way to the requested paths are walked key by key,
+    requested values and other values are decoded whole with
+    json.JSONDecoder.raw_decode. Only the unconsumed text is buffered, so the
+    memory is bounded by the largest single value instead of the whole document.
+
+    Args:
+        paths: Paths of the requested values.
+    """
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        self.paths = frozenset(paths)
+
+        if not self.paths:
+            error(msg='Expected at least one path.', err_cls=ValueError)
+
+        self._parents = frozenset(
+            '.'.join(keys[:i])
+            for keys in (p.split('.') for p in self.paths)
+            for i in range(len(keys))
+        )
+        self._decoder = json.JSONDecoder()
+        self._chunks: list[str] = []
+        self._size = 0
+        self._retry_size = 0  # buffered size worth retrying incomplete value
+        self._stack: list[tuple[str, str]] = []  # (opening bracket, path)
+        self._expect = 'value'  # value, key, colon or next
+        self._path = ''  # path of the expected value
+        self._incomplete = False  # whether the last scan stopped in a value
+
+    def feed(self, text: str, final: bool = False) -> list[tuple[str, Any]]:
+        """Parse next chunk of the document.
+
+        Args:
+            text: next chunk of the json text.
+            final: whether it is the last chunk.
+
+        Returns: (path, value) of the requested values completed by the chunk.
+        """
+        self._chunks.append(text)
+        self._size += len(text)
+
+        # retry of incomplete value waits until the buffer doubles, so parsing
+        # of a value split across many small chunks stays linear
+        if self._size < self._retry_size and not final:
+            return []
+
+        buffer = ''.join(self._chunks)
+        items: list[tuple[str, Any]] = []
+        self._incomplete = False
+        pos = self._scan(buffer, final, items)
+
+        rest = buffer[pos:]
+        self._chunks = [rest]
+        self._size = len(rest)
+        self._retry_size = 2 * self._size if self._incomplete else 0
+
+        if final and (self._stack or self._expect != 'next'):
+            self._raise(buffer, pos, 'Unexpected end of document')
+
+        return items
+
+    def _scan(self, buffer: str, final: bool, items: list[tuple[str, Any]]) -> int:
+        """Scan the buffer until its end or an incomplete token.
+
+        Returns: position of the first unconsumed char.
+        """
+        scanners = {
+            'value': self._scan_value,
+            'key': self._scan_key,
+            'colon': self._scan_colon,
+            'next': self._scan_next,
+        }
+        pos = 0
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+
+            if pos == len(buffer):
+                return pos
+
+            next_pos = scanners[self._expect](buffer, pos, final, items)
+
+            if next_pos is None:
+                return pos
+
+            pos = next_pos
+
+    def _scan_value(
+        self, buffer: str, pos: int, final: bool, items: list[tuple[str, Any]]
+    ) -> int | None:
+        char = buffer[pos]
+
+        if char == ']' and self._stack and self._stack[-1][0] == '[':
+            self._close()
+            return pos + 1
+
+        if char in '{[' and self._path in self._parents:
+            self._open(char)
+            return pos + 1
+
+        try:
+            value, value_end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+
+            self._incomplete = True
+            return None
+
+        # number at the end of the chunk may continue in the next one
+        if (
+            not final
+            and isinstance(value, (int, float))
+            and _NUMBER_TAIL.fullmatch(buffer, value_end)
+        ):
+            return None
+
+        if self._path in self.paths:
+            items.append((self._path, value))
+
+        self._expect = 'next'
+        return value_end
+
+    def _scan_key(
+        self, buffer: str, pos: int, final: bool, items: list[tuple[str, Any]]
+    ) -> int | None:
+        if buffer[pos] == '}':
+            self._close()
+            return pos + 1
+
+        if buffer[pos] != '"':
+            self._raise(buffer, pos, 'Expecting property name')
+
+        try:
+            key, key_end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+
+            return None
+
+        self._path = _join_path(self._stack[-1][1], key)
+        self._expect = 'colon'
+        return key_end
+
+    def _scan_colon(
+        self, buffer: str, pos: int, final: bool, items: list[tuple[str, Any]]
+    ) -> int | None:
+        if buffer[pos] != ':':
+            self._raise(buffer, pos, "Expecting ':' delimiter")
+
+        self._expect = 'value'
+        return pos + 1
+
+    def _scan_next(
+        self, buffer: str, pos: int, final: bool, items: list[tuple[str, Any]]
+    ) -> int | None:
+        if not self._stack:
+            self._raise(buffer, pos, 'Extra data')
+
+        bracket, path = self._stack[-1]
+
+        if buffer[pos] == ',':
+            self._expect = 'key' if bracket == '{' else 'value'
+            self._path = _join_path(path, ITEM)
+        elif buffer[pos] == ('}' if bracket == '{' else ']'):
+            self._close()
+        else:
+            self._raise(buffer, pos, "Expecting ',' delimiter")
+
+        return pos + 1
+
+    def _open(self, bracket: str) -> None:
+        self._stack.append((bracket, self._path))
+        self._expect = 'key' if bracket == '{' else 'value'
+        self._path = _join_path(self._path, ITEM)
+
+    def _close(self) -> None:
+        self._stack.pop()
+        self._expect = 'next'
+
+    def _raise(self, buffer: str, pos: int, msg: str) -> NoReturn:
+        raise json.JSONDecodeError(msg, buffer, pos)
@@ -0,0 +1,315 @@
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from time import monotonic
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Type
+
+from .utils import error
+
+if TYPE_CHECKING:
+    from .client import AsyncClient
+
+logger = logging.getLogger(__name__)
+
+# seconds between polls of a symbol per its marketState
+DEFAULT_INTERVALS = {
+    'REGULAR': 1.0,
+    'PRE': 5.0,
+    'POST': 5.0,
+    'PREPRE': 60.0,
+    'POSTPOST': 60.0,
+    'CLOSED': 60.0,
+}
+
+MAX_BACKOFF = 60.0
+
+
+@dataclass(frozen=True)
+class QuoteUpdate:
+    """Changed fields of the symbol quote.
+
+    Attributes:
+        symbol: ticker symbol.
+        changes: fields changed since the previous poll, whole quote for the
+            first update of the subscription.
+    """
+
+    symbol: str
+    changes: dict[str, Any]
+
+
+class QuoteSubscription(object):
+    """Async iterator of quote updates of the subscribed symbols.
+
+    Queue is bounded, if the consumer falls behind the oldest updates are
+    dropped, so the latest changes are always delivered.
+
+    Args:
+        poller: Poller delivering the updates.
+        symbols: Subscribed symbols.
+        queue_size: Max number of undelivered updates.
+    """
+
+    def __init__(
+        self, poller: 'QuotePoller', symbols: frozenset[str], queue_size: int
+    ) -> None:
+        self.symbols = symbols
+        self.dropped = 0
+        self._poller = poller
+        self._queue: asyncio.Queue[QuoteUpdate | None] = asyncio.Queue(queue_size)
+        self._closed = False
+
+    def _put(self, update: QuoteUpdate | None) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+
+        self._queue.put_nowait(update)
+
+    def __aiter__(self) -> AsyncIterator[QuoteUpdate]:
+        """Iterate over updates until closed."""
+        return self
+
+    async def __anext__(self) -> QuoteUpdate:
+        """Wait for the next update, updates queued before closing are delivered."""
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+
+        update = await self._queue.get()
+
+        if update is None:
+            raise StopAsyncIteration
+
+        return update
+
+    def close(self) -> None:
+        """Unsubscribe, polling of symbols without subscribers stops."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._poller._unsubscribe(self)
+        self._put(None)
+
+    async def __aenter__(self) -> 'QuoteSubscription':
+        """Enter subscription context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Unsubscribe when leaving the context."""
+        self.close()
+
+
+class QuotePoller(object):
+    """One polling loop of the quote endpoint shared by all subscriptions.
+
+    Symbols due for polling are requested in chunks of multi-symbol quote
+    requests. Cadence of each symbol adapts to its marketState, e.g. every second
+    in regular trading hours and every minute when the market is closed.
+    Polling backs off exponentially on errors.
+
+    Args:
+        client: Client sending the quote requests.
+        intervals: Seconds between polls per marketState, default
+            DEFAULT_INTERVALS.
+        default_interval: Seconds between polls of unknown marketState.
+        chunk_size: Max symbols per request.
+    """
+
+    def __init__(
+        self,
+        client: 'AsyncClient',
+        intervals: dict[str, float] | None = None,
+        default_interval: float = 1.0,
+        chunk_size: int = 50,
+    ) -> None:
+        if chunk_size < 1:
+            error(
+                msg=f'Invalid {chunk_size=}. Expected positive number.',
+                err_cls=ValueError,
+            )
+
+        self.client = client
+        self.intervals = DEFAULT_INTERVALS | (intervals or {})
+        self.default_interval = default_interval
+        self.chunk_size = chunk_size
+        self.polls = 0
+        self.quotes: dict[str, dict[str, Any]] = {}
+        self._symbols: Counter[str] = Counter()
+        self._subscriptions: set[QuoteSubscription] = set()
+        self._due: dict[str, float] = {}
+        self._backoff = 0.0
+        self._wake_up = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def subscribe(self, tickers: str, queue_size: int = 100) -> QuoteSubscription:
+        """Subscribe to quote updates of the symbols.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            queue_size: Max number of undelivered updates.
+
+        Returns: subscription, async iterator of QuoteUpdate.
+        """
+        symbols = frozenset(t.strip().upper() for t in tickers.split(',') if t.strip())
+
+        if not symbols:
+            error(msg=f'Invalid {tickers=}. Expected symbols.', err_cls=ValueError)
+
+        subscription = QuoteSubscription(self, symbols, queue_size)
+        self._subscriptions.add(subscription)
+
+        for symbol in symbols:
+            self._symbols[symbol] += 1
+
+            if symbol in self.quotes:
+                subscription._put(QuoteUpdate(symbol, dict(self.quotes[symbol])))
+            else:
+                self._due[symbol] = 0.0
+
+        self._wake_up.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        return subscription
+
+    def _unsubscribe(self, subscription: QuoteSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+        for symbol in subscription.symbols:
+            self._symbols[symbol] -= 1
+
+            if self._symbols[symbol] <= 0:
+                del self._symbols[symbol]
+                self._due.pop(symbol, None)
+                self.quotes.pop(symbol, None)
+
+        self._wake_up.set()
+
+    def _get_interval(self, quote: dict[str, Any]) -> float:
+        return self.intervals.get(quote.get('marketState', ''), self.default_interval)
+
+    def _publish(self, quote: dict[str, Any]) -> None:
+        symbol: str = quote.get('symbol', '')
+
+        if symbol not in self._symbols:
+            return
+
+        previous = self.quotes.get(symbol, {})
+        changes = {
+            k: v for k, v in quote.items() if k not in previous or previous[k] != v
+        }
+
+        self.quotes[symbol] = quote
+        self._due[symbol] = monotonic() + self._get_interval(quote)
+
+        if not changes:
+            return
+
+        update = QuoteUpdate(symbol, changes)
+
+        for subscription in self._subscriptions:
+            if symbol in subscription.symbols:
+                subscription._put(update)
+
+    async def _poll(self, symbols: list[str]) -> None:
+        chunks = [
+            symbols[i : i + self.chunk_size]
+            for i in range(0, len(symbols), self.chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(self.client.get_quote(','.join(chunk)) for chunk in chunks),
+            return_exceptions=True,
+        )
+        self.polls += 1
+        failed = False
+
+        for chunk, result in zip(chunks, results):
+            quotes = self._get_quotes(chunk, result)
+
+            if quotes is None:
+                failed = True
+                self._backoff = min(
+                    max(self._backoff * 2, self.default_interval), MAX_BACKOFF
+                )
+                self._reschedule(chunk, self._backoff)
+                continue
+
+            for quote in quotes:
+                self._publish(quote)
+
+            # symbols missing in the response, e.g. invalid ones
+            self._reschedule(
+                [s for s in chunk if self._due.get(s, 0.0) <= monotonic()],
+                self.default_interval,
+            )
+
+        if not failed:
+            self._backoff = 0.0
+
+    def _get_quotes(
+        self, chunk: list[str], result: dict[str, Any] | BaseException
+    ) -> list[dict[str, Any]] | None:
+        """Quotes of the response, None if the request failed or is malformed."""
+        if isinstance(result, BaseException):
+            logger.warning(f'Polling quotes of {chunk} failed: {result!r}')
+            return None
+
+        try:
+            quotes = result['quoteResponse']['result']
+
+        except (KeyError, TypeError) as e:
+            logger.warning(f'Polling quotes of {chunk} got malformed response: {e!r}')
+            return None
+
+        if not isinstance(quotes, list) or not all(isinstance(q, dict) for q in quotes):
+            logger.warning(f'Polling quotes of {chunk} got malformed {quotes=}')
+            return None
+
+        return quotes
+
+    def _reschedule(self, symbols: list[str], delay: float) -> None:
+        for symbol in symbols:
+            if symbol in self._symbols:
+                self._due[symbol] = monotonic() + delay
+
+    async def _run(self) -> None:
+        while self._symbols:
+            self._wake_up.clear()
+            now = monotonic()
+            due = sorted(s for s, t in self._due.items() if t <= now)
+
+            if due:
+                await self._poll(due)
+                continue
+
+            timeout = min(self._due.values(), default=now + self.default_interval)
+
+            try:
+                await asyncio.wait_for(self._wake_up.wait(), timeout - now)
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self) -> None:
+        """Close all subscriptions and stop polling."""
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
@@ -0,0 +1,295 @@
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from curl_cffi import CurlInfo
+from curl_cffi.requests import Response
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PHASES = ('dns', 'connect', 'tls', 'ttfb', 'total', 'decode')
+
+ENDPOINTS: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r'/v1/test/getcrumb$'), 'getcrumb'),
+    (re.compile(r'/finance/chart/'), 'chart'),
+    (re.compile(r'/finance/quote/marketSummary$'), 'market_summary'),
+    (re.compile(r'/finance/quote$'), 'quote'),
+    (re.compile(r'/finance/quoteSummary/'), 'quote_summary'),
+    (re.compile(r'/finance/timeseries/'), 'timeseries'),
+    (re.compile(r'/finance/options/'), 'options'),
+    (re.compile(r'/finance/search$'), 'search'),
+    (re.compile(r'/finance/recommendationsbysymbol/'), 'recommendations'),
+    (re.compile(r'/finance/insights$'), 'insights'),
+    (re.compile(r'/finance/trending/'), 'trending'),
+    (re.compile(r'/finance/currencies$'), 'currencies'),
+]
+
+
+def get_endpoint(url: str) -> str:
+    """Get endpoint name of the request url, without ticker.
+
+    Args:
+        url: request url.
+
+    Returns: endpoint name, e.g. chart, other for unknown urls.
+    """
+    path = urlsplit(url).path
+
+    for pattern, name in ENDPOINTS:
+        if pattern.search(path):
+            return name
+
+    return 'other'
+
+
+def get_timings(response: Response) -> dict[str, float]:
+    """Get durations of the request phases in seconds.
+
+    Phases of requests over reused connections (dns, connect, tls) are 0. Only
+    total is available, if the transport does not collect curl timings.
+
+    Args:
+        response: finished response.
+
+    Returns: durations of dns, connect, tls, ttfb (time to first byte) and total.
+    """
+    # curl_cffi stores infos keyed by CurlInfo, not str as annotated
+    infos: dict[Any, Any] = response.infos
+
+    if CurlInfo.TOTAL_TIME not in infos:
+        return {'total': response.elapsed.total_seconds()}
+
+    dns = infos.get(CurlInfo.NAMELOOKUP_TIME, 0.0)
+    connect = infos.get(CurlInfo.CONNECT_TIME, 0.0)
+    tls = infos.get(CurlInfo.APPCONNECT_TIME, 0.0)
+    return {
+        'dns': dns,
+        'connect': max(connect - dns, 0.0),
+        'tls': max(tls - connect, 0.0) if tls else 0.0,
+        'ttfb': infos.get(CurlInfo.STARTTRANSFER_TIME, 0.0),
+        'total': infos[CurlInfo.TOTAL_TIME],
+    }
+
+
+class Histogram(object):
+    """Cumulative histogram with fixed buckets, as used by Prometheus.
+
+    Args:
+        buckets: sorted upper bounds of the buckets, +Inf is added.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add observed value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate quantile as upper bound of the bucket containing it.
+
+        Args:
+            q: quantile between 0 and 1.
+
+        Returns: estimated value, NaN if empty, +Inf if above the last bucket.
+        """
+        if not self.count:
+            return math.nan
+
+        rank = q * self.count
+        cumulative = 0
+
+        for bound, count in zip((*self.buckets, math.inf), self.counts):
+            cumulative += count
+
+            if cumulative >= rank:
+                return bound
+
+        return math.inf
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Get (upper bound, number of values <= bound) pairs incl. +Inf."""
+        result = []
+        cumulative = 0
+
+        for bound, count in zip((*self.buckets, math.inf), self.counts):
+            cumulative += count
+            result.append((bound, cumulative))
+
+        return result
+
+    def snapshot(self) -> dict[str, float]:
+        """Get summary with count, sum, mean and p50, p95 and p99 estimates."""
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else math.nan,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+@dataclass
+class EndpointMetrics:
+    """Metrics of one endpoint.
+
+    Attributes:
+        requests: number of sent requests, incl. failed and retried.
+        status_codes: number of responses per status code, error for requests
+            failed without response.
+        response_bytes: total size of the response bodies.
+        retries: number of retried requests.
+        timings: histograms of the request phases and json decoding in seconds.
+    """
+
+    requests: int = 0
+    status_codes: Counter[str] = field(default_factory=Counter)
+    response_bytes: int = 0
+    retries: int = 0
+    timings: dict[str, Histogram] = field(default_factory=dict)
+
+    def observe_timing(self, phase: str, seconds: float) -> None:
+        """Add duration of the phase."""
+        if phase not in self.timings:
+            self.timings[phase] = Histogram()
+
+        self.timings[phase].observe(seconds)
+
+
+class MetricsCollector(object):
+    """In-process per endpoint metrics of AsyncClient requests.
+
+    Client calls the on_* hooks, subclass and override them to forward events
+    elsewhere. Curl timings (dns, connect, tls, ttfb) are collected by
+    CurlCffiTransport, other transports report total time only.
+
+    Args:
+        prefix: name prefix of the exported Prometheus metrics.
+    """
+
+    def __init__(self, prefix: str = 'yafin') -> None:
+        self.prefix = prefix
+        self.endpoints: defaultdict[str, EndpointMetrics] = defaultdict(EndpointMetrics)
+
+    def on_response(self, url: str, response: Response) -> None:
+        """Record finished request, called before raising for status."""
+        metrics = self.endpoints[get_endpoint(url)]
+        metrics.requests += 1
+        metrics.status_codes[str(response.status_code)] += 1
+        metrics.response_bytes += len(response.content)
+
+        for phase, seconds in get_timings(response).items():
+            metrics.observe_timing(phase, seconds)
+
+    def on_error(self, url: str, exc: BaseException) -> None:
+        """Record request failed without response, e.g. timeout."""
+        metrics = self.endpoints[get_endpoint(url)]
+        metrics.requests += 1
+        metrics.status_codes['error'] += 1
+
+    def on_retry(self, url: str) -> None:
+        """Record retried request."""
+        self.endpoints[get_endpoint(url)].retries += 1
+
+    def on_decode(self, url: str, seconds: float) -> None:
+        """Record duration of the json decoding."""
+        self.endpoints[get_endpoint(url)].observe_timing('decode', seconds)
+
+    def reset(self) -> None:
+        """Drop all collected metrics."""
+        self.endpoints.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get metrics per endpoint as plain dict, e.g. for logging or json."""
+        return {
+            endpoint: {
+                'requests': m.requests,
+                'status_codes': dict(m.status_codes),
+                'response_bytes': m.response_bytes,
+                'retries': m.retries,
+                'timings': {
+                    phase: m.timings[phase].snapshot()
+                    for phase in PHASES
+                    if phase in m.timings
+                },
+            }
+            for endpoint, m in sorted(self.endpoints.items())
+        }
+
+    def to_prometheus(self) -> str:
+        """Export metrics in Prometheus text exposition format."""
+        p = self.prefix
+        requests = [
+            f'# HELP {p}_requests_total Requests per endpoint and status code.',
+            f'# TYPE {p}_requests_total counter',
+        ]
+        response_bytes = [
+            f'# HELP {p}_response_bytes_total Size of the response bodies.',
+            f'# TYPE {p}_response_bytes_total counter',
+        ]
+        retries = [
+            f'# HELP {p}_retries_total Retried requests.',
+            f'# TYPE {p}_retries_total counter',
+        ]
+        durations = [
+            f'# HELP {p}_duration_seconds Durations of request phases and decoding.',
+            f'# TYPE {p}_duration_seconds histogram',
+        ]
+
+        for endpoint, m in sorted(self.endpoints.items()):
+            labels = f'endpoint="{endpoint}"'
+
+            for status, count in sorted(m.status_codes.items()):
+                requests.append(
+                    f'{p}_requests_total{{{labels},status="{status}"}} {count}'
+                )
+
+            response_bytes.append(
+                f'{p}_response_bytes_total{{{labels}}} {m.response_bytes}'
+            )
+            retries.append(f'{p}_retries_total{{{labels}}} {m.retries}')
+
+            for phase in PHASES:
+                if phase not in m.timings:
+                    continue
+
+                histogram = m.timings[phase]
+                phase_labels = f'{labels},phase="{phase}"'
+
+                for bound, count in histogram.cumulative_counts():
+                    le = '+Inf' if bound == math.inf else repr(bound)
+                    bucket_labels = f'{phase_labels},le="{le}"'
+                    durations.append(
+                        f'{p}_duration_seconds_bucket{{{bucket_labels}}} {count}'
+                    )
+
+                durations.append(
+                    f'{p}_duration_seconds_sum{{{phase_labels}}} {histogram.sum}'
+                )
+                durations.append(
+                    f'{p}_duration_seconds_count{{{phase_labels}}} {histogram.count}'
+                )
+
+        return '\n'.join(requests + response_bytes + retries + durations) + '\n'
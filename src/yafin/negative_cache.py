@@ -0,0 +1,90 @@
+import logging
+from collections import Counter, OrderedDict
+from time import monotonic
+
+from .utils import error
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600.0
+
+
+class NegativeCache(object):
+    """Tickers not found (HTTP 404) per endpoint, remembered for ttl seconds.
+
+    Requests for the remembered tickers are skipped by AsyncClient, which raises
+    TickerNotFoundError without a round trip. Skipped tickers are counted, so
+    stale symbols of a universe can be reported and removed.
+
+    Args:
+        ttl: Seconds a not found ticker is skipped, e.g. until it is listed.
+        maxsize: Max number of remembered tickers, the oldest are evicted.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, maxsize: int = 10_000) -> None:
+        if ttl <= 0 or maxsize < 1:
+            error(
+                msg=f'Invalid {ttl=} or {maxsize=}. Expected positive numbers.',
+                err_cls=ValueError,
+            )
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.skipped: Counter[tuple[str, str]] = Counter()
+        self._expires: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of remembered tickers, incl. expired not yet purged."""
+        return len(self._expires)
+
+    def add(self, endpoint: str, ticker: str) -> None:
+        """Remember ticker not found by the endpoint."""
+        key = (endpoint, ticker.upper())
+        self._expires.pop(key, None)
+        self._expires[key] = monotonic() + self.ttl
+
+        if len(self._expires) > self.maxsize:
+            self._expires.popitem(last=False)
+
+    def should_skip(self, endpoint: str, ticker: str) -> bool:
+        """Whether the request should be skipped, skip is counted.
+
+        Args:
+            endpoint: Endpoint name, e.g. chart.
+            ticker: Ticker symbol.
+
+        Returns: whether the ticker was not found by the endpoint within ttl.
+        """
+        key = (endpoint, ticker.upper())
+        expires = self._expires.get(key)
+
+        if expires is None:
+            return False
+
+        if expires <= monotonic():
+            del self._expires[key]
+            return False
+
+        self.skipped[key] += 1
+        return True
+
+    def discard(self, endpoint: str, ticker: str) -> None:
+        """Forget the ticker, e.g. after it was listed."""
+        self._expires.pop((endpoint, ticker.upper()), None)
+
+    def get_skipped(self) -> dict[str, list[str]]:
+        """Get skipped tickers.
+
+        Returns: endpoint: sorted tickers with at least one skipped request.
+        """
+        result: dict[str, list[str]] = {}
+
+        for endpoint, ticker in sorted(self.skipped):
+            result.setdefault(endpoint, []).append(ticker)
+
+        return result
+
+    def clear(self) -> None:
+        """Forget all tickers and skip counts."""
+        self._expires.clear()
+        self.skipped.clear()
@@ -0,0 +1,155 @@
+import heapq
+import itertools
+import json
+import logging
+import pathlib
+import weakref
+from collections import deque
+from dataclasses import asdict, dataclass
+from time import time
+from typing import Any
+
+from curl_cffi.requests import Response
+
+from .metrics import get_endpoint, get_timings
+from .utils import encode_url, error
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestProfile:
+    """Profile of one finished request.
+
+    Attributes:
+        url: request url with params, crumb redacted.
+        endpoint: endpoint name, e.g. quote_summary.
+        status_code: http status code.
+        started: unix timestamp of the request end minus its total time.
+        total: seconds until the whole response was received.
+        ttfb: seconds until the first byte, None if not collected by transport.
+        size: response body size in bytes.
+        decode: seconds spent decoding the json, None if not decoded (yet).
+    """
+
+    url: str
+    endpoint: str
+    status_code: int
+    started: float
+    total: float
+    ttfb: float | None
+    size: int
+    decode: float | None = None
+
+
+class RequestProfiler(object):
+    """Bounded in-memory record of the slowest and largest requests.
+
+    Keeps the top_n slowest (total + decode time) and largest responses since
+    the start and a ring buffer of the recent requests. Cost per request is
+    O(log top_n), so it can stay enabled in production.
+
+    Args:
+        top_n: Number of kept slowest and largest requests.
+        recent: Size of the ring buffer of the recent requests.
+    """
+
+    def __init__(self, top_n: int = 10, recent: int = 100) -> None:
+        if top_n < 1 or recent < 0:
+            error(
+                msg=f'Invalid {top_n=} or {recent=}. Expected positive numbers.',
+                err_cls=ValueError,
+            )
+
+        self.top_n = top_n
+        self.recent: deque[RequestProfile] = deque(maxlen=recent)
+        self._slowest: list[tuple[float, int, RequestProfile]] = []
+        self._largest: list[tuple[int, int, RequestProfile]] = []
+        self._counter = itertools.count()
+        self._pending: weakref.WeakKeyDictionary[Response, RequestProfile] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def on_response(
+        self, url: str, params: dict[str, Any] | None, response: Response
+    ) -> None:
+        """Record finished request, decode time is added by on_decode."""
+        timings = get_timings(response)
+        profile = RequestProfile(
+            url=encode_url(url, params),
+            endpoint=get_endpoint(url),
+            status_code=response.status_code,
+            started=time() - timings['total'],
+            total=timings['total'],
+            ttfb=timings.get('ttfb'),
+            size=len(response.content),
+        )
+        self.recent.append(profile)
+        self._pending[response] = profile
+        self._push(self._largest, profile.size, profile)
+        self._push(self._slowest, profile.total, profile)
+
+    def on_decode(self, response: Response, seconds: float) -> None:
+        """Add decode time to the profile of the response."""
+        profile = self._pending.pop(response, None)
+
+        if profile is None:
+            return
+
+        profile.decode = seconds
+        # re-rank with the decode time, stale entry is dropped by the dump
+        self._push(self._slowest, profile.total + seconds, profile)
+
+    def _push(self, heap: list[Any], value: float, profile: RequestProfile) -> None:
+        item = (value, next(self._counter), profile)
+
+        if len(heap) < self.top_n * 2:
+            heapq.heappush(heap, item)
+        elif value > heap[0][0]:
+            heapq.heapreplace(heap, item)
+
+    @property
+    def slowest(self) -> list[RequestProfile]:
+        """Slowest requests incl. decode time, slowest first."""
+        return self._top(self._slowest)
+
+    @property
+    def largest(self) -> list[RequestProfile]:
+        """Largest responses, largest first."""
+        return self._top(self._largest)
+
+    def _top(self, heap: list[tuple[Any, int, RequestProfile]]) -> list[RequestProfile]:
+        result: list[RequestProfile] = []
+
+        for _, _, profile in sorted(heap, key=lambda i: i[0], reverse=True):
+            if not any(p is profile for p in result):
+                result.append(profile)
+
+        return result[: self.top_n]
+
+    def reset(self) -> None:
+        """Drop all recorded requests."""
+        self.recent.clear()
+        self._slowest.clear()
+        self._largest.clear()
+        self._pending.clear()
+
+    def dump(self, path: str | pathlib.Path | None = None) -> dict[str, Any]:
+        """Dump recorded requests.
+
+        Args:
+            path: json file to write the dump to (optional).
+
+        Returns: slowest, largest and recent requests as plain dicts.
+        """
+        data = {
+            'slowest': [asdict(p) for p in self.slowest],
+            'largest': [asdict(p) for p in self.largest],
+            'recent': [asdict(p) for p in self.recent],
+        }
+
+        if path is not None:
+            pathlib.Path(path).write_text(json.dumps(data, indent=2))
+            logger.info(f'Request profile dumped to {path}.')
+
+        return data
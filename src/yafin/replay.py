@@ -0,0 +1,321 @@
+import asyncio
+import gzip
+import json
+import logging
+import pathlib
+import warnings
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from curl_cffi.requests import AsyncSession, Response
+
+from .exceptions import ReplayMissError
+from .transport import CurlCffiTransport, Transport, make_response
+from .utils import error, get_request_key
+
+if TYPE_CHECKING:
+    from .client import AsyncClient
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+
+REDACTED = '*REDACTED*'
+
+RECORDED_HEADERS = ('content-type', 'retry-after')
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """Recorded request/response pair.
+
+    Attributes:
+        url: request url without query params.
+        params: request query params, crumb redacted.
+        started: seconds since the start of the recording.
+        elapsed: seconds until the whole response was received.
+        status_code: http status code.
+        headers: subset of response headers needed by the client.
+        content: response body.
+    """
+
+    url: str
+    params: dict[str, str]
+    started: float
+    elapsed: float
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+    @property
+    def key(self) -> str:
+        """Key matching the replayed request, url path with canonical params."""
+        return get_request_key(urlsplit(self.url).path, self.params)
+
+    def to_json(self) -> str:
+        """Serialize to one line of the archive."""
+        data = asdict(self)
+        data['content'] = self.content.decode('utf-8', 'surrogateescape')
+        return json.dumps(data, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, line: str) -> 'Exchange':
+        """Deserialize from one line of the archive."""
+        data = json.loads(line)
+        data['content'] = data['content'].encode('utf-8', 'surrogateescape')
+        return cls(**data)
+
+    def to_response(self) -> Response:
+        """Create response as returned by the recorded transport."""
+        return make_response(
+            url=self.key,
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            elapsed=self.elapsed,
+        )
+
+
+def _redact(params: dict[str, Any] | None) -> dict[str, str]:
+    redacted = {k: str(v) for k, v in (params or {}).items()}
+
+    if 'crumb' in redacted:
+        redacted['crumb'] = REDACTED
+
+    return redacted
+
+
+def read_archive(path: str | pathlib.Path) -> Iterator[Exchange]:
+    """Read recorded exchanges from the gzipped JSON lines archive.
+
+    Args:
+        path: archive path, e.g. session.jsonl.gz.
+
+    Yields: recorded exchanges in the order they were started.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+
+        if header.get('version') != ARCHIVE_VERSION:
+            error(
+                msg=f'Unsupported archive version={header.get("version")}. '
+                f'Expected {ARCHIVE_VERSION}.',
+                err_cls=ValueError,
+            )
+
+        exchanges = [Exchange.from_json(line) for line in f if line.strip()]
+
+    yield from sorted(exchanges, key=lambda e: e.started)
+
+
+class RecordingTransport(object):
+    """Transport recording every request/response pair into an archive.
+
+    Archive is gzipped JSON lines, one exchange per line, written as responses
+    arrive, so long production sessions do not stay in memory. Crumb is redacted.
+
+    Args:
+        path: archive path, e.g. session.jsonl.gz.
+        transport: recorded transport, by default CurlCffiTransport.
+    """
+
+    def __init__(
+        self, path: str | pathlib.Path, transport: Transport | None = None
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self.transport = transport or CurlCffiTransport()
+        self.count = 0
+        self._start: float | None = None
+        self._file: IO[str] | None = None
+
+    def _write(self, exchange: Exchange) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+            self._file.write(json.dumps({'version': ARCHIVE_VERSION}) + '\n')
+
+        self._file.write(exchange.to_json() + '\n')
+        self.count += 1
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> Response:
+        """Send GET request with the wrapped transport and record it.
+
+        Args:
+            url: request url.
+            params: request query params.
+
+        Returns: response of the wrapped transport.
+        """
+        start = perf_counter()
+
+        if self._start is None:
+            self._start = start
+
+        response = await self.transport.get(url, params=params)
+        elapsed = perf_counter() - start
+
+        exchange = Exchange(
+            url=url,
+            params=_redact(params),
+            started=start - self._start,
+            elapsed=elapsed,
+            status_code=response.status_code,
+            headers={
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() in RECORDED_HEADERS
+            },
+            content=response.content,
+        )
+        self._write(exchange)
+        return response
+
+    async def close(self) -> None:
+        """Finish the archive and close the wrapped transport."""
+        if self._file:
+            self._file.close()
+            self._file = None
+            logger.info(f'Recorded {self.count} requests into {self.path}.')
+
+        await self.transport.close()
+
+
+class ReplayTransport(object):
+    """Transport answering requests from a recorded archive without network.
+
+    Requests are matched on url path and params (crumb ignored), so the archive
+    recorded against production can be replayed with any base url. Repeated
+    identical requests are answered in the recorded order, the last response is
+    reused once all are consumed.
+
+    Args:
+        path: archive path, e.g. session.jsonl.gz.
+        speed: replay speed factor, 1 for original latencies, 10 for 10x faster,
+            None to answer immediately.
+    """
+
+    def __init__(self, path: str | pathlib.Path, speed: float | None = 1.0) -> None:
+        if speed is not None and speed <= 0:
+            error(
+                msg=f'Invalid {speed=}. Expected positive number.', err_cls=ValueError
+            )
+
+        self.path = pathlib.Path(path)
+        self.speed = speed
+        self.count = 0
+        self._exchanges: dict[str, deque[Exchange]] = defaultdict(deque)
+
+        for exchange in read_archive(self.path):
+            self._exchanges[exchange.key].append(exchange)
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> Response:
+        """Answer GET request with the recorded response.
+
+        Args:
+            url: request url.
+            params: request query params.
+
+        Returns: recorded response, delayed by the recorded latency / speed.
+        """
+        key = get_request_key(urlsplit(url).path, params)
+        exchanges = self._exchanges.get(key)
+
+        if not exchanges:
+            error(msg=f'No recorded response for {key}.', err_cls=ReplayMissError)
+
+        exchange = exchanges.popleft() if len(exchanges) > 1 else exchanges[0]
+
+        if self.speed is not None:
+            await asyncio.sleep(exchange.elapsed / self.speed)
+
+        self.count += 1
+        return exchange.to_response()
+
+    async def close(self) -> None:
+        """Nothing to close, no connections are held."""
+        pass
+
+
+class RecordingSession(RecordingTransport):
+    """Deprecated alias of RecordingTransport, removed in the next release.
+
+    Args:
+        path: archive path, e.g. session.jsonl.gz.
+        session: recorded session, by default AsyncSession(impersonate='chrome').
+    """
+
+    def __init__(
+        self, path: str | pathlib.Path, session: AsyncSession[Any] | None = None
+    ) -> None:
+        warnings.warn(
+            'RecordingSession is deprecated, use RecordingTransport.',
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        super().__init__(path, CurlCffiTransport(session) if session else None)
+
+
+class ReplaySession(ReplayTransport):
+    """Deprecated alias of ReplayTransport, removed in the next release.
+
+    Args:
+        path: archive path, e.g. session.jsonl.gz.
+        speed: replay speed factor, 1 for original latencies, 10 for 10x faster,
+            None to answer immediately.
+    """
+
+    def __init__(self, path: str | pathlib.Path, speed: float | None = 1.0) -> None:
+        warnings.warn(
+            'ReplaySession is deprecated, use ReplayTransport.',
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        super().__init__(path, speed)
+
+
+async def replay_load(
+    path: str | pathlib.Path, client: 'AsyncClient', speed: float = 1.0
+) -> list[Response | BaseException]:
+    """Reproduce recorded load profile against the client.
+
+    Every recorded request is sent at its original start offset (divided by
+    speed) through client._send_request (recorded requests were already
+    coalesced), rebased on client base url and with the client crumb, e.g. to
+    profile the client against tests.fake_server.
+
+    Args:
+        path: archive path, e.g. session.jsonl.gz.
+        client: client sending the requests.
+        speed: replay speed factor, 1 for original pacing, 10 for 10x faster.
+
+    Returns: responses or raised exceptions in the recorded order.
+    """
+    if speed <= 0:
+        error(msg=f'Invalid {speed=}. Expected positive number.', err_cls=ValueError)
+
+    async def send(exchange: Exchange) -> Response:
+        params = dict(exchange.params)
+
+        if 'crumb' in params:
+            params['crumb'] = await client._get_crumb() or ''
+
+        url = f'{client._BASE_URL}{urlsplit(exchange.url).path}'
+        return await client._send_request(url, params or None)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    tasks = []
+
+    for exchange in read_archive(path):
+        delay = start + exchange.started / speed - loop.time()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        tasks.append(asyncio.create_task(send(exchange)))
+
+    return await asyncio.gather(*tasks, return_exceptions=True)
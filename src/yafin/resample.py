@@ -0,0 +1,230 @@
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import numpy.typing as npt
+
+from .utils import error, process_chart_to_arrays
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+INTERVAL_UNITS = {'m': 60, 'h': 3600, 'd': SECONDS_PER_DAY}
+
+_INTERVAL_PATTERN = re.compile(r'^(\d+)(m|h|d)$')
+
+
+def parse_interval(interval: str) -> int:
+    """Parse interval into number of seconds.
+
+    Args:
+        interval: number followed by unit m, h or d, e.g.: 1m, 15m, 1h, 1d.
+
+    Returns: interval length in seconds.
+    """
+    match = _INTERVAL_PATTERN.match(interval)
+
+    if not match or not int(match.group(1)):
+        error(
+            msg=f'Invalid {interval=}. Expected <number><unit> with units: '
+            f'{set(INTERVAL_UNITS)}',
+            err_cls=ValueError,
+        )
+
+    return int(match.group(1)) * INTERVAL_UNITS[match.group(2)]
+
+
+def get_utc_offsets(
+    timestamps: npt.NDArray[np.int64], tz_name: str, gmtoffset: int = 0
+) -> npt.NDArray[np.int64]:
+    """Get UTC offsets in seconds of the exchange timezone for each timestamp.
+
+    Offset is resolved once per local day (zoneinfo lookup only for unique days),
+    DST changes happen outside of trading hours.
+
+    Args:
+        timestamps: unix timestamps in seconds.
+        tz_name: exchange timezone name, e.g.: America/New_York.
+        gmtoffset: approximate offset in seconds used to find the local day.
+
+    Returns: UTC offset in seconds for each timestamp.
+    """
+    tz = ZoneInfo(tz_name)
+    days, inverse = np.unique(
+        (timestamps + gmtoffset) // SECONDS_PER_DAY, return_inverse=True
+    )
+    day_offsets = np.array(
+        [
+            datetime.fromtimestamp(
+                int(day) * SECONDS_PER_DAY + SECONDS_PER_DAY // 2, tz=timezone.utc
+            )
+            .astimezone(tz)
+            .utcoffset()
+            .total_seconds()  # type: ignore[union-attr]
+            for day in days
+        ],
+        dtype=np.int64,
+    )
+    return day_offsets[inverse.reshape(-1)]
+
+
+def _get_bin_starts(
+    timestamps: npt.NDArray[np.int64],
+    width: int,
+    offsets: npt.NDArray[np.int64],
+    session_open: int,
+) -> npt.NDArray[np.int64]:
+    """Get UTC start of the output bar for each input bar.
+
+    Intraday bins are anchored at the regular session open of every local day,
+    daily bins at the local midnight.
+    """
+    local = timestamps + offsets
+    local_day = local // SECONDS_PER_DAY
+
+    if width % SECONDS_PER_DAY == 0:
+        days = width // SECONDS_PER_DAY
+        return (local_day // days) * days * SECONDS_PER_DAY - offsets
+
+    since_open = local - local_day * SECONDS_PER_DAY - session_open
+    bin_local = (
+        local_day * SECONDS_PER_DAY + session_open + (since_open // width) * width
+    )
+    return bin_local - offsets
+
+
+def _first_valid(
+    values: npt.NDArray[np.float64], starts: npt.NDArray[np.intp], last: bool = False
+) -> npt.NDArray[np.float64]:
+    """Get first (or last) non NaN value of each group."""
+    n = len(values)
+    idx = np.arange(n)
+    valid = np.isfinite(values)
+
+    if last:
+        pos = np.maximum.reduceat(np.where(valid, idx, -1), starts)
+        found = pos >= 0
+    else:
+        pos = np.minimum.reduceat(np.where(valid, idx, n), starts)
+        found = pos < n
+
+    result = np.full(len(starts), np.nan)
+    result[found] = values[pos[found]]
+    return result
+
+
+def resample_arrays(
+    arrays: dict[str, npt.NDArray[Any]],
+    interval: str,
+    tz_name: str = 'UTC',
+    session_open: int = 0,
+    session_close: int | None = None,
+    regular_only: bool = False,
+    gmtoffset: int = 0,
+) -> dict[str, npt.NDArray[Any]]:
+    """Aggregate chart columns into coarser OHLCV bars.
+
+    Args:
+        arrays: sorted chart columns, e.g. output of utils.process_chart_to_arrays.
+        interval: output interval, e.g.: 5m, 15m, 1h, 2h, 1d.
+        tz_name: exchange timezone name, e.g.: America/New_York.
+        session_open: regular session open as local seconds since midnight.
+        session_close: regular session close as local seconds since midnight.
+        regular_only: whether to drop bars outside of regular session.
+        gmtoffset: approximate exchange offset in seconds, speeds up day lookup.
+
+    Returns:
+        dict of numpy arrays with timestamp (UTC start of the bar), open, high,
+        low, close, volume, dividends and splits.
+    """
+    width = parse_interval(interval)
+    timestamps = arrays['timestamp'].astype(np.int64, copy=False)
+    offsets = get_utc_offsets(timestamps, tz_name, gmtoffset)
+
+    if regular_only:
+        local_sod = (timestamps + offsets) % SECONDS_PER_DAY
+        close = SECONDS_PER_DAY if session_close is None else session_close
+        mask = (local_sod >= session_open) & (local_sod < close)
+        arrays = {k: v[mask] for k, v in arrays.items()}
+        timestamps, offsets = timestamps[mask], offsets[mask]
+
+    if not len(timestamps):
+        return {k: v[:0].astype(np.float64) for k, v in arrays.items()} | {
+            'timestamp': timestamps
+        }
+
+    bin_starts = _get_bin_starts(timestamps, width, offsets, session_open)
+    starts = np.flatnonzero(np.r_[True, bin_starts[1:] != bin_starts[:-1]])
+
+    volume = np.nan_to_num(arrays['volume'].astype(np.float64))
+    splits = arrays['splits']
+    split_product = np.multiply.reduceat(np.where(splits > 0, splits, 1.0), starts)
+
+    return {
+        'timestamp': bin_starts[starts],
+        'open': _first_valid(arrays['open'], starts),
+        'high': np.fmax.reduceat(arrays['high'], starts),
+        'low': np.fmin.reduceat(arrays['low'], starts),
+        'close': _first_valid(arrays['close'], starts, last=True),
+        'volume': np.add.reduceat(volume, starts),
+        'dividends': np.add.reduceat(arrays['dividends'], starts),
+        'splits': np.where(split_product != 1.0, split_product, 0.0),
+    }
+
+
+def resample_chart(
+    chart: dict[str, Any], interval: str, regular_only: bool = False
+) -> dict[str, npt.NDArray[Any]]:
+    """Aggregate chart result into coarser OHLCV bars.
+
+    Session boundaries are taken from the chart meta exchange timezone and
+    regular trading period, so e.g. 1h bars of US equities start at 9:30, 10:30...
+
+    Args:
+        chart: chart result, e.g.: AsyncSymbol.get_chart().
+        interval: output interval, e.g.: 5m, 15m, 1h, 2h, 1d.
+        regular_only: whether to drop pre and post market bars.
+
+    Returns:
+        dict of numpy arrays with timestamp (UTC start of the bar), open, high,
+        low, close, volume, dividends and splits.
+    """
+    meta = chart['meta']
+    source_interval = meta.get('dataGranularity')
+    width = parse_interval(interval)
+
+    source_width = (
+        parse_interval(source_interval)
+        if source_interval and _INTERVAL_PATTERN.match(source_interval)
+        else None
+    )
+
+    if source_width is None or width < source_width or width % source_width:
+        error(
+            msg=f'Cannot resample {source_interval=} into {interval=}, '
+            'output interval must be a multiple of the source interval.',
+            err_cls=ValueError,
+        )
+
+    gmtoffset = meta.get('gmtoffset', 0)
+    regular = meta.get('currentTradingPeriod', {}).get('regular')
+
+    if regular:
+        session_open = (regular['start'] + regular['gmtoffset']) % SECONDS_PER_DAY
+        session_close = (regular['end'] + regular['gmtoffset']) % SECONDS_PER_DAY
+    else:
+        session_open, session_close = 0, None
+
+    return resample_arrays(
+        process_chart_to_arrays(chart),
+        interval,
+        tz_name=meta.get('exchangeTimezoneName', 'UTC'),
+        session_open=session_open,
+        session_close=session_close,
+        regular_only=regular_only,
+        gmtoffset=gmtoffset,
+    )
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from typing import Any
+from urllib.parse import urlsplit
+
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import HTTPError
+
+from .transport import ConnectionStats, CurlCffiTransport, PoolConfig, make_response
+from .utils import error
+
+logger = logging.getLogger(__name__)
+
+CRUMB_PATH = '/v1/test/getcrumb'
+
+STRATEGIES = {'round_robin', 'least_loaded'}
+
+
+class _Member(object):
+    """One session of the pool with its own cookie jar and matching crumb."""
+
+    def __init__(self, index: int, pool: PoolConfig | None) -> None:
+        self.index = index
+        self.transport = CurlCffiTransport(pool=pool)
+        self.crumb: str | None = None
+        self.in_flight = 0
+        self.throttled = 0
+        self.retired = False
+        self._crumb_lock = asyncio.Lock()
+
+    async def get_crumb(self, url: str) -> str:
+        """Fetch crumb once, concurrent callers wait for the first fetch."""
+        async with self._crumb_lock:
+            if not self.crumb:
+                crumb_url = f'{urlsplit(url).scheme}://{urlsplit(url).netloc}'
+                response = await self.transport.get(f'{crumb_url}{CRUMB_PATH}')
+                response.raise_for_status()  # type: ignore[no-untyped-call]
+                self.crumb = response.text
+
+        return self.crumb
+
+
+class SessionPool(object):
+    """Transport distributing requests over several independent sessions.
+
+    Yahoo throttles per cookie, so every session has its own cookie jar and
+    crumb (they have to match 1:1). Crumb param of the request is replaced by the
+    crumb of the chosen session. Session answered with HTTP 429 retire_after
+    times in a row is retired and replaced by a fresh one.
+
+    Args:
+        size: Number of sessions.
+        strategy: round_robin or least_loaded (fewest requests in flight).
+        retire_after: Number of consecutive HTTP 429 responses retiring session.
+        pool: Connection pool settings of every session.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        strategy: str = 'round_robin',
+        retire_after: int = 3,
+        pool: PoolConfig | None = None,
+    ) -> None:
+        if size < 1:
+            error(msg=f'Invalid {size=}. Expected positive number.', err_cls=ValueError)
+
+        if strategy not in STRATEGIES:
+            error(
+                msg=f'Invalid {strategy=}. Valid values: {STRATEGIES}',
+                err_cls=ValueError,
+            )
+
+        self.size = size
+        self.strategy = strategy
+        self.retire_after = retire_after
+        self.pool = pool
+        self.retired = 0
+        self._created = 0
+        self._next = 0
+        self._retired_stats = ConnectionStats()
+        self.members = [self._create_member() for _ in range(size)]
+
+    def _create_member(self) -> _Member:
+        member = _Member(self._created, self.pool)
+        self._created += 1
+        return member
+
+    @property
+    def stats(self) -> ConnectionStats:
+        """Connection reuse statistics summed over all sessions."""
+        stats = self._retired_stats
+
+        for member in self.members:
+            stats = stats + member.transport.stats
+
+        return stats
+
+    def _choose(self) -> _Member:
+        if self.strategy == 'least_loaded':
+            return min(self.members, key=lambda m: m.in_flight)
+
+        member = self.members[self._next % len(self.members)]
+        self._next += 1
+        return member
+
+    def _retire(self, member: _Member) -> bool:
+        if member.retired:
+            return False
+
+        logger.warning(
+            f'Retiring session {member.index} after {member.throttled} '
+            'throttled responses.'
+        )
+        member.retired = True
+        self.members[self.members.index(member)] = self._create_member()
+        self.retired += 1
+        self._retired_stats = self._retired_stats + member.transport.stats
+        return True
+
+    async def _send(
+        self, member: _Member, url: str, params: dict[str, Any] | None
+    ) -> Response:
+        is_crumb = urlsplit(url).path == CRUMB_PATH
+
+        if is_crumb or (params and 'crumb' in params):
+            try:
+                crumb = await member.get_crumb(url)
+
+            except HTTPError as e:
+                # failed crumb fetch (e.g. HTTP 429) is returned as the response,
+                # so it counts against the session as any other response
+                if e.response is None:
+                    raise
+
+                return e.response
+
+            if is_crumb:
+                return make_response(url, 200, {}, crumb.encode())
+
+            if params:
+                params = params | {'crumb': crumb}
+
+        return await member.transport.get(url, params)
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> Response:
+        """Send GET request with the chosen session and its crumb.
+
+        Args:
+            url: request url.
+            params: request query params.
+
+        Returns: response.
+        """
+        member = self._choose()
+        member.in_flight += 1
+
+        try:
+            response = await self._send(member, url, params)
+
+        finally:
+            member.in_flight -= 1
+
+            if member.retired and not member.in_flight:
+                await member.transport.close()
+
+        if response.status_code == 401:
+            member.crumb = None
+
+        if response.status_code == 429:
+            member.throttled += 1
+
+            retired = member.throttled >= self.retire_after and self._retire(member)
+
+            if retired and not member.in_flight:
+                await member.transport.close()
+
+        else:
+            member.throttled = 0
+
+        return response
+
+    async def warm_up(self, url: str, connections: int) -> None:
+        """Fetch crumbs of all sessions and spread connections over them.
+
+        Args:
+            url: url on the warmed host, should be cheap to answer.
+            connections: total number of connections to open.
+        """
+        per_member, rest = divmod(max(connections - self.size, 0), self.size)
+        await asyncio.gather(
+            *(m.get_crumb(url) for m in self.members),
+            *(
+                m.transport.warm_up(url, per_member + (i < rest))
+                for i, m in enumerate(self.members)
+                if per_member + (i < rest)
+            ),
+        )
+
+    async def close(self) -> None:
+        """Close all sessions."""
+        await asyncio.gather(*(m.transport.close() for m in self.members))
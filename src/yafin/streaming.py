@@ -0,0 +1,495 @@
+import asyncio
+import base64
+import json
+import logging
+import struct
+from collections import Counter
+from collections.abc import AsyncIterator
+from types import TracebackType
+from typing import Any, Type
+
+from curl_cffi.requests import AsyncSession, AsyncWebSocket
+
+from .utils import error
+
+logger = logging.getLogger(__name__)
+
+STREAMER_URL = 'wss://streamer.finance.yahoo.com/?version=2'
+
+OVERFLOW_POLICIES = {'block', 'drop_oldest'}
+
+MAX_RECONNECT_DELAY = 30.0
+
+# field number: (name, type) of the PricingData protobuf message
+PRICING_FIELDS: dict[int, tuple[str, str]] = {
+    1: ('id', 'string'),
+    2: ('price', 'float'),
+    3: ('time', 'sint64'),
+    4: ('currency', 'string'),
+    5: ('exchange', 'string'),
+    6: ('quote_type', 'int32'),
+    7: ('market_hours', 'int32'),
+    8: ('change_percent', 'float'),
+    9: ('day_volume', 'sint64'),
+    10: ('day_high', 'float'),
+    11: ('day_low', 'float'),
+    12: ('change', 'float'),
+    13: ('short_name', 'string'),
+    14: ('expire_date', 'sint64'),
+    15: ('open_price', 'float'),
+    16: ('previous_close', 'float'),
+    17: ('strike_price', 'float'),
+    18: ('underlying_symbol', 'string'),
+    19: ('open_interest', 'sint64'),
+    20: ('options_type', 'int32'),
+    21: ('mini_option', 'sint64'),
+    22: ('last_size', 'sint64'),
+    23: ('bid', 'float'),
+    24: ('bid_size', 'sint64'),
+    25: ('ask', 'float'),
+    26: ('ask_size', 'sint64'),
+    27: ('price_hint', 'sint64'),
+    28: ('vol_24hr', 'sint64'),
+    29: ('vol_all_currencies', 'sint64'),
+    30: ('from_currency', 'string'),
+    31: ('last_market', 'string'),
+    32: ('circulating_supply', 'double'),
+    33: ('market_cap', 'double'),
+}
+
+_FLOAT = struct.Struct('<f')
+_DOUBLE = struct.Struct('<d')
+
+_WIRE_TYPES = {'string': 2, 'float': 5, 'double': 1, 'sint64': 0, 'int32': 0}
+
+# tag (field number << 3 | wire type) of the known fields: (name, type)
+_TAGS = {
+    number << 3 | _WIRE_TYPES[typ]: (name, typ)
+    for number, (name, typ) in PRICING_FIELDS.items()
+}
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return result, pos
+
+        shift += 7
+
+
+def _skip_field(data: bytes, pos: int, wire_type: int) -> int:
+    if wire_type == 0:
+        return _read_varint(data, pos)[1]
+
+    if wire_type == 1:
+        return pos + 8
+
+    if wire_type == 2:
+        length, pos = _read_varint(data, pos)
+        return pos + length
+
+    if wire_type == 5:
+        return pos + 4
+
+    error(msg=f'Unsupported protobuf {wire_type=}.', err_cls=ValueError)
+    return pos
+
+
+def decode_pricing_data(data: bytes) -> dict[str, Any]:
+    """Decode PricingData protobuf message.
+
+    Hand-written decoder of the flat message, so no protobuf dependency and no
+    generated code is needed. Fields are looked up by the whole tag, unknown
+    fields are skipped.
+
+    Args:
+        data: serialized message.
+
+    Returns: decoded fields, e.g. {'id': 'META', 'price': 170.37, ...}.
+    """
+    result: dict[str, Any] = {}
+    pos = 0
+    end = len(data)
+    value: Any
+
+    while pos < end:
+        tag = data[pos]
+
+        if tag < 0x80:
+            pos += 1
+        else:
+            tag, pos = _read_varint(data, pos)
+
+        field = _TAGS.get(tag)
+
+        if field is None:
+            pos = _skip_field(data, pos, tag & 0x07)
+            continue
+
+        name, typ = field
+
+        if typ == 'float':
+            value = _FLOAT.unpack_from(data, pos)[0]
+            pos += 4
+        elif typ == 'string':
+            length, pos = _read_varint(data, pos)
+            value = data[pos : pos + length].decode()
+            pos += length
+        elif typ == 'double':
+            value = _DOUBLE.unpack_from(data, pos)[0]
+            pos += 8
+        else:
+            value, pos = _read_varint(data, pos)
+
+            if typ == 'sint64':
+                value = (value >> 1) ^ -(value & 1)
+            elif value >= 1 << 63:
+                value -= 1 << 64
+
+        result[name] = value
+
+    return result
+
+
+def decode_message(message: str) -> dict[str, Any]:
+    """Decode streamer message into pricing data.
+
+    Args:
+        message: base64 encoded PricingData, optionally wrapped in json
+            {"type": "pricing", "message": ...} as sent by version 2 of the API.
+
+    Returns: decoded pricing data, empty if the message is not pricing.
+    """
+    if message.startswith('{'):
+        wrapper = json.loads(message)
+
+        if wrapper.get('type') != 'pricing':
+            return {}
+
+        message = wrapper['message']
+
+    return decode_pricing_data(base64.b64decode(message))
+
+
+class StreamSubscription(object):
+    """Async iterator of pricing updates of the subscribed symbols.
+
+    Args:
+        streamer: Streamer delivering the updates.
+        symbols: Subscribed symbols.
+        queue_size: Max number of undelivered updates.
+    """
+
+    def __init__(
+        self, streamer: 'AsyncStreamer', symbols: frozenset[str], queue_size: int
+    ) -> None:
+        self.symbols = symbols
+        self.dropped = 0
+        self._streamer = streamer
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(queue_size)
+        self._closed = False
+
+    def _put_nowait(self, update: dict[str, Any] | None) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+
+        self._queue.put_nowait(update)
+
+    def _drop_pending(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def _put(self, update: dict[str, Any]) -> None:
+        if self._closed:
+            return
+
+        if self._streamer.overflow == 'block':
+            await self._queue.put(update)
+
+            # closed while waiting for the consumer
+            if self._closed:
+                self._drop_pending()
+        else:
+            self._put_nowait(update)
+
+    def _end(self, drop_pending: bool = True) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+
+        # only an empty queue can have a consumer waiting for the end marker, a
+        # non-empty one can have a blocked put, woken up by dropping the updates
+        if self._queue.empty():
+            self._queue.put_nowait(None)
+        elif drop_pending:
+            self._drop_pending()
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over updates until closed."""
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        """Wait for the next update."""
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+
+        update = await self._queue.get()
+
+        if update is None:
+            raise StopAsyncIteration
+
+        return update
+
+    async def close(self) -> None:
+        """Unsubscribe, symbols without subscribers are unsubscribed upstream."""
+        if self._closed:
+            return
+
+        self._end()
+        await self._streamer._unsubscribe(self)
+
+    async def __aenter__(self) -> 'StreamSubscription':
+        """Enter subscription context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Unsubscribe when leaving the context."""
+        await self.close()
+
+
+class AsyncStreamer(object):
+    """Client of Yahoo Finance pricing websocket.
+
+    One connection is shared by all subscriptions, symbols are subscribed and
+    unsubscribed upstream as subscriptions come and go. Decoded updates are fanned
+    out to bounded queues of the subscriptions. With block overflow, a full queue
+    pauses reading of the socket (backpressure), with drop_oldest the oldest
+    updates of the slow subscription are dropped. Lost connection is reopened
+    with all symbols subscribed again.
+
+    Args:
+        url: Streamer url, e.g. of a local stand-in.
+        session: Shared curl_cffi session, not closed by the streamer.
+        queue_size: Default max number of undelivered updates per subscription.
+        overflow: block or drop_oldest.
+        reconnect: Whether to reconnect after the connection is lost. Without
+            reconnect, lost connection ends all subscriptions and the next
+            subscribe opens a new connection.
+    """
+
+    def __init__(
+        self,
+        url: str = STREAMER_URL,
+        session: AsyncSession[Any] | None = None,
+        queue_size: int = 1000,
+        overflow: str = 'block',
+        reconnect: bool = True,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            error(
+                msg=f'Invalid {overflow=}. Valid values: {OVERFLOW_POLICIES}',
+                err_cls=ValueError,
+            )
+
+        self.url = url
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.reconnect = reconnect
+        self.messages = 0
+        self.reconnects = 0
+        self._owns_session = session is None
+        self._session = session
+        self._ws: AsyncWebSocket | None = None
+        self._symbols: Counter[str] = Counter()
+        self._subscriptions: set[StreamSubscription] = set()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def _connect(self) -> AsyncWebSocket:
+        if self._session is None:
+            self._session = AsyncSession(impersonate='chrome')
+
+        ws = await self._session.ws_connect(self.url)
+
+        if self._symbols:
+            await ws.send_json({'subscribe': sorted(self._symbols)})
+
+        return ws
+
+    async def connect(self) -> None:
+        """Open the connection, done by the first subscribe if not called."""
+        async with self._lock:
+            if self._ws is None:
+                self._ws = await self._connect()
+                self._task = asyncio.create_task(self._read_loop())
+
+    async def subscribe(
+        self, tickers: str, queue_size: int | None = None
+    ) -> StreamSubscription:
+        """Subscribe to pricing updates of the symbols.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            queue_size: Max number of undelivered updates, default queue_size
+                of the streamer.
+
+        Returns: subscription, async iterator of decoded pricing data.
+        """
+        symbols = frozenset(t.strip().upper() for t in tickers.split(',') if t.strip())
+
+        if not symbols:
+            error(msg=f'Invalid {tickers=}. Expected symbols.', err_cls=ValueError)
+
+        await self.connect()
+        subscription = StreamSubscription(self, symbols, queue_size or self.queue_size)
+        self._subscriptions.add(subscription)
+        new_symbols = sorted(s for s in symbols if not self._symbols[s])
+        self._symbols.update(symbols)
+
+        if new_symbols and self._ws is not None:
+            await self._ws.send_json({'subscribe': new_symbols})
+
+        return subscription
+
+    async def _unsubscribe(self, subscription: StreamSubscription) -> None:
+        self._subscriptions.discard(subscription)
+        self._symbols.subtract(subscription.symbols)
+        old_symbols = sorted(s for s in subscription.symbols if self._symbols[s] <= 0)
+
+        for symbol in old_symbols:
+            del self._symbols[symbol]
+
+        if old_symbols and self._ws is not None:
+            await self._ws.send_json({'unsubscribe': old_symbols})
+
+    async def _dispatch(self, message: str) -> None:
+        update = decode_message(message)
+        symbol = update.get('id')
+
+        if not symbol:
+            return
+
+        self.messages += 1
+
+        for subscription in list(self._subscriptions):
+            if symbol in subscription.symbols:
+                await subscription._put(update)
+
+    async def _read_messages(self) -> None:
+        delay = 0.0
+
+        while True:
+            try:
+                if self._ws is None:
+                    self._ws = await self._connect()
+                    self.reconnects += 1
+
+                message = await self._ws.recv_str()
+                delay = 0.0
+
+            except Exception as e:
+                if not self.reconnect:
+                    logger.error(f'Streamer connection lost: {e!r}')
+                    return
+
+                delay = min(max(delay * 2, 0.1), MAX_RECONNECT_DELAY)
+                logger.warning(f'Streamer connection lost: {e!r}, retry in {delay}s.')
+                await self._close_ws()
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                await self._dispatch(message)
+
+            except Exception as e:
+                logger.warning(f'Ignoring undecodable streamer message: {e!r}')
+
+    async def _read_loop(self) -> None:
+        drop_pending = False
+
+        try:
+            await self._read_messages()
+
+        except asyncio.CancelledError:
+            # cancelled by close, which closes the connection
+            drop_pending = True
+            raise
+
+        except Exception as e:
+            logger.error(f'Streamer read loop failed: {e!r}')
+
+        finally:
+            # pending updates are still delivered unless closed
+            for subscription in list(self._subscriptions):
+                subscription._end(drop_pending=drop_pending)
+
+            self._subscriptions.clear()
+            self._symbols.clear()
+
+        # connection lost for good, next subscribe opens a new one
+        self._task = None
+        await self._close_ws()
+
+    async def _close_ws(self) -> None:
+        """Close lost connection, releasing its curl handle."""
+        ws, self._ws = self._ws, None
+
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception as e:
+                logger.debug(f'Closing lost streamer connection failed: {e!r}')
+
+    async def close(self) -> None:
+        """Close all subscriptions and the connection."""
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        for subscription in list(self._subscriptions):
+            subscription._end()
+
+        self._subscriptions.clear()
+        self._symbols.clear()
+
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> 'AsyncStreamer':
+        """Open the connection."""
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Close the connection."""
+        await self.close()
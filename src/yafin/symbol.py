@@ -2,11 +2,10 @@ import logging
 from types import TracebackType
 from typing import Any, Type
 
-from typeguard import typechecked
-
 from .client import AsyncClient
 from .const import ALL_MODULES_CSV
-from .utils import get_types_with_frequency, log_args
+from .tracing import traced
+from .utils import get_types_with_frequency, log_args, typechecked
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +76,7 @@ class AsyncSymbol(object):
         await self.close()
 
     @log_args
+    @traced
     @typechecked
     async def get_chart(
         self,
@@ -111,6 +111,7 @@ class AsyncSymbol(object):
         return chart_json['chart']['result'][0]
 
     @log_args
+    @traced
     async def get_quote(self) -> dict[str, Any]:
         """Get quote for the ticker."""
         quote_json = await self.client.get_quote(self.ticker)
@@ -119,6 +120,7 @@ class AsyncSymbol(object):
         return quote_json['quoteResponse']['result'][0]
 
     @log_args
+    @traced
     async def get_quote_summary_all_modules(self) -> dict[str, Any]:
         """Get quote summary for all modules for the ticker."""
         quote_summary_json = await self.client.get_quote_summary(
@@ -127,37 +129,44 @@ class AsyncSymbol(object):
         return quote_summary_json['quoteSummary']['result'][0]
 
     @log_args
+    @traced
     async def _get_quote_summary_single_module(self, module: str) -> dict[str, Any]:
         quote_summary_json = await self.client.get_quote_summary(self.ticker, module)
         return quote_summary_json['quoteSummary']['result'][0][module]
 
     @log_args
+    @traced
     async def get_quote_type(self) -> dict[str, Any]:
         """Get quote type for the ticker."""
         return await self._get_quote_summary_single_module('quoteType')
 
     @log_args
+    @traced
     async def get_asset_profile(self) -> dict[str, Any]:
         """Get asset profile for the ticker."""
         return await self._get_quote_summary_single_module('assetProfile')
 
     @log_args
+    @traced
     async def get_summary_profile(self) -> dict[str, Any]:
         """Get summary profile for the ticker."""
         return await self._get_quote_summary_single_module('summaryProfile')
 
     @log_args
+    @traced
     async def get_summary_detail(self) -> dict[str, Any]:
         """Get summary detail for the ticker."""
         return await self._get_quote_summary_single_module('summaryDetail')
 
     @log_args
+    @traced
     async def get_income_statement_history(self) -> list[dict[str, Any]]:
         """Get income statement history for the ticker."""
         result = await self._get_quote_summary_single_module('incomeStatementHistory')
         return result['incomeStatementHistory']
 
     @log_args
+    @traced
     async def get_income_statement_history_quarterly(self) -> list[dict[str, Any]]:
         """Get income statement history quarterly for the ticker."""
         result = await self._get_quote_summary_single_module(
@@ -166,12 +175,14 @@ class AsyncSymbol(object):
         return result['incomeStatementHistory']
 
     @log_args
+    @traced
     async def get_balance_sheet_history(self) -> list[dict[str, Any]]:
         """Get balance sheet history for the ticker."""
         result = await self._get_quote_summary_single_module('balanceSheetHistory')
         return result['balanceSheetStatements']
 
     @log_args
+    @traced
     async def get_balance_sheet_history_quarterly(self) -> list[dict[str, Any]]:
         """Get balance sheet history quarterly for the ticker."""
         result = await self._get_quote_summary_single_module(
@@ -180,12 +191,14 @@ class AsyncSymbol(object):
         return result['balanceSheetStatements']
 
     @log_args
+    @traced
     async def get_cashflow_statement_history(self) -> list[dict[str, Any]]:
         """Get cashflow statement history for the ticker."""
         result = await self._get_quote_summary_single_module('cashflowStatementHistory')
         return result['cashflowStatements']
 
     @log_args
+    @traced
     async def get_cashflow_statement_history_quarterly(self) -> list[dict[str, Any]]:
         """Get cashflow statement history quarterly for the ticker."""
         result = await self._get_quote_summary_single_module(
@@ -194,124 +207,147 @@ class AsyncSymbol(object):
         return result['cashflowStatements']
 
     @log_args
+    @traced
     async def get_esg_scores(self) -> dict[str, Any]:
         """Get esg scores for the ticker."""
         return await self._get_quote_summary_single_module('esgScores')
 
     @log_args
+    @traced
     async def get_price(self) -> dict[str, Any]:
         """Get price data for the ticker."""
         return await self._get_quote_summary_single_module('price')
 
     @log_args
+    @traced
     async def get_default_key_statistics(self) -> dict[str, Any]:
         """Get default key statistics for the ticker."""
         return await self._get_quote_summary_single_module('defaultKeyStatistics')
 
     @log_args
+    @traced
     async def get_financial_data(self) -> dict[str, Any]:
         """Get financial data for the ticker."""
         return await self._get_quote_summary_single_module('financialData')
 
     @log_args
+    @traced
     async def get_calendar_events(self) -> dict[str, Any]:
         """Get calendar events for the ticker."""
         return await self._get_quote_summary_single_module('calendarEvents')
 
     @log_args
+    @traced
     async def get_sec_filings(self) -> dict[str, Any]:
         """Get sec filings for the ticker."""
         return await self._get_quote_summary_single_module('secFilings')
 
     @log_args
+    @traced
     async def get_upgrade_downgrade_history(self) -> list[dict[str, Any]]:
         """Get upgrade downgrade history for the ticker."""
         result = await self._get_quote_summary_single_module('upgradeDowngradeHistory')
         return result['history']
 
     @log_args
+    @traced
     async def get_institution_ownership(self) -> list[dict[str, Any]]:
         """Get institution ownership for the ticker."""
         result = await self._get_quote_summary_single_module('institutionOwnership')
         return result['ownershipList']
 
     @log_args
+    @traced
     async def get_fund_ownership(self) -> list[dict[str, Any]]:
         """Get fund ownership for the ticker."""
         result = await self._get_quote_summary_single_module('fundOwnership')
         return result['ownershipList']
 
     @log_args
+    @traced
     async def get_major_direct_holders(self) -> dict[str, Any]:
         """Get major direct holders for the ticker."""
         return await self._get_quote_summary_single_module('majorDirectHolders')
 
     @log_args
+    @traced
     async def get_major_holders_breakdown(self) -> dict[str, Any]:
         """Get major holders breakdown for the ticker."""
         return await self._get_quote_summary_single_module('majorHoldersBreakdown')
 
     @log_args
+    @traced
     async def get_insider_transactions(self) -> list[dict[str, Any]]:
         """Get insider transactions for the ticker."""
         result = await self._get_quote_summary_single_module('insiderTransactions')
         return result['transactions']
 
     @log_args
+    @traced
     async def get_insider_holders(self) -> list[dict[str, Any]]:
         """Get insider holders for the ticker."""
         result = await self._get_quote_summary_single_module('insiderHolders')
         return result['holders']
 
     @log_args
+    @traced
     async def get_net_share_purchase_activity(self) -> dict[str, Any]:
         """Get net share purchase activity for the ticker."""
         return await self._get_quote_summary_single_module('netSharePurchaseActivity')
 
     @log_args
+    @traced
     async def get_earnings(self) -> dict[str, Any]:
         """Get earnings for the ticker."""
         return await self._get_quote_summary_single_module('earnings')
 
     @log_args
+    @traced
     async def get_earnings_history(self) -> list[dict[str, Any]]:
         """Get earnings history for the ticker."""
         result = await self._get_quote_summary_single_module('earningsHistory')
         return result['history']
 
     @log_args
+    @traced
     async def get_earnings_trend(self) -> list[dict[str, Any]]:
         """Get earnings trend for the ticker."""
         result = await self._get_quote_summary_single_module('earningsTrend')
         return result['trend']
 
     @log_args
+    @traced
     async def get_industry_trend(self) -> dict[str, Any]:
         """Get industry trend for the ticker."""
         return await self._get_quote_summary_single_module('industryTrend')
 
     @log_args
+    @traced
     async def get_index_trend(self) -> dict[str, Any]:
         """Get index trend for the ticker."""
         return await self._get_quote_summary_single_module('indexTrend')
 
     @log_args
+    @traced
     async def get_sector_trend(self) -> dict[str, Any]:
         """Get sector trend for the ticker."""
         return await self._get_quote_summary_single_module('sectorTrend')
 
     @log_args
+    @traced
     async def get_recommendation_trend(self) -> list[dict[str, Any]]:
         """Get recommendation trend for the ticker."""
         result = await self._get_quote_summary_single_module('recommendationTrend')
         return result['trend']
 
     @log_args
+    @traced
     async def get_page_views(self) -> dict[str, Any]:
         """Get page views for the ticker."""
         return await self._get_quote_summary_single_module('pageViews')
 
     @log_args
+    @traced
     async def _get_financials(
         self,
         frequency: str,
@@ -326,6 +362,7 @@ class AsyncSymbol(object):
         return timeseries_json['timeseries']['result']
 
     @log_args
+    @traced
     async def get_income_statement(
         self,
         frequency: str,
@@ -346,6 +383,7 @@ class AsyncSymbol(object):
         )
 
     @log_args
+    @traced
     async def get_balance_sheet(
         self,
         frequency: str,
@@ -364,6 +402,7 @@ class AsyncSymbol(object):
         return await self._get_financials(frequency, 'balance_sheet', period1, period2)
 
     @log_args
+    @traced
     async def get_cash_flow(
         self,
         frequency: str,
@@ -382,23 +421,27 @@ class AsyncSymbol(object):
         return await self._get_financials(frequency, 'cash_flow', period1, period2)
 
     @log_args
+    @traced
     async def get_options(self) -> dict[str, Any]:
         """Get options data for the ticker."""
         options_json = await self.client.get_options(self.ticker)
         return options_json['optionChain']['result'][0]
 
     @log_args
+    @traced
     async def get_search(self) -> dict[str, Any]:
         """Get search results for the ticker."""
         return await self.client.get_search(self.ticker)
 
     @log_args
+    @traced
     async def get_recommendations(self) -> dict[str, Any]:
         """Get analyst recommendations for the ticker."""
         recommendations_json = await self.client.get_recommendations(self.ticker)
         return recommendations_json['finance']['result'][0]
 
     @log_args
+    @traced
     async def get_insights(self) -> dict[str, Any]:
         """Get news insights for the ticker."""
         insights_json = await self.client.get_insights(self.ticker)
@@ -0,0 +1,135 @@
+import inspect
+import logging
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import aclosing, contextmanager
+from functools import wraps
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = 'yafin'
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+# any object with OpenTelemetry compatible start_as_current_span method
+_tracer: Any = trace.get_tracer(TRACER_NAME) if trace else None
+
+
+def get_tracer() -> Any:
+    """Get tracer used for the spans, None if tracing is disabled."""
+    return _tracer
+
+
+def set_tracer(tracer: Any) -> None:
+    """Set tracer used for the spans.
+
+    Default is OpenTelemetry tracer (exporting to the configured SDK) if
+    opentelemetry-api is installed, else tracing is disabled.
+
+    Args:
+        tracer: OpenTelemetry compatible tracer, None disables tracing.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+@contextmanager
+def start_span(
+    name: str,
+    lazy_attributes: Callable[[], dict[str, Any]] | None = None,
+    **attributes: Any,
+) -> Iterator[Any]:
+    """Start span nested in the current one, no-op if tracing is disabled.
+
+    Args:
+        name: span name.
+        lazy_attributes: factory of span attributes expensive to compute, called
+            only if tracing is enabled.
+        attributes: span attributes, None values are skipped.
+
+    Yields: started span, None if tracing is disabled.
+    """
+    if _tracer is None:
+        yield None
+        return
+
+    if lazy_attributes is not None:
+        attributes |= lazy_attributes()
+
+    attributes = {f'yafin.{k}': v for k, v in attributes.items() if v is not None}
+
+    with _tracer.start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+def set_attributes(span: Any, **attributes: Any) -> None:
+    """Set attributes of the span, None values are skipped.
+
+    Args:
+        span: span started by start_span, None if tracing is disabled.
+        attributes: span attributes.
+    """
+    if span is None:
+        return
+
+    for key, value in attributes.items():
+        if value is not None:
+            span.set_attribute(f'yafin.{key}', value)
+
+
+def traced(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator wrapping async method into span with ticker attribute.
+
+    Ticker is taken from ticker or tickers argument or the ticker attribute of
+    the instance (AsyncSymbol). Span of async generator lasts until it is
+    exhausted or closed, the generator is closed together with the wrapper.
+    """
+    signature = inspect.signature(func)
+    ticker_arg = next(
+        (p for p in ('ticker', 'tickers') if p in signature.parameters), None
+    )
+
+    def get_ticker(self: Any, *args: Any, **kwargs: Any) -> Any:
+        ticker = getattr(self, 'ticker', None)
+
+        if ticker_arg:
+            bound = signature.bind_partial(self, *args, **kwargs)
+            ticker = bound.arguments.get(ticker_arg, ticker)
+
+        return ticker
+
+    if inspect.isasyncgenfunction(func):
+
+        @wraps(func)
+        async def async_gen_wrapper(
+            self: Any, *args: Any, **kwargs: Any
+        ) -> AsyncIterator[Any]:
+            async with aclosing(func(self, *args, **kwargs)) as agen:
+                if _tracer is None:
+                    async for item in agen:
+                        yield item
+
+                    return
+
+                name = f'{self.__class__.__name__}.{func.__name__}'
+
+                with start_span(name, ticker=get_ticker(self, *args, **kwargs)):
+                    async for item in agen:
+                        yield item
+
+        return async_gen_wrapper
+
+    @wraps(func)
+    async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if _tracer is None:
+            return await func(self, *args, **kwargs)
+
+        name = f'{self.__class__.__name__}.{func.__name__}'
+
+        with start_span(name, ticker=get_ticker(self, *args, **kwargs)):
+            return await func(self, *args, **kwargs)
+
+    return async_wrapper
@@ -0,0 +1,405 @@
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any, Protocol, runtime_checkable
+
+from curl_cffi import AsyncCurl, CurlHttpVersion, CurlInfo, CurlMOpt, CurlOpt
+from curl_cffi.requests import AsyncSession, Headers, Response
+
+try:
+    # private bindings, needed to set long options of the multi handle
+    from curl_cffi._wrapper import ffi, lib
+except ImportError:  # pragma: no cover
+    ffi = lib = None
+
+logger = logging.getLogger(__name__)
+
+CURLPIPE_NOTHING = 0
+CURLPIPE_MULTIPLEX = 2
+
+# connection count and phase timings collected for ConnectionStats and metrics
+CURL_INFOS = [
+    CurlInfo.NUM_CONNECTS,
+    CurlInfo.NAMELOOKUP_TIME,
+    CurlInfo.CONNECT_TIME,
+    CurlInfo.APPCONNECT_TIME,
+    CurlInfo.STARTTRANSFER_TIME,
+    CurlInfo.TOTAL_TIME,
+]
+
+HTTP_VERSIONS: dict[int, str] = {
+    CurlHttpVersion.V1_0: '1.0',
+    CurlHttpVersion.V1_1: '1.1',
+    CurlHttpVersion.V2_0: '2',
+    CurlHttpVersion.V3: '3',
+}
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """Interface of the http engine used by AsyncClient.
+
+    Implementations return curl_cffi Response, so the client and its error
+    handling (raise_for_status raising curl_cffi HTTPError) stay engine agnostic.
+    Responses of other engines can be converted with make_response.
+    """
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> Response:
+        """Send GET request.
+
+        Args:
+            url: request url.
+            params: request query params.
+
+        Returns: response.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Release connections held by the transport."""
+        ...
+
+
+def make_response(
+    url: str,
+    status_code: int,
+    headers: Mapping[str, str],
+    content: bytes,
+    elapsed: float = 0.0,
+) -> Response:
+    """Create curl_cffi response from the parts of other engine response.
+
+    Args:
+        url: request url.
+        status_code: http status code.
+        headers: response headers.
+        content: response body.
+        elapsed: seconds until the whole response was received.
+
+    Returns: curl_cffi response.
+    """
+    response = Response()
+    response.url = url
+    response.status_code = status_code
+    response.ok = status_code < 400
+
+    try:
+        response.reason = HTTPStatus(status_code).phrase
+    except ValueError:
+        response.reason = ''
+
+    response.headers = Headers(dict(headers))
+    response.content = content
+    response.elapsed = timedelta(seconds=elapsed)
+    response.download_size = len(content)
+    return response
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings of CurlCffiTransport.
+
+    Attributes:
+        max_clients: max requests in flight (curl handles) of the session.
+        max_connections: max open connections in total, None for unlimited.
+        max_host_connections: max open connections per host, None for unlimited.
+        max_idle_connections: max idle connections kept for reuse, None for curl
+            default (4 x max_clients).
+        http_version: e.g.: v1, v2, v2tls or v3, None for impersonated default.
+        multiplex: whether to multiplex requests over HTTP/2 connections.
+        wait_for_multiplex: whether new requests wait for a connection being
+            established to multiplex over it instead of opening another one.
+            Serializes requests to HTTP/1.1 hosts, enable for HTTP/2 only.
+        keep_alive: whether to reuse connections between requests.
+        keep_alive_idle: seconds before the first TCP keep-alive probe.
+        keep_alive_interval: seconds between TCP keep-alive probes.
+        max_connection_age: max seconds an idle connection is reused, None for
+            curl default.
+    """
+
+    max_clients: int = 10
+    max_connections: int | None = None
+    max_host_connections: int | None = None
+    max_idle_connections: int | None = None
+    http_version: str | None = None
+    multiplex: bool = True
+    wait_for_multiplex: bool = False
+    keep_alive: bool = True
+    keep_alive_idle: int = 60
+    keep_alive_interval: int = 60
+    max_connection_age: int | None = None
+
+    def get_session_kwargs(self) -> dict[str, Any]:
+        """Get AsyncSession arguments applying the settings per request."""
+        curl_options: dict[CurlOpt, int] = {
+            CurlOpt.PIPEWAIT: int(self.multiplex and self.wait_for_multiplex),
+            CurlOpt.FORBID_REUSE: int(not self.keep_alive),
+            CurlOpt.TCP_KEEPALIVE: int(self.keep_alive),
+        }
+
+        if self.keep_alive:
+            curl_options[CurlOpt.TCP_KEEPIDLE] = self.keep_alive_idle
+            curl_options[CurlOpt.TCP_KEEPINTVL] = self.keep_alive_interval
+
+        if self.max_connection_age is not None:
+            curl_options[CurlOpt.MAXAGE_CONN] = self.max_connection_age
+
+        kwargs: dict[str, Any] = {
+            'max_clients': self.max_clients,
+            'curl_options': curl_options,
+        }
+
+        if self.http_version:
+            kwargs['http_version'] = self.http_version
+
+        return kwargs
+
+    def get_multi_options(self) -> dict[CurlMOpt, int]:
+        """Get curl multi handle options applying the settings to the pool."""
+        options = {
+            CurlMOpt.PIPELINING: CURLPIPE_MULTIPLEX
+            if self.multiplex
+            else CURLPIPE_NOTHING,
+        }
+
+        if self.max_connections is not None:
+            options[CurlMOpt.MAX_TOTAL_CONNECTIONS] = self.max_connections
+
+        if self.max_host_connections is not None:
+            options[CurlMOpt.MAX_HOST_CONNECTIONS] = self.max_host_connections
+
+        if self.max_idle_connections is not None:
+            options[CurlMOpt.MAXCONNECTS] = self.max_idle_connections
+
+        return options
+
+
+def set_multi_option(acurl: AsyncCurl, option: CurlMOpt, value: int) -> None:
+    """Set long option of the curl multi handle.
+
+    AsyncCurl.setopt passes long options as a pointer, which curl_multi_setopt
+    reads as the value itself, so the limits are silently ignored.
+
+    Uses private curl_cffi bindings, if they are missing (other curl_cffi
+    version), the option is skipped and curl default is kept.
+
+    Args:
+        acurl: curl multi handle wrapper of the session.
+        option: curl multi option, e.g. CurlMOpt.MAX_HOST_CONNECTIONS.
+        value: option value.
+    """
+    curlm = getattr(acurl, '_curlm', None)
+
+    if lib is None or ffi is None or curlm is None:
+        logger.warning(
+            f'Setting {option!r}={value} is not supported by the installed '
+            'curl_cffi, keeping curl default.'
+        )
+        return
+
+    code = lib.curl_multi_setopt(curlm, option, ffi.cast('void *', value))
+
+    if code:
+        logger.warning(f'Setting {option!r}={value} failed with {code=}.')
+
+
+@dataclass
+class ConnectionStats:
+    """Connection reuse statistics of the transport.
+
+    Attributes:
+        requests: number of finished requests.
+        new_connections: number of connections opened by the requests.
+        requests_with_new_connection: number of requests, which opened a connection.
+        http_versions: number of requests per negotiated http version.
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+    requests_with_new_connection: int = 0
+    http_versions: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def reused_requests(self) -> int:
+        """Number of requests sent over an already open connection."""
+        return self.requests - self.requests_with_new_connection
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests sent over an already open connection."""
+        return self.reused_requests / self.requests if self.requests else 0.0
+
+    def __add__(self, other: 'ConnectionStats') -> 'ConnectionStats':
+        """Sum statistics of two transports."""
+        return ConnectionStats(
+            requests=self.requests + other.requests,
+            new_connections=self.new_connections + other.new_connections,
+            requests_with_new_connection=(
+                self.requests_with_new_connection + other.requests_with_new_connection
+            ),
+            http_versions=self.http_versions + other.http_versions,
+        )
+
+    def update(self, response: Response) -> None:
+        """Update statistics with the finished response."""
+        self.requests += 1
+        # curl_cffi stores infos keyed by CurlInfo, not str as annotated
+        connects = response.infos.get(CurlInfo.NUM_CONNECTS, 0)  # type: ignore[call-overload]
+        self.new_connections += connects
+        self.requests_with_new_connection += connects > 0
+        version = HTTP_VERSIONS.get(response.http_version, str(response.http_version))
+        self.http_versions[version] += 1
+
+    def __str__(self) -> str:
+        """Human readable one line summary."""
+        return (
+            f'{self.requests} requests, {self.new_connections} new connections, '
+            f'reuse_ratio={self.reuse_ratio:.1%}, '
+            f'http_versions={dict(self.http_versions)}'
+        )
+
+
+class CurlCffiTransport(object):
+    """Default transport, curl_cffi AsyncSession impersonating chrome.
+
+    Args:
+        session: Shared session, not closed by the transport. Pool settings are
+            applied to its multi handle too.
+        pool: Connection pool settings, default PoolConfig().
+        session_kwargs: AsyncSession arguments, used if session is not provided.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession[Any] | None = None,
+        pool: PoolConfig | None = None,
+        **session_kwargs: Any,
+    ) -> None:
+        self.pool = pool or PoolConfig()
+        self.stats = ConnectionStats()
+        self._owns_session = session is None
+        self._configured_acurl: Any = None
+        self.session = session or AsyncSession(
+            **(
+                {'impersonate': 'chrome'}
+                | self.pool.get_session_kwargs()
+                | session_kwargs
+            )
+        )
+
+        curl_infos = getattr(self.session, 'curl_infos', [])
+
+        for info in CURL_INFOS:
+            if info not in curl_infos:
+                curl_infos.append(info)
+
+    def _configure_pool(self) -> None:
+        """Apply pool settings to the multi handle, created with the event loop."""
+        acurl = self.session.acurl
+
+        if acurl is self._configured_acurl:
+            return
+
+        for option, value in self.pool.get_multi_options().items():
+            set_multi_option(acurl, option, value)
+
+        self._configured_acurl = acurl
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> Response:
+        """Send GET request with the session.
+
+        Args:
+            url: request url.
+            params: request query params.
+
+        Returns: response.
+        """
+        self._configure_pool()
+        response = await self.session.get(url, params=params)
+        self.stats.update(response)
+        return response
+
+    @asynccontextmanager
+    async def stream(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[Response]:
+        """Send GET request with the session, body is streamed.
+
+        Body is read in the context with response.aiter_content(), instead of
+        being buffered in response.content.
+
+        Args:
+            url: request url.
+            params: request query params.
+
+        Yields: response with headers, before the body is received.
+        """
+        self._configure_pool()
+
+        async with self.session.stream('GET', url, params=params) as response:
+            yield response
+
+        self.stats.update(response)
+
+    async def warm_up(self, url: str, connections: int) -> None:
+        """Open connections to the host of the url concurrently.
+
+        Connections are opened by HEAD requests, so no body is transferred. DNS is
+        resolved by the first connection and cached by curl. Responses are
+        ignored and their cookies discarded, so the session cookie stays paired
+        with the crumb.
+
+        Args:
+            url: url on the warmed host, should be cheap to answer and should not
+                need crumb, e.g. the base url.
+            connections: number of concurrent requests, each opens a connection
+                unless waiting for multiplexing over HTTP/2.
+        """
+        self._configure_pool()
+        responses = await asyncio.gather(
+            *(self.session.head(url, discard_cookies=True) for _ in range(connections)),
+            return_exceptions=True,
+        )
+
+        for response in responses:
+            if isinstance(response, BaseException):
+                logger.warning(f'Warming up connection failed: {response!r}')
+            else:
+                self.stats.update(response)
+
+    def get_cookies(self) -> list[dict[str, Any]]:
+        """Get cookies of the session, e.g. for CredentialStore."""
+        return [
+            {
+                'name': c.name,
+                'value': c.value,
+                'domain': c.domain,
+                'path': c.path,
+                'secure': c.secure,
+                'expires': c.expires,
+            }
+            for c in self.session.cookies.jar
+        ]
+
+    def set_cookies(self, cookies: list[dict[str, Any]]) -> None:
+        """Replace cookies of the session, e.g. loaded from CredentialStore."""
+        self.session.cookies.clear()
+
+        for c in cookies:
+            self.session.cookies.set(
+                c['name'],
+                c['value'],
+                domain=c.get('domain', ''),
+                path=c.get('path', '/'),
+                secure=c.get('secure', False),
+            )
+
+    async def close(self) -> None:
+        """Close the session if owned by the transport."""
+        if self._owns_session:
+            await self.session.close()
@@ -1,18 +1,25 @@
+import inspect
 import logging
-from collections.abc import Callable
+import os
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import aclosing
 from functools import wraps
 from typing import Any, NoReturn, Type
 from urllib.parse import urlencode
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
-from .const import FREQUENCIES, TYPES
+from .const import FREQUENCIES, TYPES, TYPES_WITH_FREQUENCY
 from .exceptions import TrailingBalanceSheetError
 
 logger = logging.getLogger(__name__)
 
 CHAR_LIMIT = 100
 
+TYPECHECK_ENV = 'YAFIN_TYPECHECK'
+
 
 def error(msg: str, err_cls: Type[Exception] = Exception) -> NoReturn:
     """Log error message and raise exception.
@@ -45,6 +52,42 @@ def encode_url(url: str, params: dict[str, str] | None = None) -> str:
     return f'{url}?{urlencode(params_copy)}'
 
 
+def join_csv(values: Iterable[str]) -> str:
+    """Join values into comma-separated string in canonical (sorted) order.
+
+    Args:
+        values: values, e.g. set of modules.
+
+    Returns: sorted unique values separated by comma.
+    """
+    return ','.join(sorted(set(values)))
+
+
+def canonicalize_params(params: dict[str, Any] | None) -> dict[str, str]:
+    """Get query params sorted by name with values as strings.
+
+    Args:
+        params: http request query parameters.
+
+    Returns: canonical params, same for the same logical request.
+    """
+    return {k: str(v) for k, v in sorted((params or {}).items())}
+
+
+def get_request_key(url: str, params: dict[str, Any] | None = None) -> str:
+    """Get stable cache key of the request.
+
+    Args:
+        url: request url or path.
+        params: http request query parameters, crumb is excluded.
+
+    Returns: url with canonical params, e.g. for response cache or replay.
+    """
+    params = canonicalize_params(params)
+    params.pop('crumb', None)
+    return f'{url}?{urlencode(params)}' if params else url
+
+
 def get_types_with_frequency(frequency: str, typ: str) -> str:
     """Enrich types with frequency.
 
@@ -74,9 +117,22 @@ def get_types_with_frequency(frequency: str, typ: str) -> str:
             err_cls=TrailingBalanceSheetError,
         )
 
-    types = TYPES[typ]
-    types_with_frequency = [f'{frequency}{t}' for t in types]
-    return ','.join(types_with_frequency)
+    return TYPES_WITH_FREQUENCY[(frequency, typ)]
+
+
+def typechecked(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator checking argument and return types with typeguard, opt-in.
+
+    Checks are applied only if YAFIN_TYPECHECK environment variable is set to 1,
+    true or yes when the decorated function is defined (module import), so the
+    default path has no overhead and typeguard is not required.
+    """
+    if os.environ.get(TYPECHECK_ENV, '').lower() not in {'1', 'true', 'yes'}:
+        return func
+
+    from typeguard import typechecked as typeguard_typechecked
+
+    return typeguard_typechecked(func)
 
 
 def _get_func_name_and_args(
@@ -102,10 +158,42 @@ def _get_func_name_and_args(
 
 
 def log_args(func: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator for logging functions and its' args, kwargs."""
+    """Decorator for logging functions and its' args, kwargs.
+
+    Async generators are logged with the number of yielded items instead of
+    the result and are closed together with the wrapper.
+    """
+    if inspect.isasyncgenfunction(func):
+
+        @wraps(func)
+        async def async_gen_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            async with aclosing(func(*args, **kwargs)) as agen:
+                if not logger.isEnabledFor(logging.DEBUG):
+                    async for item in agen:
+                        yield item
+
+                    return
+
+                func_name, args_copy = _get_func_name_and_args(func, args)
+                logger.debug(
+                    f'{func_name}() was called with args={args_copy} and {kwargs=}.'
+                )
+                items = 0
+
+                async for item in agen:
+                    items += 1
+                    yield item
+
+                logger.debug(f'{func_name} finished after {items} items.')
+
+        return async_gen_wrapper
 
     @wraps(func)
     async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        # formatting large results is expensive, skip it unless logged
+        if not logger.isEnabledFor(logging.DEBUG):
+            return await func(*args, **kwargs)
+
         func_name, args_copy = _get_func_name_and_args(func, args)
 
         logger.debug(f'{func_name}() was called with args={args_copy} and {kwargs=}.')
@@ -146,3 +234,119 @@ def process_chart_like_yfinance(chart: dict[str, Any]) -> pd.DataFrame:
         :,
         ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits'],
     ]
+
+
+YFINANCE_COLUMNS = {
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'volume': 'Volume',
+    'dividends': 'Dividends',
+    'splits': 'Stock Splits',
+}
+
+
+def _to_float_array(values: list[Any] | None, n: int) -> npt.NDArray[np.float64]:
+    """Convert list with possible None values into float array with NaN."""
+    if values is None:
+        return np.full(n, np.nan)
+
+    return np.array(values, dtype=np.float64)
+
+
+def _to_volume_array(values: list[Any] | None, n: int) -> npt.NDArray[Any]:
+    """Convert volumes into int array, or float array with NaN if None found."""
+    if values is None:
+        return np.full(n, np.nan)
+
+    try:
+        return np.array(values, dtype=np.int64)
+    except TypeError:
+        return np.array(values, dtype=np.float64)
+
+
+def _align_events(
+    timestamps: npt.NDArray[np.int64],
+    dates: npt.NDArray[np.int64],
+    values: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Align event values onto sorted timestamps with single sorted merge.
+
+    Args:
+        timestamps: sorted chart timestamps.
+        dates: event dates.
+        values: event values.
+
+    Returns: array of event values for each timestamp, 0 where no event.
+    """
+    aligned = np.zeros(len(timestamps), dtype=np.float64)
+
+    if not len(dates) or not len(timestamps):
+        return aligned
+
+    idx = np.searchsorted(timestamps, dates)
+    in_bounds = idx < len(timestamps)
+    idx, dates, values = idx[in_bounds], dates[in_bounds], values[in_bounds]
+    matched = timestamps[idx] == dates
+    aligned[idx[matched]] = values[matched]
+    return aligned
+
+
+def process_chart_to_arrays(chart: dict[str, Any]) -> dict[str, npt.NDArray[Any]]:
+    """Process chart response json into numpy columns without pandas.
+
+    Dividends and splits are aligned onto the timestamp axis, bars without event
+    have 0, same as in process_chart_like_yfinance.
+
+    Args:
+        chart: chart result, e.g.: AsyncSymbol.get_chart().
+
+    Returns:
+        dict of numpy arrays with keys timestamp (int64 seconds), open, high, low,
+        close, volume, dividends and splits.
+    """
+    timestamps = np.array(chart.get('timestamp', []), dtype=np.int64)
+    n = len(timestamps)
+    quote = chart['indicators']['quote'][0] if n else {}
+    events = chart.get('events') or {}
+
+    dividends = list((events.get('dividends') or {}).values())
+    splits = list((events.get('splits') or {}).values())
+
+    return {
+        'timestamp': timestamps,
+        'open': _to_float_array(quote.get('open'), n),
+        'high': _to_float_array(quote.get('high'), n),
+        'low': _to_float_array(quote.get('low'), n),
+        'close': _to_float_array(quote.get('close'), n),
+        'volume': _to_volume_array(quote.get('volume'), n),
+        'dividends': _align_events(
+            timestamps,
+            np.array([d['date'] for d in dividends], dtype=np.int64),
+            np.array([d['amount'] for d in dividends], dtype=np.float64),
+        ),
+        'splits': _align_events(
+            timestamps,
+            np.array([s['date'] for s in splits], dtype=np.int64),
+            np.array(
+                [s['numerator'] / s['denominator'] for s in splits],
+                dtype=np.float64,
+            ),
+        ),
+    }
+
+
+def process_chart_like_yfinance_vectorised(chart: dict[str, Any]) -> pd.DataFrame:
+    """Process chart response json into pandas dataframe, exact as yfinance.
+
+    Same output as process_chart_like_yfinance, but the columns are processed as
+    numpy arrays and the dataframe is materialised only once at the end.
+    """
+    arrays = process_chart_to_arrays(chart)
+    index = pd.DatetimeIndex(
+        arrays.pop('timestamp').astype('datetime64[s]'), name='date'
+    )
+    return pd.DataFrame(
+        {YFINANCE_COLUMNS[k]: v for k, v in arrays.items()}, index=index, copy=False
+    )
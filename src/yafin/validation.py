@@ -0,0 +1,63 @@
+import logging
+from functools import lru_cache
+
+from .const import ALL_MODULES, ALL_TYPES, EVENTS
+from .utils import error, join_csv
+
+logger = logging.getLogger(__name__)
+
+CACHE_SIZE = 1024
+
+_VALID_VALUES: dict[str, frozenset[str]] = {
+    'modules': frozenset(ALL_MODULES),
+    'types': frozenset(ALL_TYPES),
+    'events': frozenset(EVENTS),
+}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_csv(name: str, value: str) -> str:
+    """Validate comma-separated values, results of valid inputs are memoised."""
+    valid = _VALID_VALUES[name]
+    parsed = frozenset(v.strip() for v in value.split(','))
+
+    if not parsed <= valid:
+        error(
+            msg=f'Invalid {name}={set(parsed - valid)}. Valid values: {set(valid)}',
+            err_cls=ValueError,
+        )
+
+    return join_csv(parsed)
+
+
+def validate_modules(modules: str) -> str:
+    """Validate quote summary modules.
+
+    Args:
+        modules: comma-separated modules, e.g. ALL_MODULES_CSV.
+
+    Returns: canonical comma-separated modules.
+    """
+    return _parse_csv('modules', modules)
+
+
+def validate_types(types: str) -> str:
+    """Validate timeseries types.
+
+    Args:
+        types: comma-separated types with frequency, e.g. annualEBIT.
+
+    Returns: canonical comma-separated types.
+    """
+    return _parse_csv('types', types)
+
+
+def validate_events(events: str | None) -> str | None:
+    """Validate chart events.
+
+    Args:
+        events: comma-separated events, e.g. div,split.
+
+    Returns: canonical comma-separated events, None if no events.
+    """
+    return _parse_csv('events', events) if events else None
@@ -0,0 +1,388 @@
+import argparse
+import asyncio
+import json
+import logging
+import pathlib
+import random
+import re
+import secrets
+import threading
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler
+from time import monotonic
+from types import TracebackType
+from typing import Any, Type
+from urllib.parse import parse_qs, urlsplit
+
+from yafin.const import TYPES
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_PATH = pathlib.Path(__file__).resolve().parent.joinpath('unit', 'fixtures')
+
+COOKIE_NAME = 'A3'
+
+Handler = Callable[[re.Match[str], dict[str, str]], tuple[int, bytes]]
+
+
+def _camel_to_snake(name: str) -> str:
+    return re.sub(r'([A-Z])', r'_\1', name).lower()
+
+
+def _error_body(key: str, code: str, description: str) -> bytes:
+    return json.dumps(
+        {key: {'result': None, 'error': {'code': code, 'description': description}}}
+    ).encode()
+
+
+class FakeYahooServer(object):
+    """Local stand-in for Yahoo Finance API serving the unit test fixtures.
+
+    Routes are the same as used by AsyncClient, so the client can be pointed at
+    the server with AsyncClient(base_url=server.url). Supports HTTP/1.1 keep-alive,
+    configurable latency, random errors, 429 throttling per cookie and crumb/cookie
+    checks as the real API.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on, 0 picks a free port.
+        latency: Base latency in seconds added to every response.
+        jitter: Max random latency in seconds added on top of latency.
+        error_rate: Probability of responding with HTTP 500.
+        rate_limit: Max requests per rate_window per cookie, None for unlimited.
+        rate_window: Throttling window in seconds.
+        check_crumb: Whether crumb protected endpoints require valid crumb/cookie.
+        unknown_tickers: Tickers responded with HTTP 404.
+        seed: Seed of the random generator for error rate and jitter.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: int | None = None,
+        rate_window: float = 1.0,
+        check_crumb: bool = True,
+        unknown_tickers: set[str] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.check_crumb = check_crumb
+        self.unknown_tickers = unknown_tickers or {'XXXXXXXX'}
+        self.stats: Counter[str] = Counter()
+        self.crumbs: dict[str, str] = {}
+        self._random = random.Random(seed)
+        self._request_times: dict[str, deque[float]] = defaultdict(deque)
+        self._fixtures: dict[str, bytes] = {}
+        self._server: asyncio.Server | None = None
+        self._routes: list[tuple[re.Pattern[str], Handler, bool]] = [
+            (re.compile(r'^/v1/test/getcrumb$'), self._crumb, False),
+            (re.compile(r'^/v8/finance/chart/([^/]+)$'), self._fixture('chart'), False),
+            (re.compile(r'^/v7/finance/quote$'), self._fixture('quotes'), True),
+            (
+                re.compile(r'^/v10/finance/quoteSummary/([^/]+)$'),
+                self._quote_summary,
+                True,
+            ),
+            (
+                re.compile(
+                    r'^/ws/fundamentals-timeseries/v1/finance/timeseries/([^/]+)$'
+                ),
+                self._timeseries,
+                False,
+            ),
+            (
+                re.compile(r'^/v7/finance/options/([^/]+)$'),
+                self._fixture('options'),
+                True,
+            ),
+            (re.compile(r'^/v1/finance/search$'), self._fixture('search'), False),
+            (
+                re.compile(r'^/v6/finance/recommendationsbysymbol/([^/]+)$'),
+                self._fixture('recommendations'),
+                False,
+            ),
+            (
+                re.compile(r'^/ws/insights/v2/finance/insights$'),
+                self._fixture('insights'),
+                False,
+            ),
+            (
+                re.compile(r'^/v6/finance/quote/marketSummary$'),
+                self._fixture('market_summaries'),
+                False,
+            ),
+            (
+                re.compile(r'^/v1/finance/trending/US$'),
+                self._fixture('trending'),
+                False,
+            ),
+            (
+                re.compile(r'^/v1/finance/currencies$'),
+                self._fixture('currencies'),
+                False,
+            ),
+        ]
+
+    @property
+    def url(self) -> str:
+        """Base url of the running server."""
+        return f'http://{self.host}:{self.port}'
+
+    async def start(self) -> None:
+        """Load fixtures into memory and start listening."""
+        for path in FIXTURES_PATH.glob('*.json'):
+            self._fixtures[path.stem] = path.read_bytes()
+
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.debug(f'Fake Yahoo Finance server listening on {self.url}.')
+
+    async def close(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> 'FakeYahooServer':
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Stop the server."""
+        await self.close()
+
+    def _fixture(self, name: str) -> Handler:
+        def handler(match: re.Match[str], params: dict[str, str]) -> tuple[int, bytes]:
+            return 200, self._fixtures[name]
+
+        return handler
+
+    def _crumb(self, match: re.Match[str], params: dict[str, str]) -> tuple[int, bytes]:
+        return 200, self.crumbs[params['_cookie']].encode()
+
+    def _quote_summary(
+        self, match: re.Match[str], params: dict[str, str]
+    ) -> tuple[int, bytes]:
+        modules = params.get('modules', '').split(',')
+        name = f'qs_{_camel_to_snake(modules[0])}'
+
+        if len(modules) > 1 or name not in self._fixtures:
+            name = 'qs_all_modules'
+
+        return 200, self._fixtures[name]
+
+    def _timeseries(
+        self, match: re.Match[str], params: dict[str, str]
+    ) -> tuple[int, bytes]:
+        typ = params.get('type', '').split(',')[0]
+        typ = re.sub(r'^(annual|quarterly|trailing)', '', typ)
+        name = next((k for k, v in TYPES.items() if typ in v), 'income_statement')
+        return 200, self._fixtures[f'ts_{name}']
+
+    def _is_throttled(self, cookie: str) -> bool:
+        if self.rate_limit is None:
+            return False
+
+        now = monotonic()
+        times = self._request_times[cookie]
+
+        while times and times[0] <= now - self.rate_window:
+            times.popleft()
+
+        if len(times) >= self.rate_limit:
+            return True
+
+        times.append(now)
+        return False
+
+    def _route(
+        self, path: str, params: dict[str, str], cookie: str | None
+    ) -> tuple[int, bytes, dict[str, str]]:
+        headers: dict[str, str] = {}
+
+        if cookie is None:
+            cookie = secrets.token_hex(8)
+            headers['Set-Cookie'] = f'{COOKIE_NAME}={cookie}; Path=/'
+
+        if cookie not in self.crumbs:
+            self.crumbs[cookie] = secrets.token_urlsafe(8)
+
+        params['_cookie'] = cookie
+
+        if self._is_throttled(cookie):
+            headers['Retry-After'] = str(int(self.rate_window) or 1)
+            return 429, b'Too Many Requests', headers
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            return 500, b'Internal Server Error', headers
+
+        for pattern, handler, requires_crumb in self._routes:
+            match = pattern.match(path)
+
+            if not match:
+                continue
+
+            ticker = match.group(1) if match.groups() else params.get('symbol')
+
+            if ticker and ticker.upper() in self.unknown_tickers:
+                body = _error_body(
+                    'finance', 'Not Found', 'No data found, symbol may be delisted'
+                )
+                return 404, body, headers
+
+            if (
+                requires_crumb
+                and self.check_crumb
+                and params.get('crumb') != self.crumbs[cookie]
+            ):
+                body = _error_body('finance', 'Unauthorized', 'Invalid Crumb')
+                return 401, body, headers
+
+            status, body = handler(match, params)
+            return status, body, headers
+
+        return 404, _error_body('finance', 'Not Found', 'HTTP 404 Not Found'), headers
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats['connections'] += 1
+
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                keep_alive = await self._handle_request(head, writer)
+
+                if not keep_alive:
+                    break
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head: bytes, writer: asyncio.StreamWriter) -> bool:
+        request_line, *header_lines = head.decode('latin-1').split('\r\n')
+        method, target, version = request_line.split(' ', 2)
+        headers = {}
+
+        for line in header_lines:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        cookies = SimpleCookie(headers.get('cookie', ''))
+        cookie = cookies[COOKIE_NAME].value if COOKIE_NAME in cookies else None
+        url = urlsplit(target)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        delay = self.latency + (self._random.random() * self.jitter)
+
+        if delay:
+            await asyncio.sleep(delay)
+
+        status, body, extra_headers = self._route(url.path, params, cookie)
+        self.stats['requests'] += 1
+        self.stats[method] += 1
+        self.stats[str(status)] += 1
+
+        keep_alive = headers.get('connection', '').lower() != 'close' and (
+            version == 'HTTP/1.1'
+        )
+        response_headers = {
+            'Content-Type': 'application/json;charset=utf-8',
+            'Content-Length': str(len(body)),
+            'Connection': 'keep-alive' if keep_alive else 'close',
+            **extra_headers,
+        }
+        reason = BaseHTTPRequestHandler.responses.get(status, ('',))[0]
+        response = f'HTTP/1.1 {status} {reason}\r\n' + ''.join(
+            f'{k}: {v}\r\n' for k, v in response_headers.items()
+        )
+        # response to HEAD has the headers of GET but no body
+        writer.write(
+            response.encode('latin-1') + b'\r\n' + (b'' if method == 'HEAD' else body)
+        )
+        await writer.drain()
+        return keep_alive
+
+
+@contextmanager
+def run_in_thread(**kwargs: Any) -> Iterator[FakeYahooServer]:
+    """Run FakeYahooServer in a background thread with its own event loop.
+
+    Keeps the server CPU time and event loop scheduling out of the benchmarked
+    client thread.
+
+    Args:
+        kwargs: FakeYahooServer arguments.
+
+    Yields: Started server.
+    """
+    server = FakeYahooServer(**kwargs)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    try:
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        yield server
+
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description='Fake Yahoo Finance API server.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, default=None)
+    parser.add_argument('--no-crumb-check', action='store_true')
+    args = parser.parse_args()
+
+    server = FakeYahooServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        check_crumb=not args.no_crumb_check,
+    )
+
+    async with server:
+        print(f'Serving on {server.url}, use AsyncClient(base_url="{server.url}").')
+        await asyncio.Event().wait()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
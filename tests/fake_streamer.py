@@ -0,0 +1,254 @@
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import struct
+from types import TracebackType
+from typing import Any, Type
+
+from yafin.streaming import PRICING_FIELDS
+
+logger = logging.getLogger(__name__)
+
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OPCODE_TEXT = 0x1
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+_FIELD_NUMBERS = {name: (number, typ) for number, (name, typ) in PRICING_FIELDS.items()}
+
+
+def _encode_varint(value: int) -> bytes:
+    value &= (1 << 64) - 1
+    result = bytearray()
+
+    while value >= 0x80:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    result.append(value)
+    return bytes(result)
+
+
+def encode_pricing_data(data: dict[str, Any]) -> bytes:
+    """Encode pricing data as PricingData protobuf message."""
+    result = bytearray()
+
+    for name, value in data.items():
+        number, typ = _FIELD_NUMBERS[name]
+
+        if typ == 'string':
+            encoded = value.encode()
+            result += _encode_varint(number << 3 | 2)
+            result += _encode_varint(len(encoded)) + encoded
+        elif typ == 'float':
+            result += _encode_varint(number << 3 | 5) + struct.pack('<f', value)
+        elif typ == 'double':
+            result += _encode_varint(number << 3 | 1) + struct.pack('<d', value)
+        elif typ == 'sint64':
+            zigzag = (value << 1) ^ (value >> 63)
+            result += _encode_varint(number << 3) + _encode_varint(zigzag)
+        else:
+            result += _encode_varint(number << 3) + _encode_varint(value)
+
+    return bytes(result)
+
+
+def encode_message(data: dict[str, Any], wrap: bool = True) -> str:
+    """Encode pricing data as sent by the streamer, wrapped in json by version 2."""
+    message = base64.b64encode(encode_pricing_data(data)).decode()
+    return json.dumps({'type': 'pricing', 'message': message}) if wrap else message
+
+
+def _frame(opcode: int, payload: bytes) -> bytes:
+    length = len(payload)
+
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+
+    return header + payload
+
+
+class FakeYahooStreamer(object):
+    """Local stand-in for Yahoo Finance pricing websocket.
+
+    Minimal RFC 6455 server, accepts subscribe/unsubscribe json messages and sends
+    published pricing data to the connections subscribed to the symbol.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on, 0 picks a free port.
+        wrap: Whether to wrap messages in json as version 2 of the API.
+    """
+
+    def __init__(
+        self, host: str = '127.0.0.1', port: int = 0, wrap: bool = True
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.wrap = wrap
+        self.connections = 0
+        self.received: list[dict[str, list[str]]] = []
+        self._writers: dict[asyncio.StreamWriter, set[str]] = {}
+        self._subscribed = asyncio.Condition()
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        """Url of the running server."""
+        return f'ws://{self.host}:{self.port}/'
+
+    @property
+    def symbols(self) -> set[str]:
+        """Symbols subscribed by any connection."""
+        return set().union(*self._writers.values())
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.debug(f'Fake Yahoo Finance streamer listening on {self.url}.')
+
+    async def close(self) -> None:
+        """Stop the server."""
+        self.drop_connections()
+
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> 'FakeYahooStreamer':
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Stop the server."""
+        await self.close()
+
+    async def wait_subscribed(self, symbols: set[str]) -> None:
+        """Wait until the symbols are subscribed (and no others)."""
+        async with self._subscribed:
+            await self._subscribed.wait_for(lambda: self.symbols == symbols)
+
+    async def publish(self, data: dict[str, Any]) -> int:
+        """Send pricing data to the subscribed connections.
+
+        Returns: number of connections the data was sent to.
+        """
+        frame = _frame(OPCODE_TEXT, encode_message(data, self.wrap).encode())
+        writers = [w for w, s in self._writers.items() if data['id'] in s]
+
+        for writer in writers:
+            writer.write(frame)
+            await writer.drain()
+
+        return len(writers)
+
+    async def send_raw(self, message: str) -> None:
+        """Send text message to all connections."""
+        for writer in self._writers:
+            writer.write(_frame(OPCODE_TEXT, message.encode()))
+            await writer.drain()
+
+    def drop_connections(self) -> None:
+        """Close all connections abruptly."""
+        for writer in list(self._writers):
+            writer.close()
+
+        self._writers.clear()
+
+    async def _handshake(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        head = await reader.readuntil(b'\r\n\r\n')
+        headers = {}
+
+        for line in head.decode('latin-1').split('\r\n')[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        key = headers['sec-websocket-key'] + WEBSOCKET_GUID
+        accept = base64.b64encode(hashlib.sha1(key.encode()).digest()).decode()
+        writer.write(
+            (
+                'HTTP/1.1 101 Switching Protocols\r\n'
+                'Upgrade: websocket\r\n'
+                'Connection: Upgrade\r\n'
+                f'Sec-WebSocket-Accept: {accept}\r\n\r\n'
+            ).encode('latin-1')
+        )
+        await writer.drain()
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> tuple[int, bytes]:
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+
+        if length == 126:
+            (length,) = struct.unpack('!H', await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack('!Q', await reader.readexactly(8))
+
+        mask = await reader.readexactly(4) if second & 0x80 else b'\x00' * 4
+        payload = await reader.readexactly(length)
+        return first & 0x0F, bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+    async def _on_message(self, writer: asyncio.StreamWriter, payload: bytes) -> None:
+        message = json.loads(payload)
+        self.received.append(message)
+        symbols = self._writers.get(writer)
+
+        if symbols is None:
+            return
+
+        symbols.update(message.get('subscribe', []))
+        symbols.difference_update(message.get('unsubscribe', []))
+
+        async with self._subscribed:
+            self._subscribed.notify_all()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+
+        try:
+            await self._handshake(reader, writer)
+            self._writers[writer] = set()
+
+            while True:
+                opcode, payload = await self._read_frame(reader)
+
+                if opcode == OPCODE_TEXT:
+                    await self._on_message(writer, payload)
+                elif opcode == OPCODE_PING:
+                    writer.write(_frame(OPCODE_PONG, payload))
+                elif opcode == OPCODE_CLOSE:
+                    writer.write(_frame(OPCODE_CLOSE, payload[:2]))
+                    break
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        finally:
+            self._writers.pop(writer, None)
+            writer.close()
+
+            async with self._subscribed:
+                self._subscribed.notify_all()
@@ -0,0 +1,70 @@
+import json
+import pathlib
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from tests.fake_server import FakeYahooServer, run_in_thread
+from tests.performance.utils import BenchmarkRecorder
+
+FIXTURES_PATH = (
+    pathlib.Path(__file__).resolve().parent.parent.joinpath('unit').joinpath('fixtures')
+)
+
+
+def scale_chart(chart: dict[str, Any], factor: int) -> dict[str, Any]:
+    """Repeat the chart bars and events factor times along the time axis.
+
+    Args:
+        chart: chart result.
+        factor: how many times the chart is repeated.
+
+    Returns: chart result with factor times more bars.
+    """
+    timestamps = chart['timestamp']
+    span = timestamps[-1] - timestamps[0] + 86400
+    quote = chart['indicators']['quote'][0]
+    events: dict[str, dict[str, Any]] = {}
+
+    for name, items in chart['events'].items():
+        events[name] = {}
+
+        for i in range(factor):
+            for item in items.values():
+                date = item['date'] + i * span
+                events[name][str(date)] = item | {'date': date}
+
+    return {
+        'meta': chart['meta'],
+        'timestamp': [t + i * span for i in range(factor) for t in timestamps],
+        'events': events,
+        'indicators': {
+            'quote': [{k: v * factor for k, v in quote.items()}],
+            'adjclose': [
+                {'adjclose': chart['indicators']['adjclose'][0]['adjclose'] * factor}
+            ],
+        },
+    }
+
+
+@pytest.fixture
+def chart_result() -> dict[str, Any]:
+    """Chart result with data for META, 1y, 1d."""
+    chart_json = json.loads(FIXTURES_PATH.joinpath('chart.json').read_text())
+    return chart_json['chart']['result'][0]
+
+
+@pytest.fixture(scope='session')
+def benchmark_recorder() -> Iterator[BenchmarkRecorder]:
+    """Session wide recorder storing all benchmark results into one JSON file."""
+    recorder = BenchmarkRecorder()
+    yield recorder
+    recorder.save()
+
+
+@pytest.fixture(scope='session')
+def fake_server() -> Iterator[FakeYahooServer]:
+    """Fake Yahoo Finance server running in a background thread."""
+    with run_in_thread() as server:
+        yield server
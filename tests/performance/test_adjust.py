@@ -0,0 +1,25 @@
+from time import perf_counter
+from typing import Any
+
+import pytest
+
+from tests.performance.conftest import scale_chart
+from yafin.adjust import adjust_charts
+
+
+@pytest.mark.performance
+class TestPerformanceAdjust:
+    """Performance benchmarks for yafin.adjust module."""
+
+    def test_adjust_charts(self, chart_result: dict[str, Any]) -> None:
+        """Benchmark adjusting a batch of thousand charts."""
+        charts = [
+            scale_chart(chart_result, 1) | {'meta': {'symbol': f'T{i}'}}
+            for i in range(1000)
+        ]
+        start = perf_counter()
+        adjusted = adjust_charts(charts)
+        elapsed = perf_counter() - start
+
+        print(f'\nadjust_charts 1000 charts x 250 bars: {elapsed * 1e3:.3f}ms')
+        assert len(adjusted) == 1000
@@ -0,0 +1,89 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from tests.fake_server import FakeYahooServer
+from tests.performance.utils import BenchmarkRecorder, run_async_benchmark
+from yafin import AsyncClient
+from yafin.const import ALL_MODULES_CSV
+from yafin.transport import CurlCffiTransport, Transport
+
+REQUESTS = 200
+CONCURRENCY = 10
+
+ENDPOINTS: dict[str, Callable[[AsyncClient], Awaitable[Any]]] = {
+    'get_chart': lambda c: c.get_chart('META', '1y', '1d'),
+    'get_quote': lambda c: c.get_quote('META'),
+    'get_quote_summary': lambda c: c.get_quote_summary('META', ALL_MODULES_CSV),
+    'get_timeseries': lambda c: c.get_timeseries('META', 'annualTotalRevenue'),
+    'get_options': lambda c: c.get_options('META'),
+    'get_search': lambda c: c.get_search('META'),
+    'get_recommendations': lambda c: c.get_recommendations('META'),
+    'get_insights': lambda c: c.get_insights('META'),
+    'get_market_summaries': lambda c: c.get_market_summaries(),
+    'get_trending': lambda c: c.get_trending(),
+    'get_currencies': lambda c: c.get_currencies(),
+}
+
+
+def create_httpx_transport() -> Transport:
+    """Create httpx transport, skip if httpx is not installed."""
+    pytest.importorskip('httpx')
+    from yafin.httpx_transport import HttpxTransport
+
+    return HttpxTransport()
+
+
+TRANSPORTS: dict[str, Callable[[], Transport]] = {
+    'curl_cffi': CurlCffiTransport,
+    'httpx': create_httpx_transport,
+}
+
+
+@pytest.mark.performance
+class TestPerformanceClient:
+    """Performance benchmarks for yafin.client module against fake server."""
+
+    @pytest.mark.parametrize('endpoint', sorted(ENDPOINTS))
+    @pytest.mark.asyncio
+    async def test_endpoint(
+        self,
+        endpoint: str,
+        fake_server: FakeYahooServer,
+        benchmark_recorder: BenchmarkRecorder,
+    ) -> None:
+        """Benchmark throughput, latency, CPU and memory of the endpoint."""
+        async with AsyncClient(base_url=fake_server.url) as client:
+            result = await run_async_benchmark(
+                f'AsyncClient.{endpoint}',
+                lambda: ENDPOINTS[endpoint](client),
+                requests=REQUESTS,
+                concurrency=CONCURRENCY,
+            )
+
+        benchmark_recorder.record(result)
+        assert not result.errors
+
+    @pytest.mark.parametrize('transport', sorted(TRANSPORTS))
+    @pytest.mark.asyncio
+    async def test_transport(
+        self,
+        transport: str,
+        fake_server: FakeYahooServer,
+        benchmark_recorder: BenchmarkRecorder,
+    ) -> None:
+        """Benchmark get_chart with different http engines."""
+        engine = TRANSPORTS[transport]()
+
+        async with AsyncClient(base_url=fake_server.url, transport=engine) as client:
+            result = await run_async_benchmark(
+                f'Transport.{transport}.get_chart',
+                lambda: client.get_chart('META', '1y', '1d'),
+                requests=REQUESTS,
+                concurrency=CONCURRENCY,
+            )
+
+        await engine.close()
+        benchmark_recorder.record(result)
+        assert not result.errors
@@ -0,0 +1,190 @@
+import inspect
+import json
+from typing import Any
+
+import pytest
+from typeguard import typechecked as typeguard_typechecked
+
+from tests.fake_streamer import encode_message
+from tests.performance.conftest import FIXTURES_PATH
+from tests.performance.utils import (
+    BenchmarkRecorder,
+    run_coroutine,
+    run_micro_benchmark,
+)
+from yafin import AsyncClient, AsyncSymbol
+from yafin.const import ALL_MODULES, ALL_MODULES_CSV, ALL_TYPES, EVENTS
+from yafin.streaming import decode_message
+from yafin.utils import (
+    _get_func_name_and_args,
+    encode_url,
+    get_types_with_frequency,
+    log_args,
+    process_chart_like_yfinance,
+    process_chart_like_yfinance_vectorised,
+)
+from yafin.validation import validate_events, validate_modules, validate_types
+
+CHART_PARAMS = AsyncClient._DEFAULT_PARAMS | {
+    'range': '1y',
+    'interval': '1d',
+    'events': 'div,split',
+    'crumb': 'crumb',
+}
+
+
+class _StubClient(object):
+    """Client returning the chart without any I/O."""
+
+    def __init__(self, chart_json: dict[str, Any]) -> None:
+        self.chart_json = chart_json
+
+    async def get_chart(self, *args: Any) -> dict[str, Any]:
+        return self.chart_json
+
+
+@pytest.mark.performance
+class TestPerformanceMicro:
+    """Micro benchmarks for CPU hot paths, run offline on fixtures."""
+
+    @pytest.fixture
+    def chart_json(self) -> dict[str, Any]:
+        """Chart response json with data for META, 1y, 1d."""
+        return json.loads(FIXTURES_PATH.joinpath('chart.json').read_text())
+
+    def test_encode_url(self, benchmark_recorder: BenchmarkRecorder) -> None:
+        """Benchmark encode_url with crumb redaction."""
+        url = f'{AsyncClient._BASE_URL}/v8/finance/chart/META'
+        benchmark_recorder.record(
+            run_micro_benchmark('encode_url', lambda: encode_url(url, CHART_PARAMS))
+        )
+
+    def test_get_func_name_and_args(
+        self, benchmark_recorder: BenchmarkRecorder
+    ) -> None:
+        """Benchmark _get_func_name_and_args for a method call."""
+        client = AsyncClient()
+        args = (client, 'META', '1y', '1d')
+        func = AsyncClient.get_chart.__wrapped__  # type: ignore[attr-defined]
+        benchmark_recorder.record(
+            run_micro_benchmark(
+                '_get_func_name_and_args',
+                lambda: _get_func_name_and_args(func, args),
+            )
+        )
+
+    def test_log_args(
+        self, benchmark_recorder: BenchmarkRecorder, chart_json: dict[str, Any]
+    ) -> None:
+        """Benchmark log_args overhead with large result and DEBUG disabled."""
+
+        async def get_chart() -> dict[str, Any]:
+            return chart_json
+
+        logged_get_chart = log_args(get_chart)
+        benchmark_recorder.record(
+            run_micro_benchmark('no_log_args', lambda: run_coroutine(get_chart()))
+        )
+        benchmark_recorder.record(
+            run_micro_benchmark('log_args', lambda: run_coroutine(logged_get_chart()))
+        )
+
+    def test_validation(self, benchmark_recorder: BenchmarkRecorder) -> None:
+        """Benchmark memoised validation of modules, types and events vs. uncached."""
+        types = get_types_with_frequency('annual', 'income_statement')
+
+        def validate_modules_uncached() -> bool:
+            return {m.strip() for m in ALL_MODULES_CSV.split(',')} <= ALL_MODULES
+
+        def validate_types_uncached() -> bool:
+            return {t.strip() for t in types.split(',')} <= ALL_TYPES
+
+        def validate_events_uncached() -> bool:
+            return {e.strip() for e in 'div,split'.split(',')} <= EVENTS
+
+        for name, func in [
+            ('validate_modules_uncached', validate_modules_uncached),
+            ('validate_modules', lambda: validate_modules(ALL_MODULES_CSV)),
+            ('validate_types_uncached', validate_types_uncached),
+            ('validate_types', lambda: validate_types(types)),
+            ('validate_events_uncached', validate_events_uncached),
+            ('validate_events', lambda: validate_events('div,split')),
+            (
+                'get_types_with_frequency',
+                lambda: get_types_with_frequency('annual', 'income_statement'),
+            ),
+        ]:
+            benchmark_recorder.record(run_micro_benchmark(name, func))
+
+    def test_typeguard(
+        self, benchmark_recorder: BenchmarkRecorder, chart_json: dict[str, Any]
+    ) -> None:
+        """Benchmark AsyncSymbol.get_chart with opt-in typeguard checks and without."""
+        symbol = AsyncSymbol('META')
+        symbol._open_client = _StubClient(chart_json)  # type: ignore[assignment]
+        get_chart = inspect.unwrap(AsyncSymbol.get_chart)
+        get_chart_checked = typeguard_typechecked(get_chart)
+
+        def call() -> Any:
+            return run_coroutine(get_chart(symbol, '1y', '1d'))
+
+        def call_checked() -> Any:
+            return run_coroutine(get_chart_checked(symbol, '1y', '1d'))
+
+        benchmark_recorder.record(
+            run_micro_benchmark('AsyncSymbol.get_chart_typechecked', call_checked)
+        )
+        benchmark_recorder.record(run_micro_benchmark('AsyncSymbol.get_chart', call))
+
+    @pytest.mark.parametrize(
+        'fixture', ['chart', 'quotes', 'options', 'insights', 'qs_all_modules']
+    )
+    def test_json_decoding(
+        self, benchmark_recorder: BenchmarkRecorder, fixture: str
+    ) -> None:
+        """Benchmark JSON decoding of the response bodies."""
+        content = FIXTURES_PATH.joinpath(f'{fixture}.json').read_bytes()
+        benchmark_recorder.record(
+            run_micro_benchmark(f'json_loads_{fixture}', lambda: json.loads(content))
+        )
+
+    def test_streamer_decoding(self, benchmark_recorder: BenchmarkRecorder) -> None:
+        """Benchmark decoding of the streamer pricing message."""
+        message = encode_message(
+            {
+                'id': 'META',
+                'price': 170.37,
+                'time': 1700000000000,
+                'currency': 'USD',
+                'exchange': 'NMS',
+                'quote_type': 8,
+                'market_hours': 1,
+                'change_percent': -0.57,
+                'day_volume': 12345678,
+                'day_high': 172.1,
+                'day_low': 169.8,
+                'change': -0.98,
+                'price_hint': 2,
+            }
+        )
+        benchmark_recorder.record(
+            run_micro_benchmark('decode_message', lambda: decode_message(message))
+        )
+
+    def test_process_chart(
+        self, benchmark_recorder: BenchmarkRecorder, chart_json: dict[str, Any]
+    ) -> None:
+        """Benchmark processing of the chart into dataframe."""
+        chart = chart_json['chart']['result'][0]
+        benchmark_recorder.record(
+            run_micro_benchmark(
+                'process_chart_like_yfinance',
+                lambda: process_chart_like_yfinance(chart),
+            )
+        )
+        benchmark_recorder.record(
+            run_micro_benchmark(
+                'process_chart_like_yfinance_vectorised',
+                lambda: process_chart_like_yfinance_vectorised(chart),
+            )
+        )
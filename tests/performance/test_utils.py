@@ -0,0 +1,54 @@
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from tests.performance.conftest import scale_chart
+from yafin.utils import (
+    process_chart_like_yfinance,
+    process_chart_like_yfinance_vectorised,
+    process_chart_to_arrays,
+)
+
+NRUNS = 20
+
+
+def best_time(func: Callable[..., Any], *args: Any, n: int = NRUNS) -> float:
+    """Best wall time in seconds out of n runs of the function."""
+    times = []
+
+    for _ in range(n):
+        start = perf_counter()
+        func(*args)
+        times.append(perf_counter() - start)
+
+    return min(times)
+
+
+@pytest.mark.performance
+class TestPerformanceUtils:
+    """Performance benchmarks for yafin.utils module."""
+
+    @pytest.mark.parametrize('factor', [1, 40, 400])
+    def test_process_chart_like_yfinance_vectorised(
+        self, chart_result: dict[str, Any], factor: int
+    ) -> None:
+        """Benchmark vectorised chart processing against the pandas join one."""
+        chart = scale_chart(chart_result, factor)
+        pd.testing.assert_frame_equal(
+            process_chart_like_yfinance_vectorised(chart),
+            process_chart_like_yfinance(chart),
+        )
+
+        current = best_time(process_chart_like_yfinance, chart)
+        vectorised = best_time(process_chart_like_yfinance_vectorised, chart)
+        arrays = best_time(process_chart_to_arrays, chart)
+        print(
+            f'\n{len(chart["timestamp"])} bars: '
+            f'process_chart_like_yfinance={current * 1e3:.3f}ms, '
+            f'process_chart_like_yfinance_vectorised={vectorised * 1e3:.3f}ms, '
+            f'process_chart_to_arrays={arrays * 1e3:.3f}ms'
+        )
+        assert vectorised < current
@@ -0,0 +1,265 @@
+import asyncio
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import asdict, dataclass
+from time import perf_counter, thread_time
+from typing import Any
+
+ROOT_PATH = pathlib.Path(__file__).resolve().parent.parent.parent
+
+BENCHMARK_OUTPUT_ENV = 'YAFIN_BENCHMARK_OUTPUT'
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of one benchmark, times in milliseconds and memory in KiB.
+
+    Peak memory is traced with memory_requests calls in flight at once.
+    """
+
+    name: str
+    requests: int
+    concurrency: int
+    errors: int
+    duration_s: float
+    requests_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    cpu_per_request_ms: float
+    peak_memory_kib: float
+
+    def __str__(self) -> str:
+        """Human readable one line summary."""
+        return (
+            f'{self.name}: {self.requests_per_s:.1f} req/s, '
+            f'p50={self.p50_ms:.2f}ms, p95={self.p95_ms:.2f}ms, '
+            f'p99={self.p99_ms:.2f}ms, cpu={self.cpu_per_request_ms:.3f}ms/req, '
+            f'peak_memory={self.peak_memory_kib:.0f}KiB, errors={self.errors}'
+        )
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+
+    rank = max(0, min(len(sorted_values) - 1, round(q * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def run_async_benchmark(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    requests: int = 200,
+    concurrency: int = 10,
+    warmup: int = 5,
+    memory_requests: int = 20,
+) -> BenchmarkResult:
+    """Run the coroutine function repeatedly with given concurrency.
+
+    CPU time is measured for the calling thread only, so a fake server running in
+    another thread (tests.fake_server.run_in_thread) is not accounted. Peak memory
+    is measured in a separate pass, because tracemalloc slows down the timed one.
+
+    Args:
+        name: Benchmark name.
+        func: Coroutine function without arguments, e.g. lambda: client.get_quote().
+        requests: Total number of calls.
+        concurrency: Max number of calls in flight.
+        warmup: Number of calls done before the measurement.
+        memory_requests: Number of calls in the peak memory pass.
+
+    Returns: Benchmark result.
+    """
+    for _ in range(warmup):
+        await func()
+
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed_call() -> None:
+        nonlocal errors
+
+        async with semaphore:
+            start = perf_counter()
+
+            try:
+                await func()
+            except Exception:
+                errors += 1
+
+            latencies.append(perf_counter() - start)
+
+    cpu_start = thread_time()
+    start = perf_counter()
+
+    await asyncio.gather(*(timed_call() for _ in range(requests)))
+
+    duration = perf_counter() - start
+    cpu = thread_time() - cpu_start
+
+    tracemalloc.start()
+    await asyncio.gather(*(func() for _ in range(memory_requests)))
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return BenchmarkResult(
+        name=name,
+        requests=requests,
+        concurrency=concurrency,
+        errors=errors,
+        duration_s=duration,
+        requests_per_s=requests / duration,
+        p50_ms=percentile(latencies, 0.50) * 1e3,
+        p95_ms=percentile(latencies, 0.95) * 1e3,
+        p99_ms=percentile(latencies, 0.99) * 1e3,
+        cpu_per_request_ms=cpu / requests * 1e3,
+        peak_memory_kib=peak_memory / 1024,
+    )
+
+
+@dataclass
+class MicroBenchmarkResult:
+    """Result of one micro benchmark.
+
+    CPython has no counter of allocations, so memory is reported as
+    peak_bytes_per_op, the peak traced memory during single call (incl. the
+    temporaries freed before it returns), and retained_blocks_per_op, the number
+    of memory blocks still allocated after a call in steady state (leaks and
+    growing caches, about 0 otherwise).
+    """
+
+    name: str
+    ops: int
+    ns_per_op: float
+    peak_bytes_per_op: float
+    retained_blocks_per_op: float
+
+    def __str__(self) -> str:
+        """Human readable one line summary."""
+        return (
+            f'{self.name}: {self.ns_per_op:,.0f} ns/op, '
+            f'{self.peak_bytes_per_op:,.0f} B/op peak, '
+            f'{self.retained_blocks_per_op:.2f} blocks/op retained'
+        )
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run coroutine, which never suspends, without event loop overhead."""
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+    coro.close()
+    raise RuntimeError('Coroutine suspended, use event loop instead.')
+
+
+def run_micro_benchmark(
+    name: str, func: Callable[[], Any], repeat: int = 5
+) -> MicroBenchmarkResult:
+    """Measure time and memory per call of the function.
+
+    Time is the best of repeat runs of timeit autorange. Peak memory of a call is
+    traced with tracemalloc and retained blocks are counted by
+    sys.getallocatedblocks, both in separate runs.
+
+    Args:
+        name: Benchmark name.
+        func: Function without arguments to benchmark.
+        repeat: Number of timing repetitions.
+
+    Returns: Micro benchmark result.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    func()  # warm up caches, so only steady state blocks are counted
+    blocks_before = sys.getallocatedblocks()
+
+    for _ in range(number):
+        func()
+
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return MicroBenchmarkResult(
+        name=name,
+        ops=number,
+        ns_per_op=best / number * 1e9,
+        peak_bytes_per_op=peak,
+        retained_blocks_per_op=retained_blocks / number,
+    )
+
+
+def get_commit() -> str:
+    """Get short hash of the current git commit, 'unknown' outside of git."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class BenchmarkRecorder(object):
+    """Collects benchmark results and stores them as JSON.
+
+    Output path is taken from YAFIN_BENCHMARK_OUTPUT env var, by default
+    .benchmarks/<commit>.json, so results of two commits can be compared with
+    scripts/compare_benchmarks.py.
+    """
+
+    def __init__(self) -> None:
+        self.results: dict[str, dict[str, Any]] = {}
+
+    def record(self, result: Any) -> None:
+        """Record result (dataclass) of a benchmark and print it."""
+        print(f'\n{result}')
+        self.results[result.name] = asdict(result)
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Path of the output JSON file."""
+        default = ROOT_PATH.joinpath('.benchmarks').joinpath(f'{get_commit()}.json')
+        return pathlib.Path(os.environ.get(BENCHMARK_OUTPUT_ENV, default))
+
+    def save(self) -> None:
+        """Merge results into the output JSON file."""
+        if not self.results:
+            return
+
+        path = self.path
+        data: dict[str, Any] = {'results': {}}
+
+        if path.exists():
+            data = json.loads(path.read_text())
+
+        data['commit'] = get_commit()
+        data['python'] = platform.python_version()
+        data['platform'] = platform.platform()
+        data['results'].update(self.results)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2))
+        print(f'\nBenchmark results stored in {path}.')
@@ -1,11 +1,15 @@
 import json
 import pathlib
+from importlib.util import find_spec
 from typing import Any
 
 import pytest
 
 FIXTURES_PATH = pathlib.Path(__file__).resolve().parent.joinpath('fixtures')
 
+# export tests require the optional parquet dependency
+collect_ignore = [] if find_spec('pyarrow') else ['test_export.py']
+
 
 @pytest.fixture
 def chart_json_mock() -> dict[str, Any]:
@@ -13,6 +17,12 @@ def chart_json_mock() -> dict[str, Any]:
     return json.loads(FIXTURES_PATH.joinpath('chart.json').read_text())
 
 
+@pytest.fixture
+def chart_split_json_mock() -> dict[str, Any]:
+    """Mock chart response json with data for NVDA around its 10:1 split."""
+    return json.loads(FIXTURES_PATH.joinpath('chart_split.json').read_text())
+
+
 @pytest.fixture
 def quote_json_mock() -> dict[str, Any]:
     """Mock get_quote response json with data for META."""
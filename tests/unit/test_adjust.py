@@ -0,0 +1,110 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from yafin.adjust import (
+    adjust_arrays,
+    adjust_chart,
+    adjust_charts,
+    get_dividend_factors,
+    get_split_factors,
+)
+
+
+class TestUnitAdjust:
+    """Unit tests for yafin.adjust module."""
+
+    @pytest.fixture
+    def arrays(self) -> dict[str, Any]:
+        """Chart columns with 2:1 split on 3rd bar and dividend 1 on 4th bar."""
+        return {
+            'timestamp': np.arange(5, dtype=np.int64),
+            'open': np.array([100.0, 100.0, 50.0, 50.0, 50.0]),
+            'high': np.array([100.0, 100.0, 50.0, 50.0, 50.0]),
+            'low': np.array([100.0, 100.0, 50.0, 50.0, 50.0]),
+            'close': np.array([100.0, 100.0, 50.0, 50.0, 50.0]),
+            'volume': np.array([10, 10, 20, 20, 20], dtype=np.int64),
+            'dividends': np.array([0.0, 0.0, 0.0, 1.0, 0.0]),
+            'splits': np.array([0.0, 0.0, 2.0, 0.0, 0.0]),
+        }
+
+    def test_get_split_factors(self) -> None:
+        """Test get_split_factors function."""
+        factors = get_split_factors(np.array([0.0, 2.0, 0.0, 3.0]))
+        np.testing.assert_allclose(factors, [1 / 6, 1 / 3, 1 / 3, 1.0])
+
+    def test_get_dividend_factors(self) -> None:
+        """Test get_dividend_factors function."""
+        factors = get_dividend_factors(
+            np.array([1.0, 0.0, 1.0]), np.array([10.0, 10.0, 9.0])
+        )
+        np.testing.assert_allclose(factors, [0.9, 0.9, 1.0])
+
+    def test_get_dividend_factors_missing_close(self) -> None:
+        """Test dividend after missing close uses the last valid close."""
+        factors = get_dividend_factors(
+            np.array([0.0, 0.0, 1.0]), np.array([10.0, np.nan, 9.0])
+        )
+        np.testing.assert_allclose(factors, [0.9, 0.9, 1.0])
+
+        factors = get_dividend_factors(np.array([0.0, 1.0]), np.array([np.nan, 9.0]))
+        np.testing.assert_allclose(factors, [1.0, 1.0])
+
+    def test_adjust_arrays_back(self, arrays: dict[str, Any]) -> None:
+        """Test adjust_arrays function with back adjustment."""
+        adjusted = adjust_arrays(arrays, adjust_splits=True)
+        np.testing.assert_allclose(
+            adjusted['close'], [49.0, 49.0, 49.0, 50.0, 50.0], rtol=1e-12
+        )
+        np.testing.assert_allclose(adjusted['volume'], [20, 20, 20, 20, 20])
+        np.testing.assert_allclose(adjusted['open'], adjusted['close'])
+        # input arrays are not modified
+        assert arrays['close'][0] == 100.0
+
+    def test_adjust_arrays_forward(self, arrays: dict[str, Any]) -> None:
+        """Test adjust_arrays function with forward adjustment."""
+        adjusted = adjust_arrays(arrays, method='forward', adjust_splits=True)
+        np.testing.assert_allclose(adjusted['close'][:3], [100.0, 100.0, 100.0])
+        np.testing.assert_allclose(adjusted['close'][3:], [100 / 0.98] * 2)
+        np.testing.assert_allclose(adjusted['volume'], [10, 10, 10, 10, 10])
+
+    def test_adjust_arrays_splits_only(self, arrays: dict[str, Any]) -> None:
+        """Test adjust_arrays function without dividend adjustment."""
+        adjusted = adjust_arrays(arrays, adjust_splits=True, adjust_dividends=False)
+        np.testing.assert_allclose(adjusted['close'], [50.0] * 5)
+
+    def test_adjust_arrays_invalid_method(self, arrays: dict[str, Any]) -> None:
+        """Test adjust_arrays function with invalid method."""
+        with pytest.raises(ValueError):
+            adjust_arrays(arrays, method='xxx')
+
+    def test_adjust_chart(self, chart_json_mock: dict[str, Any]) -> None:
+        """Test adjust_chart matches Yahoo adjclose for dividend adjustment."""
+        chart = chart_json_mock['chart']['result'][0]
+        adjusted = adjust_chart(chart)
+        np.testing.assert_allclose(
+            adjusted['close'], chart['indicators']['adjclose'][0]['adjclose'], rtol=1e-6
+        )
+
+    def test_adjust_chart_split(self, chart_split_json_mock: dict[str, Any]) -> None:
+        """Test split adjusted chart is not adjusted for the split again."""
+        chart = chart_split_json_mock['chart']['result'][0]
+        quote = chart['indicators']['quote'][0]
+        adjusted = adjust_chart(chart)
+
+        np.testing.assert_allclose(
+            adjusted['close'], chart['indicators']['adjclose'][0]['adjclose'], rtol=1e-6
+        )
+        np.testing.assert_allclose(adjusted['volume'], quote['volume'])
+        # pre-split bars are comparable with the post-split ones
+        assert adjusted['close'][4] == pytest.approx(adjusted['close'][5], rel=0.05)
+
+    def test_adjust_charts(self, chart_json_mock: dict[str, Any]) -> None:
+        """Test adjust_charts function."""
+        chart = chart_json_mock['chart']['result'][0]
+        adjusted = adjust_charts([chart], method='forward')
+        assert list(adjusted) == ['META']
+        assert adjusted['META']['close'][0] == pytest.approx(
+            chart['indicators']['quote'][0]['close'][0]
+        )
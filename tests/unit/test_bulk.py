@@ -0,0 +1,146 @@
+import json
+import pathlib
+from typing import Any, AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
+
+from tests.utils import mock_200_response
+from yafin import AsyncClient
+from yafin.bulk import BulkDownloader, BulkProgress, BulkUnit, Checkpoint, create_units
+
+
+class TestUnitBulk:
+    """Unit tests for yafin.bulk module."""
+
+    @pytest_asyncio.fixture
+    async def client(self) -> AsyncGenerator[AsyncClient, None]:
+        """Fixture for AsyncClient."""
+        async with AsyncClient() as client:
+            yield client
+
+    def test_bulk_unit(self) -> None:
+        """Test BulkUnit key is independent on params order."""
+        unit = BulkUnit.create(
+            'META', 'get_chart', {'interval': '1d', 'period_range': '1y'}
+        )
+        same_unit = BulkUnit.create(
+            'META', 'get_chart', {'period_range': '1y', 'interval': '1d'}
+        )
+        assert unit == same_unit
+        assert unit.key == 'get_chart|META|interval=1d&period_range=1y'
+        assert unit.file_name == same_unit.file_name
+
+    def test_bulk_unit_invalid_endpoint(self) -> None:
+        """Test BulkUnit with invalid endpoint."""
+        with pytest.raises(ValueError):
+            BulkUnit.create('META', 'get_xxx')
+
+    def test_checkpoint(self, tmp_path: pathlib.Path) -> None:
+        """Test Checkpoint persists statuses and last status wins."""
+        path = tmp_path.joinpath('checkpoint.jsonl')
+        meta = BulkUnit.create('META', 'get_options')
+        aapl = BulkUnit.create('AAPL', 'get_options')
+
+        checkpoint = Checkpoint(path)
+        checkpoint.mark(meta, 'failed', 'err')
+        checkpoint.mark(aapl, 'done')
+        checkpoint.mark(meta, 'done')
+
+        with path.open('a') as f:
+            f.write('{"key": "trunc')
+
+        reloaded = Checkpoint(path)
+        assert reloaded.is_done(meta)
+        assert reloaded.is_done(aapl)
+        assert not reloaded.failed
+
+    def test_progress(self) -> None:
+        """Test BulkProgress counters and eta."""
+        progress = BulkProgress(total=10, skipped=2, started=0.0)
+        assert progress.eta is None
+        progress.done = 3
+        progress.failed = 1
+        assert progress.finished == 4
+        assert progress.remaining == 4
+        assert progress.throughput > 0
+        assert progress.eta is not None
+        assert '6/10 units' in str(progress)
+
+    @pytest.mark.asyncio
+    async def test_run(
+        self,
+        client: AsyncClient,
+        mocker: MockerFixture,
+        tmp_path: pathlib.Path,
+        chart_json_mock: dict[str, Any],
+    ) -> None:
+        """Test run writes outputs and checkpoint."""
+        mock_200_response(mocker, chart_json_mock)
+        units = create_units(
+            ['META', 'AAPL', 'META'],
+            'get_chart',
+            {'period_range': '1y', 'interval': '1d'},
+        )
+        progress_reports: list[BulkProgress] = []
+        downloader = BulkDownloader(
+            client, tmp_path, on_progress=progress_reports.append, progress_every=1
+        )
+        progress = await downloader.run(units)
+
+        assert progress.total == 2
+        assert progress.done == 2
+        assert len(progress_reports) == 2
+
+        for unit in units:
+            output_path = downloader.get_output_path(unit)
+            assert json.loads(output_path.read_text()) == chart_json_mock
+
+    @pytest.mark.asyncio
+    async def test_run_resume(
+        self,
+        client: AsyncClient,
+        mocker: MockerFixture,
+        tmp_path: pathlib.Path,
+        options_json_mock: dict[str, Any],
+    ) -> None:
+        """Test run resumes only missing and failed units."""
+        units = create_units(['META', 'AAPL', 'MSFT'], 'get_options')
+        checkpoint = Checkpoint(tmp_path.joinpath('checkpoint.jsonl'))
+        checkpoint.mark(units[0], 'done')
+        checkpoint.mark(units[1], 'failed', 'err')
+
+        mock_200_response(mocker, options_json_mock)
+        downloader = BulkDownloader(client, tmp_path, concurrency=2)
+        progress = await downloader.run(units)
+
+        assert progress.skipped == 1
+        assert progress.done == 2
+        assert not downloader.get_output_path(units[0]).exists()
+        assert downloader.get_output_path(units[1]).exists()
+        assert downloader.get_output_path(units[2]).exists()
+
+    @pytest.mark.asyncio
+    async def test_run_failed(
+        self, client: AsyncClient, mocker: MockerFixture, tmp_path: pathlib.Path
+    ) -> None:
+        """Test run marks failed units in the checkpoint."""
+        mocker.patch(
+            'yafin.client.AsyncSession.get',
+            new=mocker.AsyncMock(side_effect=ConnectionError('boom')),
+        )
+        units = create_units(['META'], 'get_options')
+        downloader = BulkDownloader(client, tmp_path)
+        progress = await downloader.run(units)
+
+        assert progress.failed == 1
+        assert downloader.checkpoint.failed == {units[0].key}
+
+    def test_invalid_concurrency(self, tmp_path: pathlib.Path) -> None:
+        """Test BulkDownloader with invalid concurrency and progress_every."""
+        with pytest.raises(ValueError):
+            BulkDownloader(AsyncClient(), tmp_path, concurrency=0)
+
+        with pytest.raises(ValueError):
+            BulkDownloader(AsyncClient(), tmp_path, progress_every=0)
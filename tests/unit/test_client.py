@@ -1,8 +1,11 @@
+import json
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any, AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from curl_cffi.requests import AsyncSession, Response
 from curl_cffi.requests.exceptions import HTTPError
 from pytest_mock import MockerFixture
 
@@ -20,9 +23,11 @@ from tests.assertions import (
     assert_search,
     assert_trending_result,
 )
+from tests.fake_server import FakeYahooServer
 from tests.utils import mock_200_response, mock_404_response
 from yafin import AsyncClient
 from yafin.const import ALL_MODULES_CSV
+from yafin.transport import CurlCffiTransport, make_response
 from yafin.utils import get_types_with_frequency
 
 
@@ -30,23 +35,39 @@ class TestUnitClient:
     """Unit tests for yafin.client module."""
 
     @pytest.mark.asyncio
-    async def test_session(self) -> None:
-        """Test session attribute."""
+    async def test_transport(self) -> None:
+        """Test transport attribute."""
         client = AsyncClient()
-        assert client._open_session is None
+        assert client._open_transport is None
 
-        client._get_session()
-        assert client._open_session
-        assert client.session
+        client._get_transport()
+        assert isinstance(client._open_transport, CurlCffiTransport)
+        assert client.transport
 
         await client.close()
-        assert client._open_session is None
+        assert client._open_transport is None
 
         async with AsyncClient() as client:
-            assert client._open_session
-            assert client.session
+            assert client._open_transport
+            assert client.transport
 
-        assert client._open_session is None
+        assert client._open_transport is None
+
+    @pytest.mark.asyncio
+    async def test_session_injection(self) -> None:
+        """Test injected session is used and not closed by the client."""
+        session: AsyncSession[Any] = AsyncSession(impersonate='chrome')
+
+        async with AsyncClient(session=session) as client:
+            assert isinstance(client.transport, CurlCffiTransport)
+            assert client.transport.session is session
+
+        assert client._open_transport
+        assert session._closed is False
+        await session.close()
+
+        with pytest.raises(ValueError):
+            AsyncClient(session=session, transport=CurlCffiTransport())
 
     @pytest_asyncio.fixture
     async def client(self) -> AsyncGenerator[AsyncClient, None]:
@@ -132,6 +153,86 @@ class TestUnitClient:
         assert_response_json(chart, 'chart')
         assert_chart_result(chart['chart']['result'][0], kwargs['ticker'])
 
+    @pytest.mark.asyncio
+    async def test_canonical_params(
+        self,
+        client: AsyncClient,
+        mocker: MockerFixture,
+        chart_json_mock: dict[str, Any],
+    ) -> None:
+        """Test same logical request is sent with the same params in same order."""
+        mock_200_response(mocker, chart_json_mock)
+        get = AsyncSession.get
+
+        await client.get_chart('META', '1y', '1d', events='split, div')
+        await client.get_chart('META', '1y', '1d', events='div,split')
+        first, second = (c.kwargs['params'] for c in get.call_args_list)  # type: ignore[attr-defined]
+        assert list(first.items()) == list(second.items())
+        assert list(first) == sorted(first)
+        assert first['events'] == 'div,split'
+
+        await client.get_chart('META', '1y', '1d', events=None)
+        assert 'events' not in get.call_args.kwargs['params']  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_deprecated_session(self) -> None:
+        """Test deprecated session property returns the session of the transport."""
+        client = AsyncClient()
+
+        with pytest.deprecated_call():
+            session = client.session
+
+        assert isinstance(session, AsyncSession)
+        assert session is client.transport.session  # type: ignore[attr-defined]
+        await client.close()
+
+    def test_request_key(self, client: AsyncClient) -> None:
+        """Test request key of the endpoint is canonical and excludes crumb."""
+        key = client.request_key('get_chart', 'META', '1y', '1d', events='split, div')
+        assert key == client.request_key(
+            'get_chart', ticker='META', period_range='1y', interval='1d'
+        )
+        assert key.startswith(f'{client._BASE_URL}/v8/finance/chart/META?')
+        assert 'events=div%2Csplit' in key
+
+        assert 'crumb' not in client.request_key('get_quote', 'META')
+        assert client.request_key('stream_options', 'META') == client.request_key(
+            'get_options', 'META'
+        )
+        assert client.request_key(
+            'get_quote_summary', 'META', 'price,assetProfile'
+        ) == (client.request_key('get_quote_summary', 'META', 'assetProfile, price'))
+
+    def test_request_key_default_period(
+        self, client: AsyncClient, mocker: MockerFixture
+    ) -> None:
+        """Test request key of default timeseries period is stable over the day."""
+
+        class FakeDatetime(datetime):
+            now_values = iter([datetime(2025, 1, 2, 9, 30), datetime(2025, 1, 2, 17)])
+
+            @classmethod
+            def now(cls, tz: Any = None) -> 'FakeDatetime':
+                return cls.fromtimestamp(next(cls.now_values).timestamp())
+
+        mocker.patch('yafin.client.datetime', FakeDatetime)
+        morning = client.request_key('get_timeseries', 'META', 'annualNetIncome')
+        evening = client.request_key('get_timeseries', 'META', 'annualNetIncome')
+
+        assert morning == evening
+        period2 = int(datetime(2025, 1, 3).timestamp())
+        assert f'period2={period2}' in morning
+
+    @pytest.mark.parametrize(
+        'args', [('get_xxx', 'META'), ('get_chart', 'META', 'xxx', '1d')]
+    )
+    def test_request_key_invalid_args(
+        self, client: AsyncClient, args: tuple[str, ...]
+    ) -> None:
+        """Test request key of unknown method or invalid arguments."""
+        with pytest.raises(ValueError):
+            client.request_key(*args)
+
     @pytest.mark.parametrize(
         'kwargs',
         [
@@ -341,3 +442,61 @@ class TestUnitClient:
         currencies = await client.get_currencies()
         assert_response_json(currencies, 'currencies')
         assert_currencies_result(currencies['currencies']['result'])
+
+    @pytest.mark.asyncio
+    async def test_stream_options(self, options_json_mock: dict[str, Any]) -> None:
+        """Test contracts streamed from the fake server."""
+        options = options_json_mock['optionChain']['result'][0]['options'][0]
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                contracts = [c async for c in client.stream_options('META')]
+
+                with pytest.raises(HTTPError):
+                    [c async for c in client.stream_options('XXXXXXXX')]
+
+        assert contracts == [('calls', c) for c in options['calls']] + [
+            ('puts', p) for p in options['puts']
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_options_break(self, mocker: MockerFixture) -> None:
+        """Test response is closed when the stream is closed after early break."""
+        aclose = mocker.spy(Response, 'aclose')
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                async with aclosing(client.stream_options('META')) as contracts:
+                    async for _ in contracts:
+                        break
+
+                    aclose.assert_not_called()
+
+                aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_insights_buffered(
+        self, insights_json_mock: dict[str, Any]
+    ) -> None:
+        """Test transport without stream method falls back to buffered request."""
+
+        class _BufferedTransport(object):
+            async def get(
+                self, url: str, params: dict[str, Any] | None = None
+            ) -> Response:
+                return make_response(
+                    url, 200, {}, json.dumps(insights_json_mock).encode()
+                )
+
+            async def close(self) -> None:
+                pass
+
+        client = AsyncClient(transport=_BufferedTransport())
+        items = [i async for i in client.stream_insights('META')]
+        result = insights_json_mock['finance']['result']
+
+        assert [i for s, i in items if s == 'reports'] == result['reports']
+        assert {s for s, _ in items} == {'reports', 'sigDevs', 'secReports', 'events'}
+        assert len(items) == sum(
+            len(result[s]) for s in ('reports', 'sigDevs', 'secReports', 'events')
+        )
@@ -0,0 +1,124 @@
+import json
+import pathlib
+import stat
+
+import pytest
+
+from tests.assertions import assert_quotes
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient
+from yafin.credentials import CredentialStore
+
+
+class TestUnitCredentials:
+    """Unit tests for yafin.credentials module."""
+
+    def test_store(self, tmp_path: pathlib.Path) -> None:
+        """Test saving, loading and clearing credentials."""
+        path = tmp_path.joinpath('yafin', 'credentials.json')
+        store = CredentialStore(path, ttl=60)
+        cookies = [{'name': 'A3', 'value': 'x', 'domain': 'a.com', 'expires': None}]
+
+        assert store.load('a') is None
+
+        store.save('a', 'crumb', cookies)
+        credentials = store.load('a')
+        assert credentials is not None
+        assert credentials.crumb == 'crumb'
+        assert credentials.cookies == cookies
+        assert not credentials.expired
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+        store.clear('a')
+        assert store.load('a') is None
+
+    def test_store_expired(self, tmp_path: pathlib.Path) -> None:
+        """Test credentials expire with ttl or the earliest cookie."""
+        store = CredentialStore(tmp_path.joinpath('credentials.json'))
+
+        store.save('a', 'crumb', [{'name': 'A3', 'value': 'x', 'expires': 1}])
+        assert store.load('a') is None
+
+    @pytest.mark.parametrize('content', ['xxx', '[]', '{"a": {"xxx": 1}}'])
+    def test_store_invalid(self, tmp_path: pathlib.Path, content: str) -> None:
+        """Test corrupted store is ignored."""
+        path = tmp_path.joinpath('credentials.json')
+        path.write_text(content)
+        store = CredentialStore(path)
+
+        assert store.load('a') is None
+        store.save('b', 'crumb', [])
+        assert store.load('b') is not None
+
+    def test_store_invalid_args(self, tmp_path: pathlib.Path) -> None:
+        """Test CredentialStore with invalid ttl."""
+        with pytest.raises(ValueError):
+            CredentialStore(tmp_path.joinpath('credentials.json'), ttl=0)
+
+    @pytest.mark.asyncio
+    async def test_client_reuse(self, tmp_path: pathlib.Path) -> None:
+        """Test new client reuses stored cookie and crumb."""
+        store = CredentialStore(tmp_path.joinpath('credentials.json'))
+
+        async with FakeYahooServer(seed=0) as server:
+            for _ in range(2):
+                async with AsyncClient(
+                    base_url=server.url, credential_store=store
+                ) as client:
+                    assert_quotes(await client.get_quote('META'), 'META')
+
+        assert len(server.crumbs) == 1
+        assert server.stats['requests'] == 3
+        assert server.stats['401'] == 0
+
+    @pytest.mark.asyncio
+    async def test_client_refresh(self, tmp_path: pathlib.Path) -> None:
+        """Test rejected stored credentials are refreshed on HTTP 401."""
+        path = tmp_path.joinpath('credentials.json')
+        store = CredentialStore(path)
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(
+                base_url=server.url, credential_store=store
+            ) as client:
+                await client.get_quote('META')
+
+            data = json.loads(path.read_text())
+            data[server.url]['crumb'] = 'invalid'
+            path.write_text(json.dumps(data))
+
+            async with AsyncClient(
+                base_url=server.url, credential_store=store
+            ) as client:
+                assert_quotes(await client.get_quote('META'), 'META')
+                assert client._used_crumb != 'invalid'
+
+        credentials = store.load(server.url)
+        assert credentials is not None
+        assert credentials.crumb in server.crumbs.values()
+        assert len(server.crumbs) == 2
+        assert server.stats['401'] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_refresh_stream(self, tmp_path: pathlib.Path) -> None:
+        """Test streamed request is retried with fresh credentials on HTTP 401."""
+        path = tmp_path.joinpath('credentials.json')
+        store = CredentialStore(path)
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(
+                base_url=server.url, credential_store=store
+            ) as client:
+                await client.get_quote('META')
+
+            data = json.loads(path.read_text())
+            data[server.url]['crumb'] = 'invalid'
+            path.write_text(json.dumps(data))
+
+            async with AsyncClient(
+                base_url=server.url, credential_store=store
+            ) as client:
+                contracts = [c async for c in client.stream_options('META')]
+
+        assert len(contracts) == 368
+        assert server.stats['401'] == 1
@@ -0,0 +1,173 @@
+import pathlib
+from typing import Any
+
+import pyarrow.dataset as ds
+import pytest
+
+from yafin.export import (
+    CHART_SCHEMA,
+    TIMESERIES_SCHEMA,
+    chart_to_record_batch,
+    timeseries_to_record_batch,
+    write_chart_dataset,
+    write_timeseries_dataset,
+)
+
+
+class TestUnitExport:
+    """Unit tests for yafin.export module."""
+
+    def test_chart_to_record_batch(self, chart_json_mock: dict[str, Any]) -> None:
+        """Test chart_to_record_batch function."""
+        chart = chart_json_mock['chart']['result'][0]
+        batch = chart_to_record_batch(chart)
+
+        assert batch.schema == CHART_SCHEMA
+        assert batch.num_rows == len(chart['timestamp'])
+        expected_closes = chart['indicators']['quote'][0]['close']
+        assert batch.column('close').to_pylist() == expected_closes
+        assert set(batch.column('ticker').to_pylist()) == {'META'}
+
+        dividends = batch.column('dividends').to_pylist()
+        expected_dividends = {
+            d['date']: d['amount'] for d in chart['events']['dividends'].values()
+        }
+        assert sum(dividends) == pytest.approx(sum(expected_dividends.values()))
+        assert set(batch.column('splits').to_pylist()) == {0.0}
+
+    def test_chart_to_record_batch_splits(self) -> None:
+        """Test chart_to_record_batch function aligns splits onto timestamps."""
+        chart = {
+            'meta': {'symbol': 'META', 'dataGranularity': '1d'},
+            'timestamp': [1759843800, 1759930200, 1760016600],
+            'events': {
+                'splits': {
+                    '1759930200': {
+                        'date': 1759930200,
+                        'numerator': 4.0,
+                        'denominator': 1.0,
+                        'splitRatio': '4:1',
+                    },
+                },
+            },
+            'indicators': {
+                'quote': [
+                    {
+                        'open': [1.0, 2.0, 3.0],
+                        'high': [1.0, 2.0, 3.0],
+                        'low': [1.0, 2.0, 3.0],
+                        'close': [1.0, 2.0, None],
+                        'volume': [10, 20, None],
+                    }
+                ],
+            },
+        }
+        batch = chart_to_record_batch(chart)
+        assert batch.column('splits').to_pylist() == [0.0, 4.0, 0.0]
+        assert batch.column('dividends').to_pylist() == [0.0, 0.0, 0.0]
+        assert batch.column('close').null_count == 1
+        assert batch.column('adjclose').null_count == 3
+        assert batch.column('date').to_pylist() == [
+            '2025-10-07',
+            '2025-10-08',
+            '2025-10-09',
+        ]
+        assert batch.column('month').to_pylist() == ['2025-10'] * 3
+
+    def test_chart_to_record_batch_local_date(self) -> None:
+        """Test date is in the exchange timezone, not UTC."""
+        # 2025-10-07 22:00 UTC: after-hours in New York, next day in Tokyo
+        chart = {
+            'meta': {'symbol': 'META', 'dataGranularity': '1h'},
+            'timestamp': [1759874400],
+            'indicators': {
+                'quote': [
+                    {
+                        'open': [1.0],
+                        'high': [1.0],
+                        'low': [1.0],
+                        'close': [1.0],
+                        'volume': [1],
+                    }
+                ]
+            },
+        }
+        dates = {}
+
+        for timezone in ('America/New_York', 'Asia/Tokyo', None):
+            chart['meta']['exchangeTimezoneName'] = timezone  # type: ignore[index]
+            dates[timezone] = chart_to_record_batch(chart).column('date')[0].as_py()
+
+        assert dates == {
+            'America/New_York': '2025-10-07',
+            'Asia/Tokyo': '2025-10-08',
+            None: '2025-10-07',
+        }
+
+    def test_timeseries_to_record_batch(
+        self, timeseries_income_statement_json_mock: dict[str, Any]
+    ) -> None:
+        """Test timeseries_to_record_batch function."""
+        timeseries = timeseries_income_statement_json_mock['timeseries']['result']
+        batch = timeseries_to_record_batch(timeseries)
+
+        assert batch.schema == TIMESERIES_SCHEMA
+        expected_rows = sum(
+            len([i for i in r.get(r['meta']['type'][0]) or [] if i]) for r in timeseries
+        )
+        assert batch.num_rows == expected_rows
+
+    def test_write_chart_dataset(
+        self, tmp_path: pathlib.Path, chart_json_mock: dict[str, Any]
+    ) -> None:
+        """Test write_chart_dataset appends into partitioned dataset."""
+        chart = chart_json_mock['chart']['result'][0]
+        write_chart_dataset(chart, tmp_path)
+        write_chart_dataset([chart], tmp_path)
+
+        dataset = ds.dataset(tmp_path, format='parquet', partitioning='hive')
+        table = dataset.to_table()
+        assert table.num_rows == 2 * len(chart['timestamp'])
+        assert tmp_path.joinpath('ticker=META').joinpath('interval=1d').is_dir()
+
+    def test_write_long_chart_dataset(self, tmp_path: pathlib.Path) -> None:
+        """Test chart with more daily bars than pyarrow default max_partitions."""
+        n = 1300
+        timestamps = [1262615400 + i * 86400 for i in range(n)]
+        chart = {
+            'meta': {
+                'symbol': 'META',
+                'dataGranularity': '1d',
+                'exchangeTimezoneName': 'America/New_York',
+            },
+            'timestamp': timestamps,
+            'indicators': {
+                'quote': [
+                    {
+                        k: [1.0] * n if k != 'volume' else [1] * n
+                        for k in ('open', 'high', 'low', 'close', 'volume')
+                    }
+                ],
+            },
+        }
+        write_chart_dataset(chart, tmp_path)
+
+        dataset = ds.dataset(tmp_path, format='parquet', partitioning='hive')
+        table = dataset.to_table()
+        assert table.num_rows == n
+        assert len(set(table.column('date').to_pylist())) == n
+        assert tmp_path.joinpath('ticker=META', 'interval=1d', 'month=2010-01').is_dir()
+
+    def test_write_timeseries_dataset(
+        self,
+        tmp_path: pathlib.Path,
+        timeseries_income_statement_json_mock: dict[str, Any],
+    ) -> None:
+        """Test write_timeseries_dataset writes partitioned dataset."""
+        timeseries = timeseries_income_statement_json_mock['timeseries']['result']
+        write_timeseries_dataset(timeseries, tmp_path)
+        write_timeseries_dataset([], tmp_path)
+
+        dataset = ds.dataset(tmp_path, format='parquet', partitioning='hive')
+        table = dataset.to_table()
+        assert table.num_rows == timeseries_to_record_batch(timeseries).num_rows
@@ -0,0 +1,161 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from curl_cffi.requests.exceptions import HTTPError
+
+from tests.assertions import (
+    assert_chart_result,
+    assert_quote_summary_all_modules_result,
+    assert_quotes,
+    assert_response_json,
+)
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient, AsyncSymbol
+from yafin.const import ALL_MODULES_CSV
+
+
+class TestUnitFakeServer:
+    """Unit tests for AsyncClient against tests.fake_server over real sockets."""
+
+    @pytest_asyncio.fixture
+    async def server(self) -> AsyncGenerator[FakeYahooServer, None]:
+        """Fixture for FakeYahooServer."""
+        async with FakeYahooServer(seed=0) as server:
+            yield server
+
+    @pytest.mark.asyncio
+    async def test_endpoints(self, server: FakeYahooServer) -> None:
+        """Test all endpoints are served and connection is reused."""
+        async with AsyncClient(base_url=server.url) as client:
+            chart = await client.get_chart('META', '1y', '1d')
+            assert_response_json(chart, 'chart')
+            assert_chart_result(chart['chart']['result'][0], 'META')
+
+            quotes = await client.get_quote('META')
+            assert_quotes(quotes, 'META')
+
+            quote_summary = await client.get_quote_summary('META', ALL_MODULES_CSV)
+            assert_quote_summary_all_modules_result(
+                quote_summary['quoteSummary']['result'][0]
+            )
+
+            await client.get_timeseries('META', 'annualTotalAssets')
+            await client.get_options('META')
+            await client.get_search('META')
+            await client.get_recommendations('META')
+            await client.get_insights('META')
+            await client.get_market_summaries()
+            await client.get_trending()
+            await client.get_currencies()
+
+        assert server.stats['200'] == server.stats['requests'] == 12
+        assert server.stats['connections'] == 1
+
+    @pytest.mark.asyncio
+    async def test_symbol(self, server: FakeYahooServer) -> None:
+        """Test AsyncSymbol methods served from the matching fixtures."""
+        async with AsyncSymbol('META') as symbol:
+            symbol._open_client = AsyncClient(base_url=server.url)
+            esg_scores = await symbol.get_esg_scores()
+            balance_sheet = await symbol.get_balance_sheet('annual')
+            await symbol._open_client.close()
+
+        assert esg_scores['totalEsg']
+        assert balance_sheet[0]['meta']['type'][0].startswith('annual')
+
+    @pytest.mark.asyncio
+    async def test_crumb_check(self, server: FakeYahooServer) -> None:
+        """Test crumb protected endpoint with invalid crumb."""
+        async with AsyncClient(base_url=server.url) as client:
+            client._used_crumb = 'invalid'
+
+            with pytest.raises(HTTPError):
+                await client.get_quote('META')
+
+        assert server.stats['401'] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_ticker(self, server: FakeYahooServer) -> None:
+        """Test unknown ticker is responded with 404."""
+        async with AsyncClient(base_url=server.url) as client:
+            with pytest.raises(HTTPError):
+                await client.get_chart('XXXXXXXX', '1y', '1d')
+
+        assert server.stats['404'] == 1
+
+    @pytest.mark.parametrize(
+        'kwargs, status',
+        [
+            (dict(rate_limit=2, rate_window=60), '429'),
+            (dict(error_rate=1.0), '500'),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_failures(self, kwargs: dict[str, Any], status: str) -> None:
+        """Test throttling and random errors."""
+        async with FakeYahooServer(**kwargs) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                errors = 0
+
+                for _ in range(3):
+                    try:
+                        await client.get_search('META')
+                    except HTTPError:
+                        errors += 1
+
+        assert errors >= 1
+        assert server.stats[status] == errors
+
+    @pytest.mark.asyncio
+    async def test_latency(self) -> None:
+        """Test configured latency is applied."""
+        async with FakeYahooServer(latency=0.05) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                response = await client._get_async_request(
+                    f'{server.url}/v1/finance/trending/US'
+                )
+
+        assert response.elapsed.total_seconds() >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_coalescing(self) -> None:
+        """Test concurrent identical requests share one http request."""
+        async with FakeYahooServer(latency=0.02) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                charts = await asyncio.gather(
+                    *(client.get_chart('META', '1y', '1d') for _ in range(5)),
+                    client.get_chart('META', '5y', '1d'),
+                )
+                assert client.coalesced_requests == 4
+                assert not client._in_flight
+
+                await client.get_chart('META', '1y', '1d')
+
+                results = await asyncio.gather(
+                    *(client.get_chart('XXXXXXXX', '1y', '1d') for _ in range(2)),
+                    return_exceptions=True,
+                )
+
+        assert charts[0] == charts[1]
+        assert charts[0] is not charts[1]
+        assert all(isinstance(r, HTTPError) for r in results)
+        assert server.stats['200'] == 3
+        assert server.stats['404'] == 1
+
+    @pytest.mark.asyncio
+    async def test_coalescing_cancel(self) -> None:
+        """Test cancelling one caller does not cancel the shared request."""
+        async with FakeYahooServer(latency=0.05) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                first = asyncio.create_task(client.get_chart('META', '1y', '1d'))
+                second = asyncio.create_task(client.get_chart('META', '1y', '1d'))
+                await asyncio.sleep(0.01)
+                first.cancel()
+                chart = await second
+
+        assert first.cancelled()
+        assert_chart_result(chart['chart']['result'][0], 'META')
+        assert server.stats['requests'] == 1
@@ -0,0 +1,84 @@
+import json
+from typing import Any
+
+import pytest
+
+from tests.fake_server import FIXTURES_PATH
+from yafin.jsonstream import JsonItemsParser
+
+OPTIONS_PATHS = [
+    'optionChain.result.item.options.item.calls.item',
+    'optionChain.result.item.options.item.puts.item',
+]
+
+
+def _parse(paths: list[str], text: str, chunk_size: int) -> list[tuple[str, Any]]:
+    parser = JsonItemsParser(paths)
+    items = []
+
+    for i in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[i : i + chunk_size]))
+
+    return items + parser.feed('', final=True)
+
+
+class TestUnitJsonStream:
+    """Unit tests for yafin.jsonstream module."""
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 1000, 16384, 10**6])
+    def test_options(self, chunk_size: int) -> None:
+        """Test contracts are parsed the same as by json.loads in any chunks."""
+        text = FIXTURES_PATH.joinpath('options.json').read_text()
+        options = json.loads(text)['optionChain']['result'][0]['options'][0]
+        expected = [(OPTIONS_PATHS[0], c) for c in options['calls']] + [
+            (OPTIONS_PATHS[1], p) for p in options['puts']
+        ]
+
+        assert _parse(OPTIONS_PATHS, text, chunk_size) == expected
+
+    def test_items_arrive_incrementally(self) -> None:
+        """Test items are returned as soon as they are complete."""
+        parser = JsonItemsParser(['a.item'])
+
+        assert parser.feed('{"a": [{"x": 1}, {"x"') == [('a.item', {'x': 1})]
+        assert parser.feed(': 2}') == [('a.item', {'x': 2})]
+        assert parser.feed(']}', final=True) == []
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 100])
+    def test_paths(self, chunk_size: int) -> None:
+        """Test nested, scalar, split numbers and whitespace."""
+        text = json.dumps(
+            {
+                'skip': {'a': [1, 2, {'b': 'c'}]},
+                'a': [[], {'b': [12345, -1.5e3, 'x\\"y', None, True]}, {'b': []}],
+                'n': 1234567,
+            },
+            indent=2,
+        )
+
+        assert _parse(['a.item.b.item', 'n'], text, chunk_size) == [
+            ('a.item.b.item', 12345),
+            ('a.item.b.item', -1.5e3),
+            ('a.item.b.item', 'x\\"y'),
+            ('a.item.b.item', None),
+            ('a.item.b.item', True),
+            ('n', 1234567),
+        ]
+        assert _parse(['item'], '[1, [2], {}]', chunk_size) == [
+            ('item', 1),
+            ('item', [2]),
+            ('item', {}),
+        ]
+
+    @pytest.mark.parametrize(
+        'text', ['{"a": 1', '{"a" 1}', '[1 2]', '{1: 2}', '{}x', '{"a": [1}']
+    )
+    def test_invalid_json(self, text: str) -> None:
+        """Test invalid and truncated documents raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            _parse(['a.item'], text, 1)
+
+    def test_invalid_args(self) -> None:
+        """Test missing paths."""
+        with pytest.raises(ValueError):
+            JsonItemsParser([])
@@ -0,0 +1,216 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from tests.fake_server import FakeYahooServer
+from tests.utils import wait_until
+from yafin import AsyncClient
+from yafin.live import QuotePoller, QuoteSubscription, QuoteUpdate
+
+FAST = {'REGULAR': 0.01, 'CLOSED': 10.0}
+
+
+class _StubClient(object):
+    """Client returning scripted quotes, last price repeats."""
+
+    def __init__(self, prices: dict[str, list[float]], state: str = 'REGULAR') -> None:
+        self.prices = prices
+        self.state = state
+        self.states: dict[str, str] = {}
+        self.calls: list[str] = []
+        self.errors = 0
+        self.malformed = 0
+
+    async def get_quote(self, tickers: str) -> dict[str, Any]:
+        self.calls.append(tickers)
+
+        if self.errors:
+            self.errors -= 1
+            raise ConnectionError('xxx')
+
+        if self.malformed:
+            self.malformed -= 1
+            return {'finance': {'result': None, 'error': 'xxx'}}
+
+        result = []
+
+        for symbol in tickers.split(','):
+            if symbol not in self.prices:
+                continue
+
+            prices = self.prices[symbol]
+            price = prices.pop(0) if len(prices) > 1 else prices[0]
+            result.append(
+                {
+                    'symbol': symbol,
+                    'marketState': self.states.get(symbol, self.state),
+                    'shortName': symbol.title(),
+                    'regularMarketPrice': price,
+                }
+            )
+
+        return {'quoteResponse': {'result': result}}
+
+
+async def _take(subscription: QuoteSubscription, n: int) -> list[QuoteUpdate]:
+    updates = []
+
+    async for update in subscription:
+        updates.append(update)
+
+        if len(updates) == n:
+            break
+
+    return updates
+
+
+class TestUnitLive:
+    """Unit tests for yafin.live module."""
+
+    @pytest.mark.asyncio
+    async def test_changes(self) -> None:
+        """Test first update is the whole quote, then only changed fields."""
+        client = _StubClient({'META': [1.0, 1.0, 2.0, 2.0, 3.0]})
+        poller = QuotePoller(client, intervals=FAST)  # type: ignore[arg-type]
+
+        async with poller.subscribe('meta') as subscription:
+            updates = await asyncio.wait_for(_take(subscription, 3), 1)
+
+        assert updates[0] == QuoteUpdate(
+            'META',
+            {
+                'symbol': 'META',
+                'marketState': 'REGULAR',
+                'shortName': 'Meta',
+                'regularMarketPrice': 1.0,
+            },
+        )
+        assert updates[1] == QuoteUpdate('META', {'regularMarketPrice': 2.0})
+        assert updates[2] == QuoteUpdate('META', {'regularMarketPrice': 3.0})
+        assert poller.polls >= 5
+
+        await poller.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_polling(self) -> None:
+        """Test subscribers share one polling loop and symbols are chunked."""
+        client = _StubClient({'A': [1.0, 2.0], 'B': [1.0], 'C': [1.0]})
+        poller = QuotePoller(client, intervals=FAST, chunk_size=2)  # type: ignore[arg-type]
+
+        first = poller.subscribe('A,B')
+        second = poller.subscribe('A,C')
+        await asyncio.wait_for(_take(first, 3), 1)
+        updates = await asyncio.wait_for(_take(second, 3), 1)
+
+        assert client.calls[:2] == ['A,B', 'C']
+        assert {u.symbol for u in updates} == {'A', 'C'}
+
+        # late subscriber gets the last quote immediately
+        third = poller.subscribe('B')
+        assert (await asyncio.wait_for(_take(third, 1), 1))[0].symbol == 'B'
+
+        first.close()
+        third.close()
+        client.calls.clear()
+        await wait_until(lambda: len(client.calls) >= 3)
+        assert all(call == 'A,C' for call in client.calls)
+
+        await poller.close()
+        assert [u async for u in second] == []
+
+    @pytest.mark.asyncio
+    async def test_market_state(self) -> None:
+        """Test symbols of closed market are polled less often."""
+        client = _StubClient({'OPEN': [1.0], 'SHUT': [1.0]})
+        client.states['SHUT'] = 'CLOSED'
+        poller = QuotePoller(client, intervals=FAST)  # type: ignore[arg-type]
+
+        poller.subscribe('OPEN,SHUT')
+        await wait_until(lambda: client.calls.count('OPEN') >= 3)
+        await poller.close()
+
+        assert client.calls[0] == 'OPEN,SHUT'
+        assert client.calls.count('OPEN') >= 3
+        assert 'SHUT' not in client.calls
+
+    @pytest.mark.asyncio
+    async def test_backoff(self) -> None:
+        """Test polling continues after errors."""
+        client = _StubClient({'META': [1.0]})
+        client.errors = 2
+        poller = QuotePoller(client, intervals=FAST, default_interval=0.01)  # type: ignore[arg-type]
+
+        subscription = poller.subscribe('META')
+        updates = await asyncio.wait_for(_take(subscription, 1), 1)
+        assert updates[0].symbol == 'META'
+        assert len(client.calls) == 3
+
+        await poller.close()
+
+    @pytest.mark.asyncio
+    async def test_malformed_response(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test polling continues after malformed responses."""
+        client = _StubClient({'META': [1.0]})
+        client.malformed = 2
+        poller = QuotePoller(client, intervals=FAST, default_interval=0.01)  # type: ignore[arg-type]
+
+        subscription = poller.subscribe('META')
+        updates = await asyncio.wait_for(_take(subscription, 1), 1)
+        assert updates[0].symbol == 'META'
+        assert len(client.calls) == 3
+        assert 'malformed' in caplog.text
+
+        await poller.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queue(self) -> None:
+        """Test updates queued before closing are delivered."""
+        client = _StubClient({'META': [1.0, 2.0, 3.0]})
+        poller = QuotePoller(client, intervals=FAST)  # type: ignore[arg-type]
+
+        subscription = poller.subscribe('META')
+        await wait_until(lambda: poller.polls >= 3)
+        subscription.close()
+
+        updates = [u async for u in subscription]
+        assert [u.changes['regularMarketPrice'] for u in updates] == [1.0, 2.0, 3.0]
+        assert [u async for u in subscription] == []
+
+        await poller.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_drops_oldest(self) -> None:
+        """Test slow consumer gets the latest updates."""
+        client = _StubClient({'META': [1.0, 2.0, 3.0, 4.0]})
+        poller = QuotePoller(client, intervals=FAST)  # type: ignore[arg-type]
+
+        subscription = poller.subscribe('META', queue_size=1)
+        await wait_until(lambda: poller.polls >= 4)
+        updates = await asyncio.wait_for(_take(subscription, 1), 1)
+
+        assert updates[0].changes == {'regularMarketPrice': 4.0}
+        assert subscription.dropped == 3
+
+        await poller.close()
+
+    @pytest.mark.asyncio
+    async def test_client_subscribe_quotes(self) -> None:
+        """Test live quotes from the fake server end when the client closes."""
+        async with FakeYahooServer(seed=0) as server:
+            client = AsyncClient(base_url=server.url)
+            subscription = client.subscribe_quotes('META')
+            update = await asyncio.wait_for(_take(subscription, 1), 5)
+            await client.close()
+
+        assert update[0].symbol == 'META'
+        assert update[0].changes['marketState'] == 'PRE'
+        assert [u async for u in subscription] == []
+
+    def test_invalid_args(self) -> None:
+        """Test invalid chunk size and tickers."""
+        with pytest.raises(ValueError):
+            QuotePoller(AsyncClient(), chunk_size=0)
+
+        with pytest.raises(ValueError):
+            QuotePoller(AsyncClient()).subscribe(' , ')
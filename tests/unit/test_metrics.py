@@ -0,0 +1,103 @@
+import math
+
+import pytest
+from curl_cffi.requests.exceptions import HTTPError
+
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient
+from yafin.metrics import Histogram, MetricsCollector, get_endpoint
+from yafin.transport import make_response
+
+
+class TestUnitMetrics:
+    """Unit tests for yafin.metrics module."""
+
+    @pytest.mark.parametrize(
+        'url, endpoint',
+        [
+            ('https://a.com/v8/finance/chart/META?range=1y', 'chart'),
+            ('https://a.com/v7/finance/quote', 'quote'),
+            ('https://a.com/v6/finance/quote/marketSummary', 'market_summary'),
+            ('https://a.com/v10/finance/quoteSummary/META', 'quote_summary'),
+            ('https://a.com/v1/test/getcrumb', 'getcrumb'),
+            ('https://a.com/xxx', 'other'),
+        ],
+    )
+    def test_get_endpoint(self, url: str, endpoint: str) -> None:
+        """Test endpoint names of request urls."""
+        assert get_endpoint(url) == endpoint
+
+    def test_histogram(self) -> None:
+        """Test histogram buckets and quantile estimates."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        assert math.isnan(histogram.quantile(0.5))
+
+        for value in [0.05, 0.1, 0.5, 0.5, 5.0]:
+            histogram.observe(value)
+
+        assert histogram.cumulative_counts() == [(0.1, 2), (1.0, 4), (math.inf, 5)]
+        assert histogram.quantile(0.4) == 0.1
+        assert histogram.quantile(0.5) == 1.0
+        assert histogram.quantile(0.99) == math.inf
+        assert histogram.snapshot()['mean'] == pytest.approx(1.23)
+
+    def test_collector(self) -> None:
+        """Test responses without curl timings report total time only."""
+        metrics = MetricsCollector()
+        url = 'https://a.com/v7/finance/quote'
+        metrics.on_response(url, make_response(url, 200, {}, b'{}', 0.2))
+        metrics.on_error(url, TimeoutError())
+        metrics.on_retry(url)
+
+        snapshot = metrics.snapshot()['quote']
+        assert snapshot['requests'] == 2
+        assert snapshot['status_codes'] == {'200': 1, 'error': 1}
+        assert snapshot['response_bytes'] == 2
+        assert snapshot['retries'] == 1
+        assert list(snapshot['timings']) == ['total']
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    @pytest.mark.asyncio
+    async def test_client_metrics(self) -> None:
+        """Test client reports requests to the collector."""
+        metrics = MetricsCollector()
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url, metrics=metrics) as client:
+                for _ in range(3):
+                    await client.get_chart('META', '1y', '1d')
+
+                await client.get_quote('META')
+
+                with pytest.raises(HTTPError):
+                    await client.get_chart('XXXXXXXX', '1y', '1d')
+
+        snapshot = metrics.snapshot()
+        assert set(snapshot) == {'chart', 'getcrumb', 'quote'}
+
+        chart = snapshot['chart']
+        assert chart['requests'] == 4
+        assert chart['status_codes'] == {'200': 3, '404': 1}
+        assert chart['response_bytes'] > 0
+        assert list(chart['timings']) == [
+            'dns',
+            'connect',
+            'tls',
+            'ttfb',
+            'total',
+            'decode',
+        ]
+        assert chart['timings']['total']['count'] == 4
+        assert chart['timings']['decode']['count'] == 3
+        assert chart['timings']['ttfb']['sum'] <= chart['timings']['total']['sum']
+
+        text = metrics.to_prometheus()
+        assert 'yafin_requests_total{endpoint="chart",status="404"} 1' in text
+        assert (
+            'yafin_duration_seconds_bucket{endpoint="chart",phase="total",le="+Inf"} 4'
+            in text
+        )
+        assert 'yafin_duration_seconds_count{endpoint="quote",phase="decode"} 1' in text
+        assert '# TYPE yafin_duration_seconds histogram' in text
@@ -0,0 +1,94 @@
+import pytest
+from curl_cffi.requests.exceptions import HTTPError
+from pytest_mock import MockerFixture
+
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient
+from yafin.exceptions import TickerNotFoundError
+from yafin.negative_cache import NegativeCache
+
+
+class TestUnitNegativeCache:
+    """Unit tests for yafin.negative_cache module."""
+
+    def test_ttl(self, mocker: MockerFixture) -> None:
+        """Test tickers are skipped per endpoint until ttl expires."""
+        monotonic = mocker.patch('yafin.negative_cache.monotonic', return_value=0.0)
+        cache = NegativeCache(ttl=10.0)
+        cache.add('chart', 'xxx')
+
+        assert cache.should_skip('chart', 'XXX')
+        assert not cache.should_skip('quote_summary', 'XXX')
+        assert not cache.should_skip('chart', 'META')
+
+        monotonic.return_value = 10.0
+        assert not cache.should_skip('chart', 'XXX')
+        assert len(cache) == 0
+        assert cache.get_skipped() == {'chart': ['XXX']}
+
+    def test_maxsize(self) -> None:
+        """Test the oldest tickers are evicted."""
+        cache = NegativeCache(maxsize=2)
+
+        for ticker in ('A', 'B', 'A', 'C'):
+            cache.add('chart', ticker)
+
+        assert len(cache) == 2
+        assert cache.should_skip('chart', 'A')
+        assert not cache.should_skip('chart', 'B')
+        assert cache.should_skip('chart', 'C')
+
+        cache.discard('chart', 'C')
+        assert not cache.should_skip('chart', 'C')
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_skipped() == {}
+
+    def test_invalid_args(self) -> None:
+        """Test invalid ttl and maxsize."""
+        with pytest.raises(ValueError):
+            NegativeCache(ttl=0)
+
+        with pytest.raises(ValueError):
+            NegativeCache(maxsize=0)
+
+    @pytest.mark.asyncio
+    async def test_client(self) -> None:
+        """Test not found tickers are skipped without round trip and reported."""
+        cache = NegativeCache()
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url, negative_cache=cache) as client:
+                for cached in (False, True, True):
+                    with pytest.raises(TickerNotFoundError) as exc_info:
+                        await client.get_chart('XXXXXXXX', '1y', '1d')
+
+                    assert exc_info.value.cached is cached
+                    assert exc_info.value.endpoint == 'chart'
+
+                with pytest.raises(TickerNotFoundError):
+                    [c async for c in client.stream_options('XXXXXXXX')]
+
+                with pytest.raises(TickerNotFoundError):
+                    await client.get_options('XXXXXXXX')
+
+                await client.get_chart('META', '1y', '1d')
+
+        assert server.stats['404'] == 2
+        assert cache.skipped[('chart', 'XXXXXXXX')] == 2
+        assert cache.get_skipped() == {'chart': ['XXXXXXXX'], 'options': ['XXXXXXXX']}
+
+    @pytest.mark.asyncio
+    async def test_client_without_cache(self) -> None:
+        """Test not found ticker raises typed HTTPError without the cache."""
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                for _ in range(2):
+                    with pytest.raises(HTTPError) as exc_info:
+                        await client.get_quote_summary('XXXXXXXX', 'price')
+
+                    assert isinstance(exc_info.value, TickerNotFoundError)
+                    assert not exc_info.value.cached
+
+        assert server.stats['404'] == 2
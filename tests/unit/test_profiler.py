@@ -0,0 +1,64 @@
+import json
+import pathlib
+
+import pytest
+
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient
+from yafin.const import ALL_MODULES_CSV
+from yafin.profiler import RequestProfiler
+from yafin.transport import make_response
+
+
+class TestUnitProfiler:
+    """Unit tests for yafin.profiler module."""
+
+    def test_top_n(self) -> None:
+        """Test only top_n slowest and largest requests are kept."""
+        profiler = RequestProfiler(top_n=2, recent=3)
+        url = 'https://a.com/v8/finance/chart/META'
+
+        for i, elapsed in enumerate([0.3, 0.1, 0.5, 0.2, 0.4]):
+            response = make_response(url, 200, {}, b'x' * i, elapsed)
+            profiler.on_response(url, {'crumb': 'secret'}, response)
+
+            if i == 1:
+                profiler.on_decode(response, 1.0)
+
+        assert [p.total for p in profiler.slowest] == [0.1, 0.5]
+        assert profiler.slowest[0].decode == 1.0
+        assert [p.size for p in profiler.largest] == [4, 3]
+        assert [p.total for p in profiler.recent] == [0.5, 0.2, 0.4]
+        assert all('secret' not in p.url for p in profiler.recent)
+
+        profiler.reset()
+        assert profiler.dump() == {'slowest': [], 'largest': [], 'recent': []}
+
+    def test_invalid_args(self) -> None:
+        """Test RequestProfiler with invalid arguments."""
+        with pytest.raises(ValueError):
+            RequestProfiler(top_n=0)
+
+    @pytest.mark.asyncio
+    async def test_client_profiler(self, tmp_path: pathlib.Path) -> None:
+        """Test client records largest responses with decode time."""
+        profiler = RequestProfiler(top_n=2)
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url, profiler=profiler) as client:
+                await client.get_chart('META', '1y', '1d')
+                await client.get_insights('META')
+                await client.get_quote_summary('META', ALL_MODULES_CSV)
+
+        largest = profiler.largest
+        assert [p.endpoint for p in largest] == ['quote_summary', 'insights']
+        assert largest[0].size > largest[1].size > 0
+        assert largest[0].decode is not None
+        assert largest[0].ttfb is not None
+        assert 'crumb=%2AREDACTED%2A' in largest[0].url
+        assert len(profiler.recent) == 4
+
+        path = tmp_path.joinpath('profile.json')
+        data = profiler.dump(path)
+        assert json.loads(path.read_text()) == data
+        assert len(data['slowest']) == 2
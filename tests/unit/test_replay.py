@@ -0,0 +1,148 @@
+import gzip
+import json
+import pathlib
+
+import pytest
+from curl_cffi.requests.exceptions import HTTPError
+from pytest_mock import MockerFixture
+
+from tests.assertions import assert_chart_result, assert_response_json
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient
+from yafin.const import ALL_MODULES_CSV
+from yafin.exceptions import ReplayMissError
+from yafin.replay import (
+    RecordingSession,
+    RecordingTransport,
+    ReplaySession,
+    ReplayTransport,
+    read_archive,
+    replay_load,
+)
+
+
+async def record_session(path: pathlib.Path, latency: float = 0.0) -> None:
+    """Record chart, quote summary and 404 requests against the fake server."""
+    async with FakeYahooServer(latency=latency, seed=0) as server:
+        transport = RecordingTransport(path)
+
+        async with AsyncClient(base_url=server.url, transport=transport) as client:
+            await client.get_chart('META', '1y', '1d')
+            await client.get_quote_summary('META', ALL_MODULES_CSV)
+
+            with pytest.raises(HTTPError):
+                await client.get_chart('XXXXXXXX', '1y', '1d')
+
+        await transport.close()
+
+
+class TestUnitReplay:
+    """Unit tests for yafin.replay module."""
+
+    @pytest.mark.asyncio
+    async def test_record(self, tmp_path: pathlib.Path) -> None:
+        """Test archive contains all exchanges with crumb redacted."""
+        path = tmp_path.joinpath('session.jsonl.gz')
+        await record_session(path)
+
+        with gzip.open(path, 'rt') as f:
+            assert json.loads(f.readline()) == {'version': 1}
+
+        exchanges = list(read_archive(path))
+        assert [e.status_code for e in exchanges] == [200, 200, 200, 404]
+        assert exchanges[1].url.endswith('/v1/test/getcrumb')
+        assert exchanges[2].params['crumb'] == '*REDACTED*'
+        assert all(e.elapsed > 0 for e in exchanges)
+        assert exchanges == sorted(exchanges, key=lambda e: e.started)
+
+    @pytest.mark.asyncio
+    async def test_replay(self, tmp_path: pathlib.Path) -> None:
+        """Test recorded session is replayed offline with the same results."""
+        path = tmp_path.joinpath('session.jsonl.gz')
+        await record_session(path)
+
+        transport = ReplayTransport(path, speed=None)
+        client = AsyncClient(base_url='http://127.0.0.1:1', transport=transport)
+
+        chart = await client.get_chart('META', '1y', '1d')
+        assert_response_json(chart, 'chart')
+        assert_chart_result(chart['chart']['result'][0], 'META')
+
+        quote_summary = await client.get_quote_summary('META', ALL_MODULES_CSV)
+        assert_response_json(quote_summary, 'quoteSummary')
+
+        with pytest.raises(HTTPError):
+            await client.get_chart('XXXXXXXX', '1y', '1d')
+
+        with pytest.raises(ReplayMissError):
+            await client.get_chart('META', '5y', '1d')
+
+        await client.close()
+        assert client._open_transport is transport
+        assert transport.count == 4
+
+    @pytest.mark.asyncio
+    async def test_deprecated_sessions(self, tmp_path: pathlib.Path) -> None:
+        """Test deprecated session aliases still record and replay."""
+        path = tmp_path.joinpath('session.jsonl.gz')
+
+        async with FakeYahooServer(seed=0) as server:
+            with pytest.deprecated_call():
+                recording = RecordingSession(path)
+
+            with pytest.deprecated_call():
+                client = AsyncClient(base_url=server.url, session=recording)  # type: ignore[arg-type]
+
+            await client.get_chart('META', '1y', '1d')
+            await client.close()
+            await recording.close()
+
+        with pytest.deprecated_call():
+            replay = ReplaySession(path, speed=None)
+
+        assert isinstance(replay, ReplayTransport)
+        client = AsyncClient(base_url='http://127.0.0.1:1', transport=replay)
+        chart = await client.get_chart('META', '1y', '1d')
+        assert_chart_result(chart['chart']['result'][0], 'META')
+        assert replay.count == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_speed(
+        self, tmp_path: pathlib.Path, mocker: MockerFixture
+    ) -> None:
+        """Test replay reproduces recorded latency divided by speed."""
+        path = tmp_path.joinpath('session.jsonl.gz')
+        await record_session(path, latency=0.05)
+        client = AsyncClient(base_url='http://127.0.0.1:1')
+        sleep = mocker.patch('yafin.replay.asyncio.sleep', new=mocker.AsyncMock())
+
+        client._open_transport = ReplayTransport(path, speed=1.0)
+        await client.get_chart('META', '1y', '1d')
+        client._open_transport = ReplayTransport(path, speed=10.0)
+        await client.get_chart('META', '1y', '1d')
+
+        (recorded,), (replayed,) = (c.args for c in sleep.await_args_list)
+        assert recorded >= 0.05
+        assert replayed == pytest.approx(recorded / 10)
+
+    @pytest.mark.parametrize('speed', [0, -1])
+    def test_replay_invalid_args(self, tmp_path: pathlib.Path, speed: float) -> None:
+        """Test ReplayTransport with invalid speed."""
+        with pytest.raises(ValueError):
+            ReplayTransport(tmp_path.joinpath('session.jsonl.gz'), speed=speed)
+
+    @pytest.mark.asyncio
+    async def test_replay_load(self, tmp_path: pathlib.Path) -> None:
+        """Test recorded load profile is reproduced against another server."""
+        path = tmp_path.joinpath('session.jsonl.gz')
+        await record_session(path)
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                results = await replay_load(path, client, speed=100.0)
+
+        assert len(results) == 4
+        assert isinstance(results[-1], HTTPError)
+        # recorded getcrumb is replayed too, client fetches its own crumb
+        assert server.stats['200'] == 4
+        assert server.stats['404'] == 1
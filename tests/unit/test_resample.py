@@ -0,0 +1,154 @@
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from yafin.resample import parse_interval, resample_arrays, resample_chart
+
+NEW_YORK = ZoneInfo('America/New_York')
+
+
+def make_minute_chart(days: list[tuple[int, int, int]]) -> dict[str, Any]:
+    """Make 1m chart with bars from 9:00 to 16:00 New York time for each day."""
+    timestamps: list[int] = []
+
+    for year, month, day in days:
+        start = int(datetime(year, month, day, 9, 0, tzinfo=NEW_YORK).timestamp())
+        timestamps.extend(range(start, start + 7 * 3600, 60))
+
+    n = len(timestamps)
+    prices = np.arange(n, dtype=np.float64) + 100
+    return {
+        'meta': {
+            'symbol': 'META',
+            'dataGranularity': '1m',
+            'exchangeTimezoneName': 'America/New_York',
+            'gmtoffset': -14400,
+            'currentTradingPeriod': {
+                'regular': {
+                    'timezone': 'EDT',
+                    'start': 1760707800,
+                    'end': 1760731200,
+                    'gmtoffset': -14400,
+                },
+            },
+        },
+        'timestamp': timestamps,
+        'events': {},
+        'indicators': {
+            'quote': [
+                {
+                    'open': prices.tolist(),
+                    'high': (prices + 1).tolist(),
+                    'low': (prices - 1).tolist(),
+                    'close': prices.tolist(),
+                    'volume': [1] * n,
+                }
+            ],
+        },
+    }
+
+
+class TestUnitResample:
+    """Unit tests for yafin.resample module."""
+
+    @pytest.mark.parametrize(
+        'interval, seconds',
+        [('1m', 60), ('5m', 300), ('15m', 900), ('1h', 3600), ('2d', 172800)],
+    )
+    def test_parse_interval(self, interval: str, seconds: int) -> None:
+        """Test parse_interval function."""
+        assert parse_interval(interval) == seconds
+
+    @pytest.mark.parametrize('interval', ['xxx', '0m', '1wk', 'm'])
+    def test_parse_interval_invalid_args(self, interval: str) -> None:
+        """Test parse_interval function with invalid arguments."""
+        with pytest.raises(ValueError):
+            parse_interval(interval)
+
+    def test_resample_chart_session_aligned(self) -> None:
+        """Test 1h bars are aligned to 9:30 session open across DST change."""
+        # 2025-03-07 is EST (UTC-5), 2025-03-10 is EDT (UTC-4)
+        chart = make_minute_chart([(2025, 3, 7), (2025, 3, 10)])
+        bars = resample_chart(chart, '1h')
+
+        local_times = [
+            datetime.fromtimestamp(int(t), tz=NEW_YORK).strftime('%H:%M')
+            for t in bars['timestamp']
+        ]
+        expected_times = ['08:30'] + [f'{h:02d}:30' for h in range(9, 16)]
+        assert local_times == expected_times * 2
+        # 08:30 bar holds 9:00-9:29 premarket, 15:30 bar holds 15:30-15:59
+        assert bars['volume'].tolist() == [30, 60, 60, 60, 60, 60, 60, 30] * 2
+        assert bars['open'][1] == 130.0
+        assert bars['close'][1] == 189.0
+        assert bars['high'][1] == 190.0
+        assert bars['low'][1] == 129.0
+
+    def test_resample_chart_regular_only(self) -> None:
+        """Test resampling with regular session bars only."""
+        chart = make_minute_chart([(2025, 3, 7)])
+        bars = resample_chart(chart, '1d', regular_only=True)
+        assert bars['volume'].tolist() == [390]
+        assert bars['open'][0] == 130.0
+
+    def test_resample_chart_nan(self) -> None:
+        """Test resampling skips missing values."""
+        chart = make_minute_chart([(2025, 3, 7)])
+        quote = chart['indicators']['quote'][0]
+        quote['open'][30] = None
+        quote['close'][89] = None
+        quote['volume'][31] = None
+        bars = resample_chart(chart, '1h')
+        assert bars['open'][1] == 131.0
+        assert bars['close'][1] == 188.0
+        assert bars['volume'][1] == 59
+
+    @pytest.mark.parametrize('interval', ['7m', '30s', '1m'])
+    def test_resample_chart_invalid_args(self, interval: str) -> None:
+        """Test resample_chart function with invalid intervals."""
+        chart = make_minute_chart([(2025, 3, 7)])
+        chart['meta']['dataGranularity'] = '5m'
+
+        with pytest.raises(ValueError):
+            resample_chart(chart, interval)
+
+    def test_resample_chart_daily(self, chart_json_mock: dict[str, Any]) -> None:
+        """Test resampling daily chart into 5 day bars."""
+        chart = chart_json_mock['chart']['result'][0]
+        bars = resample_chart(chart, '5d')
+        volumes = chart['indicators']['quote'][0]['volume']
+        assert bars['volume'].sum() == sum(volumes)
+        assert bars['high'].max() == max(chart['indicators']['quote'][0]['high'])
+        assert bars['dividends'].sum() == pytest.approx(
+            sum(d['amount'] for d in chart['events']['dividends'].values())
+        )
+
+    def test_resample_arrays_empty(self) -> None:
+        """Test resampling with no bars left after filtering."""
+        chart = make_minute_chart([(2025, 3, 7)])
+        chart['timestamp'] = chart['timestamp'][:10]
+        chart['indicators']['quote'][0] = {
+            k: v[:10] for k, v in chart['indicators']['quote'][0].items()
+        }
+        bars = resample_chart(chart, '1h', regular_only=True)
+        assert not len(bars['timestamp'])
+        assert not len(bars['close'])
+
+    def test_resample_arrays_default_tz(self) -> None:
+        """Test resample_arrays defaults to UTC midnight anchored bins."""
+        arrays = {
+            'timestamp': np.array([0, 60, 3600], dtype=np.int64),
+            'open': np.array([1.0, 2.0, 3.0]),
+            'high': np.array([1.0, 2.0, 3.0]),
+            'low': np.array([1.0, 2.0, 3.0]),
+            'close': np.array([1.0, 2.0, 3.0]),
+            'volume': np.array([1, 1, 1]),
+            'dividends': np.zeros(3),
+            'splits': np.array([0.0, 2.0, 0.0]),
+        }
+        bars = resample_arrays(arrays, '1h')
+        assert bars['timestamp'].tolist() == [0, 3600]
+        assert bars['splits'].tolist() == [2.0, 0.0]
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from curl_cffi.requests.exceptions import HTTPError
+
+from tests.assertions import assert_quotes
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient
+from yafin.session_pool import SessionPool
+
+
+class TestUnitSessionPool:
+    """Unit tests for yafin.session_pool module."""
+
+    @pytest.mark.asyncio
+    async def test_round_robin(self) -> None:
+        """Test requests spread over sessions with their own cookies and crumbs."""
+        transport = SessionPool(size=4)
+
+        # 5 quotes + crumb per cookie fit the limit, 20 from one cookie would not
+        async with FakeYahooServer(rate_limit=6, rate_window=60, seed=0) as server:
+            client = AsyncClient(
+                base_url=server.url, transport=transport, coalesce=False
+            )
+            results = await asyncio.gather(
+                *(client.get_quote('META') for _ in range(20))
+            )
+
+            for quotes in results:
+                assert_quotes(quotes, 'META')
+
+            await transport.close()
+
+        assert len(server.crumbs) == 4
+        assert {m.crumb for m in transport.members} == set(server.crumbs.values())
+        assert server.stats['200'] == 24
+        assert transport.stats.requests == 24
+        assert not transport.retired
+
+    @pytest.mark.asyncio
+    async def test_least_loaded(self) -> None:
+        """Test least loaded strategy picks the session with fewest requests."""
+        transport = SessionPool(size=2, strategy='least_loaded')
+
+        async with FakeYahooServer(latency=0.01, seed=0) as server:
+            client = AsyncClient(
+                base_url=server.url, transport=transport, coalesce=False
+            )
+            await asyncio.gather(
+                *(client.get_chart('META', '1y', '1d') for _ in range(10))
+            )
+            await transport.close()
+
+        requests = [m.transport.stats.requests for m in transport.members]
+        assert requests == [5, 5]
+
+    @pytest.mark.asyncio
+    async def test_retire(self) -> None:
+        """Test throttled session is retired and replaced by a fresh one."""
+        transport = SessionPool(size=1, retire_after=2)
+
+        async with FakeYahooServer(rate_limit=2, rate_window=60, seed=0) as server:
+            client = AsyncClient(base_url=server.url, transport=transport)
+            first = transport.members[0]
+
+            for _ in range(2):
+                await client.get_chart('META', '1y', '1d')
+
+            for _ in range(2):
+                with pytest.raises(HTTPError):
+                    await client.get_chart('META', '1y', '1d')
+
+            assert transport.retired == 1
+            assert transport.members[0] is not first
+            assert first.transport.session._closed
+
+            await client.get_quote('META')
+            await transport.close()
+
+        assert len(server.crumbs) == 2
+        assert server.stats['429'] == 2
+
+    @pytest.mark.asyncio
+    async def test_retire_throttled_crumb(self) -> None:
+        """Test HTTP 429 of crumb fetch counts as throttled response."""
+        transport = SessionPool(size=1, retire_after=2)
+
+        async with FakeYahooServer(rate_limit=0, seed=0) as server:
+            client = AsyncClient(base_url=server.url, transport=transport)
+            first = transport.members[0]
+
+            with pytest.raises(HTTPError):
+                await client.get_quote('META')
+
+            assert first.throttled == 1
+            assert transport.members[0] is first
+
+            with pytest.raises(HTTPError):
+                await client.get_quote('META')
+
+            assert transport.retired == 1
+            assert transport.members[0] is not first
+            await transport.close()
+
+        assert server.stats['429'] == 2
+
+    @pytest.mark.asyncio
+    async def test_start(self) -> None:
+        """Test warm up fetches crumbs of all sessions."""
+        transport = SessionPool(size=3)
+
+        async with FakeYahooServer(seed=0) as server:
+            client = AsyncClient(base_url=server.url, transport=transport)
+            await client.start(warm_connections=3)
+            assert all(m.crumb for m in transport.members)
+            await transport.close()
+
+        assert server.stats['connections'] == 3
+
+    @pytest.mark.parametrize('kwargs', [dict(size=0), dict(strategy='xxx')])
+    def test_invalid_args(self, kwargs: dict[str, int | str]) -> None:
+        """Test SessionPool with invalid arguments."""
+        with pytest.raises(ValueError):
+            SessionPool(**kwargs)  # type: ignore[arg-type]
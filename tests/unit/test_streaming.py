@@ -0,0 +1,231 @@
+import asyncio
+import base64
+from typing import Any
+
+import pytest
+from curl_cffi.requests import AsyncWebSocket
+from pytest_mock import MockerFixture
+
+from tests.fake_streamer import (
+    FakeYahooStreamer,
+    encode_message,
+    encode_pricing_data,
+)
+from tests.utils import wait_until
+from yafin.streaming import (
+    AsyncStreamer,
+    StreamSubscription,
+    decode_message,
+    decode_pricing_data,
+)
+
+PRICING = {
+    'id': 'META',
+    'price': 170.5,
+    'time': 1700000000000,
+    'currency': 'USD',
+    'quote_type': 8,
+    'change': -1.25,
+    'day_volume': 123,
+    'market_cap': 431234567890.0,
+}
+
+
+async def _take(subscription: StreamSubscription, n: int) -> list[dict[str, Any]]:
+    updates = []
+
+    async for update in subscription:
+        updates.append(update)
+
+        if len(updates) == n:
+            break
+
+    return updates
+
+
+class TestUnitStreaming:
+    """Unit tests for yafin.streaming module."""
+
+    def test_decode_pricing_data(self) -> None:
+        """Test decoding of all field types incl. negative and unknown fields."""
+        data = encode_pricing_data(PRICING | {'open_interest': -5})
+        unknown_field = bytes([99 << 3 & 0x7F | 0x80, 99 >> 4, 1])
+
+        assert decode_pricing_data(data + unknown_field) == PRICING | {
+            'open_interest': -5
+        }
+        assert decode_pricing_data(b'') == {}
+
+        with pytest.raises(ValueError):
+            decode_pricing_data(bytes([1 << 3 | 3]))
+
+    def test_decode_message(self) -> None:
+        """Test raw base64 and json wrapped messages."""
+        assert decode_message(encode_message(PRICING)) == PRICING
+        assert decode_message(encode_message(PRICING, wrap=False)) == PRICING
+        assert decode_message('{"type": "heartbeat"}') == {}
+        assert base64.b64decode(encode_message(PRICING, wrap=False))
+
+    @pytest.mark.asyncio
+    async def test_fan_out(self) -> None:
+        """Test updates are fanned out to all subscribers of the symbol."""
+        async with FakeYahooStreamer() as server:
+            async with AsyncStreamer(server.url) as streamer:
+                first = await streamer.subscribe('meta')
+                second = await streamer.subscribe('META,AAPL')
+                await asyncio.wait_for(server.wait_subscribed({'META', 'AAPL'}), 1)
+
+                await server.publish(PRICING)
+                await server.publish({'id': 'AAPL', 'price': 190.0})
+
+                assert await asyncio.wait_for(_take(first, 1), 1) == [PRICING]
+                assert await asyncio.wait_for(_take(second, 2), 1) == [
+                    PRICING,
+                    {'id': 'AAPL', 'price': 190.0},
+                ]
+                assert streamer.messages == 2
+
+            assert [u async for u in first] == []
+            assert [u async for u in second] == []
+
+        assert server.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_dynamic_subscriptions(self) -> None:
+        """Test symbols are unsubscribed upstream when last subscriber leaves."""
+        async with FakeYahooStreamer() as server:
+            async with AsyncStreamer(server.url) as streamer:
+                first = await streamer.subscribe('META,AAPL')
+                async with await streamer.subscribe('META,MSFT'):
+                    await asyncio.wait_for(
+                        server.wait_subscribed({'META', 'AAPL', 'MSFT'}), 1
+                    )
+
+                await asyncio.wait_for(server.wait_subscribed({'META', 'AAPL'}), 1)
+                await first.close()
+                await asyncio.wait_for(server.wait_subscribed(set()), 1)
+
+        assert server.received == [
+            {'subscribe': ['AAPL', 'META']},
+            {'subscribe': ['MSFT']},
+            {'unsubscribe': ['MSFT']},
+            {'unsubscribe': ['AAPL', 'META']},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self) -> None:
+        """Test full queue pauses reading with block and drops with drop_oldest."""
+        async with FakeYahooStreamer() as server:
+            blocking = AsyncStreamer(server.url, queue_size=1)
+            dropping = AsyncStreamer(server.url, queue_size=1, overflow='drop_oldest')
+            slow = await blocking.subscribe('META')
+            fast = await dropping.subscribe('META')
+
+            while len(server.received) < 2:
+                await asyncio.sleep(0.01)
+
+            for price in range(5):
+                await server.publish({'id': 'META', 'price': float(price)})
+
+            await wait_until(lambda: dropping.messages == 5)
+            await wait_until(lambda: blocking.messages == 2)
+            assert dropping.messages == 5
+            assert fast.dropped == 4
+            assert await asyncio.wait_for(_take(fast, 1), 1) == [
+                {'id': 'META', 'price': 4.0}
+            ]
+
+            prices = [u['price'] for u in await asyncio.wait_for(_take(slow, 5), 1)]
+            assert prices == [0.0, 1.0, 2.0, 3.0, 4.0]
+            assert slow.dropped == 0
+
+            await blocking.close()
+            await dropping.close()
+
+    @pytest.mark.asyncio
+    async def test_close_blocked_subscription(self) -> None:
+        """Test closing full subscription does not block the streamer."""
+        async with FakeYahooStreamer() as server:
+            async with AsyncStreamer(server.url, queue_size=1) as streamer:
+                full = await streamer.subscribe('META')
+                other = await streamer.subscribe('META')
+                await asyncio.wait_for(server.wait_subscribed({'META'}), 1)
+
+                for price in range(3):
+                    await server.publish({'id': 'META', 'price': float(price)})
+
+                # second update blocks the streamer on the full queues
+                await wait_until(lambda: streamer.messages == 2)
+                await asyncio.wait_for(full.close(), 1)
+                prices = [
+                    u['price'] for u in await asyncio.wait_for(_take(other, 3), 1)
+                ]
+
+        assert prices == [0.0, 1.0, 2.0]
+        assert [u async for u in full] == []
+
+    @pytest.mark.asyncio
+    async def test_reconnect(self, mocker: MockerFixture) -> None:
+        """Test lost connection is closed and symbols are subscribed again."""
+        async with FakeYahooStreamer(wrap=False) as server:
+            async with AsyncStreamer(server.url) as streamer:
+                subscription = await streamer.subscribe('META')
+                await asyncio.wait_for(server.wait_subscribed({'META'}), 1)
+                lost = streamer._ws
+                close = mocker.spy(AsyncWebSocket, 'close')
+
+                server.drop_connections()
+                await asyncio.wait_for(server.wait_subscribed({'META'}), 2)
+                await server.send_raw('invalid')
+                await server.send_raw('{"type": "pricing"}')
+                await server.publish(PRICING)
+
+                assert await asyncio.wait_for(_take(subscription, 1), 1) == [PRICING]
+                assert streamer.reconnects == 1
+                assert [c.args[0] for c in close.await_args_list] == [lost]
+
+        assert server.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_connection_lost(self) -> None:
+        """Test subscriptions end when the connection is lost without reconnect."""
+        async with FakeYahooStreamer() as server:
+            async with AsyncStreamer(server.url, reconnect=False) as streamer:
+                subscription = await streamer.subscribe('META')
+                await asyncio.wait_for(server.wait_subscribed({'META'}), 1)
+                await server.publish(PRICING)
+                await wait_until(lambda: streamer.messages == 1)
+                server.drop_connections()
+
+                updates = await asyncio.wait_for(_take(subscription, 2), 1)
+
+        assert updates == [PRICING]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_after_connection_lost(self) -> None:
+        """Test subscribe opens new connection after the lost one."""
+        async with FakeYahooStreamer() as server:
+            async with AsyncStreamer(server.url, reconnect=False) as streamer:
+                lost = await streamer.subscribe('META')
+                await asyncio.wait_for(server.wait_subscribed({'META'}), 1)
+                server.drop_connections()
+                assert await asyncio.wait_for(_take(lost, 1), 1) == []
+
+                subscription = await streamer.subscribe('META')
+                await asyncio.wait_for(server.wait_subscribed({'META'}), 1)
+                await server.publish(PRICING)
+
+                assert await asyncio.wait_for(_take(subscription, 1), 1) == [PRICING]
+                assert streamer.reconnects == 0
+
+        assert server.connections == 2
+        assert server.received[-1] == {'subscribe': ['META']}
+
+    @pytest.mark.asyncio
+    async def test_invalid_args(self) -> None:
+        """Test invalid overflow and tickers."""
+        with pytest.raises(ValueError):
+            AsyncStreamer(overflow='xxx')
+
+        with pytest.raises(ValueError):
+            await AsyncStreamer().subscribe(' , ')
@@ -4,7 +4,6 @@ from typing import Any, AsyncGenerator, Type
 import pytest
 import pytest_asyncio
 from pytest_mock import MockerFixture
-from typeguard import TypeCheckError
 
 from tests.assertions import (
     assert_annual_balance_sheet_result,
@@ -162,24 +161,6 @@ class TestUnitSymbol:
                 ),
                 ValueError,
             ),
-            (
-                dict(
-                    period_range='1y',
-                    interval='1d',
-                    include_div='xxx',
-                    include_split=True,
-                ),
-                TypeCheckError,
-            ),
-            (
-                dict(
-                    period_range='1y',
-                    interval='1d',
-                    include_div=True,
-                    include_split='xxx',
-                ),
-                TypeCheckError,
-            ),
         ],
     )
     @pytest.mark.asyncio
@@ -0,0 +1,136 @@
+import contextvars
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient, AsyncSymbol
+from yafin.tracing import get_tracer, set_tracer, start_span
+
+_current: contextvars.ContextVar['FakeSpan | None'] = contextvars.ContextVar(
+    '_current', default=None
+)
+
+
+class FakeSpan:
+    """Span recording its attributes and parent."""
+
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = _current.get()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set attribute."""
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    """Tracer with OpenTelemetry compatible interface recording spans."""
+
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any]
+    ) -> Iterator[FakeSpan]:
+        """Start span nested in the current one."""
+        span = FakeSpan(name, attributes)
+        self.spans.append(span)
+        token = _current.set(span)
+
+        try:
+            yield span
+        finally:
+            _current.reset(token)
+
+
+@pytest.fixture
+def tracer() -> Iterator[FakeTracer]:
+    """Set fake tracer for the test."""
+    default = get_tracer()
+    tracer = FakeTracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(default)
+
+
+class TestUnitTracing:
+    """Unit tests for yafin.tracing module."""
+
+    def test_disabled(self) -> None:
+        """Test spans are no-op without tracer."""
+        default = get_tracer()
+        set_tracer(None)
+
+        with start_span('span', ticker='META') as span:
+            assert span is None
+
+        with start_span('span', lambda: pytest.fail('computed attributes')):
+            pass
+
+        set_tracer(default)
+
+    def test_lazy_attributes(self, tracer: FakeTracer) -> None:
+        """Test lazy attributes are computed when tracing is enabled."""
+        with start_span('span', lambda: {'url': 'xxx', 'size': None}, ticker='META'):
+            pass
+
+        assert tracer.spans[0].attributes == {
+            'yafin.ticker': 'META',
+            'yafin.url': 'xxx',
+        }
+
+    @pytest.mark.asyncio
+    async def test_symbol_spans(self, tracer: FakeTracer) -> None:
+        """Test nested spans of symbol, client, crumb and request."""
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                symbol = AsyncSymbol('META')
+                symbol._open_client = client
+                await symbol.get_quote()
+
+        spans = {s.name: s for s in tracer.spans}
+        assert list(spans) == [
+            'AsyncSymbol.get_quote',
+            'AsyncClient.get_quote',
+            'AsyncClient._get_crumb',
+            'AsyncClient._get_async_request',
+        ]
+
+        assert spans['AsyncSymbol.get_quote'].parent is None
+        assert spans['AsyncSymbol.get_quote'].attributes == {'yafin.ticker': 'META'}
+        assert spans['AsyncClient.get_quote'].parent is spans['AsyncSymbol.get_quote']
+        assert spans['AsyncClient.get_quote'].attributes == {'yafin.ticker': 'META'}
+
+        crumb, quote = (
+            s for s in tracer.spans if s.name == 'AsyncClient._get_async_request'
+        )
+        assert crumb.parent is spans['AsyncClient._get_crumb']
+        assert crumb.attributes['yafin.endpoint'] == 'getcrumb'
+        assert quote.parent is spans['AsyncClient.get_quote']
+        assert quote.attributes['yafin.endpoint'] == 'quote'
+        assert quote.attributes['yafin.status_code'] == 200
+        assert quote.attributes['yafin.payload_size'] > 0
+        assert 'crumb=%2AREDACTED%2A' in quote.attributes['yafin.url']
+
+    @pytest.mark.asyncio
+    async def test_stream_span(self, tracer: FakeTracer) -> None:
+        """Test streamed endpoint is wrapped into span with ticker attribute."""
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                contracts = [c async for c in client.stream_options('META')]
+
+        spans = {s.name: s for s in tracer.spans}
+        assert contracts
+        assert spans['AsyncClient.stream_options'].parent is None
+        assert spans['AsyncClient.stream_options'].attributes == {
+            'yafin.ticker': 'META'
+        }
+        assert (
+            spans['AsyncClient._get_crumb'].parent
+            is spans['AsyncClient.stream_options']
+        )
@@ -0,0 +1,195 @@
+import asyncio
+import pathlib
+
+import pytest
+from curl_cffi import CurlMOpt, CurlOpt
+from curl_cffi.requests.exceptions import HTTPError
+from pytest_mock import MockerFixture
+
+from tests.assertions import assert_chart_result, assert_response_json
+from tests.fake_server import FakeYahooServer
+from yafin import AsyncClient
+from yafin.replay import RecordingTransport
+from yafin.transport import (
+    CURLPIPE_NOTHING,
+    CurlCffiTransport,
+    PoolConfig,
+    Transport,
+    make_response,
+)
+
+
+class TestUnitTransport:
+    """Unit tests for yafin.transport module."""
+
+    def test_make_response(self) -> None:
+        """Test make_response creates curl_cffi response."""
+        response = make_response(
+            'https://example.com',
+            200,
+            {'Content-Type': 'application/json'},
+            b'{"a": 1}',
+            0.5,
+        )
+        assert response.json() == {'a': 1}  # type: ignore[no-untyped-call]
+        assert response.text == '{"a": 1}'
+        assert response.headers['content-type'] == 'application/json'
+        assert response.elapsed.total_seconds() == 0.5
+        response.raise_for_status()  # type: ignore[no-untyped-call]
+
+        response = make_response('https://example.com', 404, {}, b'')
+        assert response.reason == 'Not Found'
+
+        with pytest.raises(HTTPError):
+            response.raise_for_status()  # type: ignore[no-untyped-call]
+
+    def test_protocol(self, tmp_path: pathlib.Path) -> None:
+        """Test transports implement the Transport protocol."""
+        assert isinstance(CurlCffiTransport(), Transport)
+        assert isinstance(RecordingTransport(tmp_path.joinpath('a.gz')), Transport)
+
+    @pytest.mark.asyncio
+    async def test_custom_transport(self) -> None:
+        """Test client with custom transport against the fake server."""
+
+        class CountingTransport(CurlCffiTransport):
+            count = 0
+
+            async def get(self, url, params=None):  # type: ignore[no-untyped-def]
+                self.count += 1
+                return await super().get(url, params)
+
+        transport = CountingTransport()
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url, transport=transport) as client:
+                chart = await client.get_chart('META', '1y', '1d')
+                assert_response_json(chart, 'chart')
+
+            assert transport.count == 1
+            # transport is not closed by the client
+            await AsyncClient(base_url=server.url, transport=transport).get_chart(
+                'META', '1y', '1d'
+            )
+            await transport.close()
+
+    def test_pool_config(self) -> None:
+        """Test pool settings translated into curl options."""
+        pool = PoolConfig(
+            max_clients=20,
+            max_host_connections=4,
+            http_version='v2',
+            multiplex=False,
+            keep_alive=False,
+        )
+        kwargs = pool.get_session_kwargs()
+        assert kwargs['max_clients'] == 20
+        assert kwargs['http_version'] == 'v2'
+        assert CurlOpt.TCP_KEEPIDLE not in kwargs['curl_options']
+        assert kwargs['curl_options'][CurlOpt.FORBID_REUSE] == 1
+
+        options = pool.get_multi_options()
+        assert options[CurlMOpt.MAX_HOST_CONNECTIONS] == 4
+        assert options[CurlMOpt.PIPELINING] == CURLPIPE_NOTHING
+        assert CurlMOpt.MAX_TOTAL_CONNECTIONS not in options
+
+    @pytest.mark.asyncio
+    async def test_connection_reuse(self) -> None:
+        """Test connections are reused and limited per host."""
+        pool = PoolConfig(max_host_connections=2)
+
+        async with FakeYahooServer(latency=0.01, seed=0) as server:
+            async with AsyncClient(
+                base_url=server.url, pool=pool, coalesce=False
+            ) as client:
+                await asyncio.gather(
+                    *(client.get_chart('META', '1y', '1d') for _ in range(20))
+                )
+                stats = client.connection_stats
+
+            assert stats is not None
+            assert stats.requests == 20
+            assert stats.new_connections == server.stats['connections'] <= 2
+            assert stats.reuse_ratio >= 0.9
+            assert stats.http_versions == {'1.1': 20}
+
+    @pytest.mark.asyncio
+    async def test_pool_without_private_bindings(
+        self, mocker: MockerFixture, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test multi options are skipped if curl_cffi bindings are missing."""
+        mocker.patch('yafin.transport.lib', None)
+        pool = PoolConfig(max_host_connections=2)
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url, pool=pool) as client:
+                await client.get_chart('META', '1y', '1d')
+
+        assert 'MAX_HOST_CONNECTIONS' in caplog.text
+        assert 'keeping curl default' in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_connection_no_keep_alive(self) -> None:
+        """Test every request opens new connection without keep-alive."""
+        pool = PoolConfig(keep_alive=False)
+
+        async with FakeYahooServer(seed=0) as server:
+            async with AsyncClient(base_url=server.url, pool=pool) as client:
+                for _ in range(3):
+                    await client.get_chart('META', '1y', '1d')
+
+                stats = client.connection_stats
+
+            assert stats is not None
+            assert stats.new_connections == server.stats['connections'] == 3
+            assert stats.reuse_ratio == 0.0
+
+    @pytest.mark.asyncio
+    async def test_client_start(self) -> None:
+        """Test warm up opens connections and fetches crumb before requests."""
+        async with FakeYahooServer(latency=0.01, seed=0) as server:
+            async with AsyncClient(base_url=server.url, coalesce=False) as client:
+                await client.start(warm_connections=4)
+                assert client._used_crumb
+                assert server.stats['connections'] == 4
+                assert server.stats['GET'] == 1  # crumb fetched once
+                assert server.stats['HEAD'] == 3
+
+                await asyncio.gather(*(client.get_quote('META') for _ in range(4)))
+                stats = client.connection_stats
+
+            assert server.stats['connections'] == 4
+            assert server.stats['401'] == 0
+            assert stats is not None
+            assert stats.new_connections == 4
+            assert stats.reused_requests == 4
+
+    @pytest.mark.asyncio
+    async def test_client_start_invalid_args(self) -> None:
+        """Test start with invalid number of connections."""
+        with pytest.raises(ValueError):
+            await AsyncClient().start(warm_connections=-1)
+
+    def test_pool_invalid_args(self) -> None:
+        """Test pool cannot be combined with custom transport."""
+        with pytest.raises(ValueError):
+            AsyncClient(transport=CurlCffiTransport(), pool=PoolConfig())
+
+    @pytest.mark.asyncio
+    async def test_httpx_transport(self) -> None:
+        """Test httpx transport against the fake server."""
+        pytest.importorskip('httpx')
+        from yafin.httpx_transport import HttpxTransport
+
+        transport = HttpxTransport()
+
+        async with FakeYahooServer(seed=0) as server:
+            client = AsyncClient(base_url=server.url, transport=transport)
+            chart = await client.get_chart('META', '1y', '1d')
+            assert_chart_result(chart['chart']['result'][0], 'META')
+            await client.get_quote('META')
+
+            with pytest.raises(HTTPError):
+                await client.get_chart('XXXXXXXX', '1y', '1d')
+
+            await transport.close()
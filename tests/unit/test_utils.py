@@ -1,17 +1,27 @@
+import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pytest
 from curl_cffi.requests.exceptions import HTTPError
+from typeguard import TypeCheckError
 
 from tests.assertions import assert_contains_keys, assert_keys_are_not_none
 from yafin.const import TYPES
 from yafin.utils import (
     _get_func_name_and_args,
+    canonicalize_params,
     encode_url,
     error,
+    get_request_key,
     get_types_with_frequency,
+    join_csv,
+    log_args,
     process_chart_like_yfinance,
+    process_chart_like_yfinance_vectorised,
+    process_chart_to_arrays,
+    typechecked,
 )
 
 
@@ -38,6 +48,29 @@ class TestUnitUtils:
         compiled_url = encode_url(url, params)
         assert compiled_url == r'https://query2.finance.yahoo.com?ticker=META&region=US'
 
+    def test_join_csv(self) -> None:
+        """Test join_csv function."""
+        assert join_csv({'split', 'div', 'earn'}) == 'div,earn,split'
+        assert join_csv(['b', 'a', 'b']) == 'a,b'
+
+    def test_canonicalize_params(self) -> None:
+        """Test canonicalize_params function."""
+        params = canonicalize_params({'region': 'US', 'period1': 1, 'crumb': 'x'})
+        assert list(params.items()) == [
+            ('crumb', 'x'),
+            ('period1', '1'),
+            ('region', 'US'),
+        ]
+        assert canonicalize_params(None) == {}
+
+    def test_get_request_key(self) -> None:
+        """Test get_request_key function."""
+        url = r'https://query2.finance.yahoo.com'
+        key = get_request_key(url, {'region': 'US', 'crumb': 'x', 'lang': 'en-US'})
+        assert key == get_request_key(url, {'lang': 'en-US', 'region': 'US'})
+        assert key == f'{url}?lang=en-US&region=US'
+        assert get_request_key(url) == get_request_key(url, {'crumb': 'x'}) == url
+
     @pytest.mark.parametrize(
         'kwargs',
         [
@@ -83,6 +116,50 @@ class TestUnitUtils:
         assert func_name == 'print'
         assert args_copy == ('a', 'b', 'c')
 
+    @pytest.mark.asyncio
+    async def test_log_args_not_formatted(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test log_args does not format results unless debug is logged."""
+        formatted = []
+
+        class Result:
+            def __repr__(self) -> str:
+                formatted.append(1)
+                return 'Result()'
+
+        @log_args
+        async def func() -> Result:
+            return Result()
+
+        with caplog.at_level(logging.INFO, logger='yafin.utils'):
+            await func()
+
+        assert not formatted
+
+        with caplog.at_level(logging.DEBUG, logger='yafin.utils'):
+            await func()
+
+        assert formatted
+        assert 'func finished with result=Result().' in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_typechecked(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test typechecked checks types only if enabled by env variable."""
+
+        async def func(flag: bool) -> bool:
+            return flag
+
+        monkeypatch.delenv('YAFIN_TYPECHECK', raising=False)
+        assert typechecked(func) is func
+
+        monkeypatch.setenv('YAFIN_TYPECHECK', '1')
+        checked = typechecked(func)
+        assert await checked(True)
+
+        with pytest.raises(TypeCheckError):
+            await checked('xxx')
+
     def test_assert_contains_keys(self) -> None:
         """Test assert_contains_keys function."""
         assert_contains_keys({'a': 1, 'b': 2}, ['a', 'b'])
@@ -191,3 +268,49 @@ class TestUnitUtils:
             ),
         )
         assert simplifed_chart_df.equals(expected_df)
+
+    def test_process_chart_like_yfinance_vectorised(
+        self, chart_json_mock: dict[str, Any]
+    ) -> None:
+        """Test process_chart_like_yfinance_vectorised function."""
+        chart = chart_json_mock['chart']['result'][0]
+        chart_df = process_chart_like_yfinance_vectorised(chart)
+        expected_df = process_chart_like_yfinance(chart)
+        pd.testing.assert_frame_equal(chart_df, expected_df)
+
+    def test_process_chart_to_arrays(self) -> None:
+        """Test process_chart_to_arrays function."""
+        chart = {
+            'timestamp': [1759843800, 1759930200, 1760016600],
+            'events': {
+                'dividends': {
+                    '1760016600': {'amount': 0.525, 'date': 1760016600},
+                    '1760103000': {'amount': 0.525, 'date': 1760103000},
+                },
+                'splits': {
+                    '1759930200': {
+                        'date': 1759930200,
+                        'numerator': 4.0,
+                        'denominator': 1.0,
+                        'splitRatio': '4:1',
+                    },
+                },
+            },
+            'indicators': {
+                'quote': [
+                    {
+                        'open': [1.0, 2.0, 3.0],
+                        'close': [1.0, None, 3.0],
+                        'low': [1.0, 2.0, 3.0],
+                        'high': [1.0, 2.0, 3.0],
+                        'volume': [10, None, 30],
+                    }
+                ],
+            },
+        }
+        arrays = process_chart_to_arrays(chart)
+        assert arrays['timestamp'].dtype == np.int64
+        assert np.isnan(arrays['close'][1])
+        assert np.isnan(arrays['volume'][1])
+        assert arrays['dividends'].tolist() == [0.0, 0.0, 0.525]
+        assert arrays['splits'].tolist() == [0.0, 4.0, 0.0]
@@ -0,0 +1,53 @@
+from collections.abc import Callable
+
+import pytest
+
+from yafin.const import ALL_MODULES_CSV
+from yafin.utils import get_types_with_frequency
+from yafin.validation import (
+    _parse_csv,
+    validate_events,
+    validate_modules,
+    validate_types,
+)
+
+
+class TestUnitValidation:
+    """Unit tests for yafin.validation module."""
+
+    def test_validate_modules(self) -> None:
+        """Test modules are validated once and returned in canonical order."""
+        _parse_csv.cache_clear()
+        assert validate_modules('price, assetProfile') == 'assetProfile,price'
+        assert validate_modules(ALL_MODULES_CSV) == ALL_MODULES_CSV
+
+        for _ in range(3):
+            validate_modules(ALL_MODULES_CSV)
+
+        assert _parse_csv.cache_info().hits == 3
+
+    def test_validate_types(self) -> None:
+        """Test types with frequency are valid."""
+        types = get_types_with_frequency('annual', 'income_statement')
+        assert validate_types(types) == ','.join(sorted(types.split(',')))
+
+    def test_validate_events(self) -> None:
+        """Test events are optional."""
+        assert validate_events('split,div') == 'div,split'
+        assert validate_events(None) is None
+        assert validate_events('') is None
+
+    @pytest.mark.parametrize(
+        'func, value',
+        [
+            (validate_modules, 'price,xxx'),
+            (validate_modules, ''),
+            (validate_types, 'annualxxx'),
+            (validate_events, 'div,xxx'),
+        ],
+    )
+    def test_invalid_args(self, func: Callable[[str], str | None], value: str) -> None:
+        """Test invalid values raise ValueError every time."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match=r'xxx|Invalid'):
+                func(value)
@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from curl_cffi.requests import Response
@@ -9,6 +11,8 @@ def mock_200_response(mocker: MockerFixture, response_json: dict[str, Any]) -> N
     """Mock response with status code 200."""
     mock_response = mocker.Mock(spec=Response)
     mock_response.status_code = 200
+    mock_response.http_version = 0
+    mock_response.infos = {}
     mock_response.json.return_value = response_json
     mock_response.raise_for_status = mocker.Mock()
     mocker.patch(
@@ -21,6 +25,8 @@ def mock_404_response(mocker: MockerFixture, response_json: dict[str, Any]) -> N
     """Mock response with status code 404."""
     mock_response = mocker.Mock(spec=Response)
     mock_response.status_code = 404
+    mock_response.http_version = 0
+    mock_response.infos = {}
     mock_response.json.return_value = response_json
     mock_response.raise_for_status.side_effect = HTTPError(
         '404 Client Error: Not Found for url'
@@ -29,3 +35,13 @@ def mock_404_response(mocker: MockerFixture, response_json: dict[str, Any]) -> N
         'yafin.client.AsyncSession.get',
         new=mocker.AsyncMock(return_value=mock_response),
     )
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float = 1.0) -> None:
+    """Wait until the condition holds, checked on every event loop iteration."""
+
+    async def wait() -> None:
+        while not condition():
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(wait(), timeout)